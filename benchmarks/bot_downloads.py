@@ -0,0 +1,115 @@
+"""Delivery latency of completed audio to guild queues: previous blocking download vs concurrent downloads.
+
+Completion messages for several guilds are fed to TTSCog._handle_tts_response
+from a consumer thread, as pika does. A fake asynchronous MinIO client answers
+each download after a fixed latency, except one slow object for the first
+guild. The previous handler downloaded on the consumer thread, so every
+completion behind the slow one waited for it.
+
+Usage:
+    uv run python benchmarks/bot_downloads.py [--guilds 8] [--clips 5] [--latency 0.05] [--slow 1.0]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from pika.spec import BasicProperties
+from tts_bot.cogs.tts import TTSCog
+from tts_bot.playback import AudioClip
+from tts_bot.settings import BotSettings
+
+SLOW_OBJECT = "audio/slow.mp3"
+
+
+class FakeAsyncMinIOClient:
+    def __init__(self, latency: float, slow: float):
+        self.latency = latency
+        self.slow = slow
+
+    async def download_bytes(self, object_name: str) -> bytes:
+        await asyncio.sleep(self.slow if object_name == SLOW_OBJECT else self.latency)
+        return b"ID3"
+
+
+class BenchmarkCog(TTSCog):
+    """Records when each guild receives a clip instead of playing it."""
+
+    def __init__(self, bot: Any):
+        super().__init__(bot)
+        self.delivered: list[tuple[int, float]] = []
+
+    def _release_clip(self, guild_id: int, clip: AudioClip | None) -> None:
+        if clip is not None:
+            self.delivered.append((guild_id, time.perf_counter()))
+
+
+class PreviousCog(BenchmarkCog):
+    """The handler before downloads were moved to the event loop: download on the consumer thread."""
+
+    def _handle_tts_response(self, message: dict[str, Any] | bytes, properties: BasicProperties) -> None:
+        data = asyncio.run_coroutine_threadsafe(
+            self.minio.download_bytes(message["object_name"]), self.bot.loop
+        ).result()
+        clip = AudioClip(data, message["content_type"])
+        self.bot.loop.call_soon_threadsafe(self._receive_audio, int(message["guild_id"]), None, clip)
+
+
+async def run(cog_class: type[BenchmarkCog], args: argparse.Namespace) -> tuple[float, float, float]:
+    bot = SimpleNamespace(
+        loop=asyncio.get_running_loop(),
+        minio=FakeAsyncMinIOClient(args.latency, args.slow),
+        publisher=None,
+        consumer=None,
+        bot_settings=BotSettings(token="benchmark", download_concurrency=args.concurrency),
+    )
+    cog = cog_class(bot)
+    messages = []
+    for clip in range(args.clips):
+        for guild_id in range(1, args.guilds + 1):
+            object_name = SLOW_OBJECT if (guild_id, clip) == (1, 0) else f"audio/{guild_id}-{clip}.mp3"
+            messages.append({"guild_id": guild_id, "object_name": object_name, "content_type": "audio/mpeg"})
+
+    def consume() -> None:
+        for message in messages:
+            cog._handle_tts_response(message, BasicProperties(content_type="application/json"))
+
+    started = time.perf_counter()
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    while len(cog.delivered) < len(messages):
+        await asyncio.sleep(0.005)
+    consumer.join()
+
+    others = [at - started for guild_id, at in cog.delivered if guild_id != 1]
+    return statistics.mean(others), max(others), max(at for _, at in cog.delivered) - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--guilds", type=int, default=8)
+    parser.add_argument("--clips", type=int, default=5, help="completions per guild")
+    parser.add_argument("--latency", type=float, default=0.05, help="download latency in seconds")
+    parser.add_argument("--slow", type=float, default=1.0, help="latency of the first guild's slow download")
+    parser.add_argument("--concurrency", type=int, default=8, help="DISCORD_DOWNLOAD_CONCURRENCY")
+    args = parser.parse_args()
+
+    print(
+        f"{args.guilds} guilds x {args.clips} clips, download {args.latency * 1000:.0f} ms, "
+        f"one slow download {args.slow * 1000:.0f} ms"
+    )
+    print(f"{'pipeline':>10}  {'other guilds mean':>17}  {'max':>8}  {'all delivered':>13}")
+    # 플레이어/다운로드 로그는 표에 섞이지 않도록 숨김
+    logging.disable(logging.WARNING)
+    for name, cog_class in (("previous", PreviousCog), ("concurrent", BenchmarkCog)):
+        mean, worst, total = asyncio.run(run(cog_class, args))
+        print(f"{name:>10}  {mean * 1000:>14.0f} ms  {worst * 1000:>5.0f} ms  {total * 1000:>10.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
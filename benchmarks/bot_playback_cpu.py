@@ -0,0 +1,118 @@
+"""Bot-side playback CPU cost at N concurrent guilds, MP3 (FFmpeg + Opus encode) vs pre-encoded Ogg/Opus.
+
+Each guild is driven by a thread that does what discord.py's AudioPlayer does
+for every 20 ms frame: read() from the audio source and, for PCM sources,
+encode the frame to Opus. Nothing is sent over the network. Frames are read
+as fast as possible, and the CPU time of the process and its FFmpeg children
+is reported per second of audio played.
+
+Requires ffmpeg and libopus (as on the bot host).
+
+Usage:
+    uv run python benchmarks/bot_playback_cpu.py [--guilds 1 10 50] [--duration 5]
+"""
+
+import argparse
+import os
+import subprocess
+import threading
+
+import discord.opus
+from tts_bot.playback import AudioClip
+from tts_worker.opus import OpusEncoder
+
+FRAME_SECONDS = 0.02
+
+
+def make_mp3(duration: float) -> bytes:
+    """A Polly-like clip: 22.05 kHz mono MP3."""
+    return subprocess.run(
+        [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            f"sine=frequency=220:duration={duration}",
+            "-ar",
+            "22050",
+            "-ac",
+            "1",
+            "-b:a",
+            "48k",
+            "-f",
+            "mp3",
+            "pipe:1",
+        ],
+        capture_output=True,
+        check=True,
+    ).stdout
+
+
+def play(clip: AudioClip) -> int:
+    """Consume one clip the way the voice client does. Returns the number of frames."""
+    source = clip.create_source()
+    encoder = None if source.is_opus() else discord.opus.Encoder()
+    frames = 0
+    try:
+        while data := source.read():
+            if encoder is not None:
+                encoder.encode(data, encoder.SAMPLES_PER_FRAME)
+            frames += 1
+    finally:
+        source.cleanup()
+    return frames
+
+
+def cpu_seconds() -> float:
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def run(clip_data: bytes, content_type: str, guilds: int, clips: int) -> float:
+    """Returns CPU milliseconds per second of audio played."""
+    frames = [0] * guilds
+
+    def guild(index: int) -> None:
+        for _ in range(clips):
+            frames[index] += play(AudioClip(clip_data, content_type))
+
+    threads = [threading.Thread(target=guild, args=(i,)) for i in range(guilds)]
+    cpu_started = cpu_seconds()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cpu = cpu_seconds() - cpu_started
+
+    return cpu / (sum(frames) * FRAME_SECONDS) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--guilds", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--duration", type=float, default=5.0, help="clip length in seconds")
+    parser.add_argument("--clips", type=int, default=4, help="clips played per guild")
+    args = parser.parse_args()
+
+    if not discord.opus.is_loaded() and not discord.opus._load_default():
+        raise SystemExit("libopus not found")
+
+    mp3_data = make_mp3(args.duration)
+    opus_data = OpusEncoder().encode(mp3_data)
+    print(f"clip: {args.duration:.1f}s, mp3 {len(mp3_data) / 1024:.0f} KiB, ogg/opus {len(opus_data) / 1024:.0f} KiB")
+    print(f"{'guilds':>6}  {'format':>6}  {'CPU ms / audio s':>16}  {'cores at real time':>18}  {'ffmpeg spawns':>13}")
+
+    for guilds in args.guilds:
+        for name, data, content_type in (("mp3", mp3_data, "audio/mpeg"), ("opus", opus_data, "audio/ogg")):
+            cpu_ms = run(data, content_type, guilds, args.clips)
+            # 실시간 재생 시 N개 길드가 동시에 사용하는 CPU 코어 수
+            cores = cpu_ms / 1000 * guilds
+            spawns = guilds * args.clips if name == "mp3" else 0
+            print(f"{guilds:>6}  {name:>6}  {cpu_ms:>16.1f}  {cores:>18.2f}  {spawns:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Latency of quiet guilds while one guild floods the worker: FIFO thread pool vs FairScheduler.
+
+One guild publishes a burst of messages, then a few other guilds each send
+a short message. Jobs sleep in proportion to their text length like a
+Polly call would. With FIFO the quiet guilds wait behind the whole burst;
+the fair scheduler runs them on their next turn.
+
+Usage:
+    uv run python benchmarks/guild_fairness.py [--burst 200] [--guilds 5] [--concurrency 4]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from pika.spec import BasicProperties
+from tts_worker import TTSWorker
+from tts_worker.scheduler import FairScheduler
+
+SECONDS_PER_CHAR = 0.0005  # 짧은 메시지 약 50ms, 긴 메시지 약 150ms
+
+
+def run(executor: Executor, burst: int, guilds: int) -> dict[int, list[float]]:
+    """Submit the burst, then one message per quiet guild; return end-to-end latencies per guild."""
+    random.seed(1)
+    latencies: dict[int, list[float]] = {}
+    lock = threading.Lock()
+
+    # consumer와 같은 (properties, body) 인자로 제출 (FairScheduler가 여기서 길드를 읽음)
+    def deliver(properties: BasicProperties, body: bytes, enqueued: float) -> None:
+        message = json.loads(body)
+        time.sleep(0.04 + len(message["text"]) * SECONDS_PER_CHAR)
+        with lock:
+            latencies.setdefault(message["guild_id"], []).append(time.perf_counter() - enqueued)
+
+    bodies = [json.dumps({"text": "가" * random.randint(5, 200), "guild_id": 1}) for _ in range(burst)]
+    bodies += [json.dumps({"text": "안녕하세요", "guild_id": guild_id}) for guild_id in range(2, guilds + 2)]
+    futures = [executor.submit(deliver, BasicProperties(), body.encode(), time.perf_counter()) for body in bodies]
+    for future in futures:
+        future.result()
+    executor.shutdown()
+    return latencies
+
+
+def classify(properties: BasicProperties, body: bytes, enqueued: float) -> object:
+    return TTSWorker._classify_delivery(properties, body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--burst", type=int, default=200, help="messages from the busy guild")
+    parser.add_argument("--guilds", type=int, default=5, help="quiet guilds sending one message each")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{'executor':>14}  {'quiet guild mean':>16}  {'quiet guild max':>15}  {'busy guild total':>16}")
+    executors = (
+        ("FIFO", lambda: ThreadPoolExecutor(max_workers=args.concurrency)),
+        ("FairScheduler", lambda: FairScheduler(args.concurrency, classify=classify)),
+    )
+    for name, make_executor in executors:
+        latencies = run(make_executor(), args.burst, args.guilds)
+        quiet = [latency for guild_id, values in latencies.items() if guild_id != 1 for latency in values]
+        print(
+            f"{name:>14}  {statistics.mean(quiet) * 1000:>13.0f} ms  {max(quiet) * 1000:>12.0f} ms  "
+            f"{max(latencies[1]):>14.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Event-loop latency under a message flood: print(flush=True) vs queue-based logging.
+
+Each simulated message writes the lines the bot writes for it on the event
+loop (received, user settings, enqueued, finished playing). stdout is a pipe
+drained at a limited rate, as when a terminal or container log collector
+falls behind. A probe task sleeps 1 ms in a loop and records how late it
+wakes up. With print() the loop blocks once the pipe is full; with
+configure_logging() a log call only appends to a queue and the writer thread
+waits instead (records are dropped when the queue is full). "handled" is
+the number of messages the loop got through in the time given, "written" what
+reached the reader in the end (the writer thread catches up after the flood).
+
+Usage:
+    uv run python benchmarks/log_flood.py [--rate 2000] [--seconds 3] [--drain 262144]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+
+from telemetry import LogSettings, configure_logging, shutdown_logging
+
+PROBE_INTERVAL = 0.001
+TICK = 0.01
+
+cog_logger = logging.getLogger("tts_bot.cogs.tts")
+player_logger = logging.getLogger("tts_bot.playback.player")
+
+
+def handle_print(index: int) -> None:
+    # 이전 on_message / GuildPlayer의 메시지당 출력
+    guild_id = index % 50
+    print(f"[MESSAGE] Received message from user{index}#0001: '테스트 메시지 {index}'", flush=True)
+    print(f"[DEBUG] User settings: discord_id={index}, rate=100, pitch=0")
+    print(f"[AUDIO] Enqueued audio for guild {guild_id} (mp3, 5421 bytes), queued: 1", flush=True)
+    print(f"[AUDIO] Finished playing audio for guild {guild_id}", flush=True)
+
+
+def handle_logging(index: int) -> None:
+    fields = {"guild_id": index % 50, "message_id": index}
+    cog_logger.debug("Received message from user %s (%d chars)", index, len(f"테스트 메시지 {index}"), extra=fields)
+    cog_logger.debug("User settings: discord_id=%s, rate=%s, pitch=%s", index, 100, 0, extra=fields)
+    player_logger.debug("Enqueued audio (%s), queued: %d", "mp3, 5421 bytes", 1, extra=fields)
+    player_logger.debug("Finished playing audio", extra=fields)
+
+
+async def probe(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - started - PROBE_INTERVAL)
+
+
+async def flood(handle, rate: int, seconds: float) -> int:
+    per_tick = max(1, int(rate * TICK))
+    index = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(per_tick):
+            handle(index)
+            index += 1
+        await asyncio.sleep(TICK)
+    return index
+
+
+async def measure(handle, rate: int, seconds: float) -> tuple[int, list[float]]:
+    """Messages handled in seconds (fewer than rate * seconds if the loop was blocked) and probe lags."""
+    stop = asyncio.Event()
+    lags: list[float] = []
+    probe_task = asyncio.create_task(probe(stop, lags))
+    handled = await flood(handle, rate, seconds)
+    stop.set()
+    await probe_task
+    return handled, lags
+
+
+def drain(fd: int, rate: int, counter: list[int]) -> None:
+    # 초당 rate 바이트만 읽는 느린 로그 수집기
+    while True:
+        data = os.read(fd, 4096)
+        if not data:
+            break
+        counter[0] += len(data)
+        if rate:
+            time.sleep(len(data) / rate)
+    os.close(fd)
+
+
+def run(mode: str, args: argparse.Namespace) -> tuple[int, list[float], int, int]:
+    read_fd, write_fd = os.pipe()
+    drained = [0]
+    drainer = threading.Thread(target=drain, args=(read_fd, args.drain, drained))
+    drainer.start()
+    stdout = sys.stdout
+    sys.stdout = os.fdopen(write_fd, "w", encoding="utf-8")
+    dropped = 0
+    try:
+        if mode == "print":
+            handled, lags = asyncio.run(measure(handle_print, args.rate, args.seconds))
+        elif mode == "none":
+            handled, lags = asyncio.run(measure(lambda index: None, args.rate, args.seconds))
+        else:
+            level = "DEBUG" if mode == "logging (DEBUG)" else "INFO"
+            handler = configure_logging(LogSettings(level=level, queue_size=args.queue_size))
+            handled, lags = asyncio.run(measure(handle_logging, args.rate, args.seconds))
+            dropped = handler.dropped
+            shutdown_logging()
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    drainer.join()
+    return handled, lags, drained[0], dropped
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=int, default=2000, help="messages per second")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--drain", type=int, default=256 * 1024, help="stdout drain rate in bytes/s (0: unlimited)")
+    parser.add_argument("--queue-size", type=int, default=10000, help="LOG_QUEUE_SIZE")
+    args = parser.parse_args()
+
+    print(f"{args.rate} messages/s for {args.seconds:.0f}s, stdout drained at {args.drain // 1024} KiB/s")
+    print(
+        f"{'output':>16}  {'handled':>7}  {'loop lag p50':>12}  {'p99':>8}  {'max':>8}  {'written':>9}  {'dropped':>7}"
+    )
+    for mode in ("none", "print", "logging (INFO)", "logging (DEBUG)"):
+        handled, lags, written, dropped = run(mode, args)
+        p50 = statistics.median(lags)
+        p99 = statistics.quantiles(lags, n=100)[98]
+        print(
+            f"{mode:>16}  {handled:>7}  {p50 * 1000:>9.2f} ms  {p99 * 1000:>5.1f} ms  {max(lags) * 1000:>5.0f} ms  "
+            f"{written / 1024:>5.0f} KiB  {dropped:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Upload/download throughput of the MinIO clients against a local S3 stand-in (moto server).
+
+Compares the previous synchronous client (head_bucket before every upload,
+one request at a time), the synchronous client from a thread pool, and
+AsyncMinIOClient.upload_many/download_many.
+
+Usage:
+    uv run python benchmarks/minio_clients.py [--objects 300] [--size 32768] [--threads 16]
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from minio import AsyncMinIOClient, MinIOClient, MinIOSettings
+
+
+class PreviousMinIOClient(MinIOClient):
+    """The client before known buckets were remembered."""
+
+    def ensure_bucket(self, bucket_name: str | None = None) -> None:
+        self._known_buckets.clear()
+        super().ensure_bucket(bucket_name)
+
+
+def run_sync(client: MinIOClient, names: list[str], data: bytes, threads: int) -> tuple[float, float]:
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        started = time.perf_counter()
+        list(executor.map(lambda name: client.upload_bytes(name, data), names))
+        uploaded = time.perf_counter()
+        list(executor.map(client.download_bytes, names))
+        downloaded = time.perf_counter()
+    return uploaded - started, downloaded - uploaded
+
+
+async def run_async(settings: MinIOSettings, names: list[str], data: bytes) -> tuple[float, float]:
+    async with AsyncMinIOClient(settings) as client:
+        await client.ensure_bucket()  # 연결 생성은 측정에서 제외
+        started = time.perf_counter()
+        await client.upload_many((name, data) for name in names)
+        uploaded = time.perf_counter()
+        await client.download_many(names)
+        downloaded = time.perf_counter()
+    return uploaded - started, downloaded - uploaded
+
+
+def start_moto_server(port: int) -> subprocess.Popen:
+    # 클라이언트와 GIL을 나누지 않도록 별도 프로세스에서 실행
+    process = subprocess.Popen(
+        [sys.executable, "-m", "moto.server", "-p", str(port)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/moto-api/")
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("moto server did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=300)
+    parser.add_argument("--size", type=int, default=32 * 1024, help="object size in bytes")
+    parser.add_argument("--threads", type=int, default=16, help="threads for the pooled synchronous client")
+    parser.add_argument("--port", type=int, default=5077)
+    args = parser.parse_args()
+
+    server = start_moto_server(args.port)
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    settings = MinIOSettings(endpoint_url=f"http://127.0.0.1:{args.port}", access_key="test", secret_key="test")
+    data = os.urandom(args.size)
+
+    print(f"{args.objects} objects of {args.size // 1024} KiB, moto server on port {args.port}")
+    print(f"{'client':>22}  {'upload obj/s':>12}  {'download obj/s':>14}")
+    runs = (
+        ("previous sync", lambda names: run_sync(PreviousMinIOClient(settings), names, data, 1)),
+        ("sync", lambda names: run_sync(MinIOClient(settings), names, data, 1)),
+        (f"sync, {args.threads} threads", lambda names: run_sync(MinIOClient(settings), names, data, args.threads)),
+        ("async *_many", lambda names: asyncio.run(run_async(settings, names, data))),
+    )
+    try:
+        for name, run in runs:
+            names = [f"bench/{name.replace(' ', '_')}/{i}" for i in range(args.objects)]
+            upload_seconds, download_seconds = run(names)
+            print(f"{name:>22}  {args.objects / upload_seconds:>12.0f}  {args.objects / download_seconds:>14.0f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Silence between consecutive utterances: previous player loop vs GuildPlayer with prefetch.
+
+A fake voice client paces frames every 20 ms like discord.py's AudioPlayer
+and records when each clip's first and last frames are sent. Audio sources
+are faked with a fixed start-up delay (spawning FFmpeg and decoding the first
+frame), which is what the previous player paid between every two clips.
+
+Usage:
+    uv run python benchmarks/playback_gap.py [--clips 10] [--startup 0.08]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import threading
+import time
+
+import discord
+from tts_bot.playback import AudioClip, GuildPlayer
+
+FRAME_SECONDS = 0.02
+
+
+class FakeSource(discord.AudioSource):
+    def __init__(self, clip_id: int, frames: int, startup: float):
+        time.sleep(startup)  # FFmpeg 프로세스 생성 및 첫 프레임 디코딩
+        self.clip_id = clip_id
+        self.remaining = frames
+
+    def read(self) -> bytes:
+        if not self.remaining:
+            return b""
+        self.remaining -= 1
+        return self.clip_id.to_bytes(4, "big")
+
+
+class FakeClip(AudioClip):
+    def __init__(self, clip_id: int, frames: int, startup: float):
+        super().__init__(b"")
+        self.clip_id = clip_id
+        self.frames = frames
+        self.startup = startup
+
+    def create_source(self) -> discord.AudioSource:
+        return FakeSource(self.clip_id, self.frames, self.startup)
+
+
+class FakeVoiceClient:
+    """Sends frames on a 20 ms clock and records (time, clip id) for each one."""
+
+    def __init__(self):
+        self.sent: list[tuple[float, int]] = []
+        self._playing = False
+
+    def is_connected(self) -> bool:
+        return True
+
+    def is_playing(self) -> bool:
+        return self._playing
+
+    def play(self, source: discord.AudioSource, after) -> None:
+        self._playing = True
+
+        def run() -> None:
+            started, loops = time.perf_counter(), 0
+            while data := source.read():
+                self.sent.append((time.perf_counter(), int.from_bytes(data, "big")))
+                loops += 1
+                time.sleep(max(0.0, started + FRAME_SECONDS * loops - time.perf_counter()))
+            source.cleanup()
+            self._playing = False
+            after(None)
+
+        threading.Thread(target=run, daemon=True).start()
+
+
+async def legacy_player(voice_client: FakeVoiceClient, clips: list[FakeClip]) -> None:
+    """The previous TTSCog._player_loop/_play_audio: build each source only when its turn comes."""
+    queue: asyncio.Queue[FakeClip] = asyncio.Queue()
+    for clip in clips:
+        queue.put_nowait(clip)
+
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            clip = await asyncio.wait_for(queue.get(), timeout=0.1)
+        except asyncio.TimeoutError:
+            break
+        finished = asyncio.Event()
+        source = clip.create_source()
+        voice_client.play(source, after=lambda error: loop.call_soon_threadsafe(finished.set))
+        await finished.wait()
+
+
+async def guild_player(voice_client: FakeVoiceClient, clips: list[FakeClip]) -> None:
+    player = GuildPlayer(1, lambda: voice_client)
+    for clip in clips:
+        player.enqueue(clip)
+    while player.is_busy:
+        await asyncio.sleep(0.05)
+    player.close()
+
+
+def gaps(sent: list[tuple[float, int]]) -> list[float]:
+    """Extra silence between the last frame of one clip and the first frame of the next."""
+    result = []
+    for (previous_time, previous_clip), (current_time, current_clip) in zip(sent, sent[1:]):
+        if current_clip != previous_clip:
+            result.append(max(0.0, current_time - previous_time - FRAME_SECONDS))
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clips", type=int, default=10)
+    parser.add_argument("--frames", type=int, default=25, help="frames (20 ms) per clip")
+    parser.add_argument("--startup", type=float, default=0.08, help="source start-up time in seconds")
+    args = parser.parse_args()
+
+    print(f"{args.clips} clips of {args.frames * FRAME_SECONDS:.2f}s, source start-up {args.startup * 1000:.0f} ms")
+    print(f"{'player':>12}  {'mean gap':>9}  {'max gap':>8}")
+    # 플레이어의 재생 로그는 표에 섞이지 않도록 숨김
+    logging.disable(logging.WARNING)
+    for name, player in (("previous", legacy_player), ("GuildPlayer", guild_player)):
+        voice_client = FakeVoiceClient()
+        clips = [FakeClip(i, args.frames, args.startup) for i in range(args.clips)]
+        asyncio.run(player(voice_client, clips))
+        measured = gaps(voice_client.sent)
+        print(f"{name:>12}  {statistics.mean(measured) * 1000:>6.1f} ms  {max(measured) * 1000:>5.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Sustained Polly throughput with and without the client-side limiter, against a fake throttling Polly.
+
+The fake service answers in --latency seconds and throws ThrottlingException
+when more than --capacity calls are in flight. Without the limiter every
+worker thread retries immediately, like a nack and requeue. With the
+limiter the AIMD concurrency limit settles below the capacity.
+
+Usage:
+    uv run python benchmarks/polly_limiter.py [--threads 16] [--capacity 6] [--requests 200]
+"""
+
+import argparse
+import io
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+from tts_worker import PollyClient, PollySettings
+
+
+class FakePollyService:
+    def __init__(self, latency: float, capacity: int):
+        self.latency = latency
+        self.capacity = capacity
+        self.in_flight = 0
+        self.calls = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def synthesize_speech(self, **kwargs) -> dict:
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            overloaded = self.in_flight > self.capacity
+            if overloaded:
+                self.throttled += 1
+        try:
+            if overloaded:
+                raise ClientError({"Error": {"Code": "ThrottlingException"}}, "SynthesizeSpeech")
+            time.sleep(self.latency)
+            return {"AudioStream": StreamingBody(io.BytesIO(b"\xff\xfb"), 2), "ResponseMetadata": {"RetryAttempts": 0}}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def unlimited(polly: PollyClient) -> None:
+    # 이전 동작: 스로틀링되면 곧바로 다시 요청 (nack 후 즉시 재전달)
+    while True:
+        try:
+            polly._synthesize_speech("안녕하세요", None, 100, 0)["AudioStream"].read()
+            return
+        except ClientError:
+            continue
+
+
+def limited(polly: PollyClient) -> None:
+    polly.synthesize("안녕하세요")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--capacity", type=int, default=6, help="in-flight calls before the service throttles")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--tps", type=float, default=200.0)
+    args = parser.parse_args()
+
+    print(f"{'client':>10}  {'req/s':>7}  {'calls':>6}  {'throttled':>9}  {'final limit':>11}")
+    # limiter의 재시도 로그는 표에 섞이지 않도록 숨김
+    logging.disable(logging.WARNING)
+    for name, call in (("unlimited", unlimited), ("limiter", limited)):
+        polly = PollyClient(
+            PollySettings(access_key_id="x", secret_access_key="x", max_tps=args.tps, max_concurrency=args.threads)
+        )
+        service = polly._client = FakePollyService(args.latency, args.capacity)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(args.threads) as executor:
+            list(executor.map(lambda _: call(polly), range(args.requests)))
+        elapsed = time.perf_counter() - started
+        limit = polly.limiter.limit if call is limited else "-"
+        print(f"{name:>10}  {args.requests / elapsed:>7.1f}  {service.calls:>6}  {service.throttled:>9}  {limit:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Bot memory held by queued and playing audio: downloaded clips vs presigned URLs read at playback.
+
+Each guild has a queue of clips waiting and plays its first one. In download
+mode every queued clip is a bytes object in the bot, and the playing one is
+read through a BytesIO copy as before. In presigned_url mode a queued clip is
+only a URL, and the playing one is read from the object store through
+HTTPRangeReader with a 64 KiB buffer (the Opus path). Python allocations are
+traced with tracemalloc against a local S3 stand-in (moto server).
+
+Usage:
+    uv run python benchmarks/remote_playback.py [--guilds 20] [--queued 5] [--size 262144]
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import threading
+import tracemalloc
+
+from minio import AsyncMinIOClient, MinIOSettings
+from minio_clients import start_moto_server
+from tts_bot.playback import AudioClip, HTTPRangeReader, RemoteAudio
+
+READ_SIZE = 4096
+
+
+def open_stream(clip: AudioClip) -> io.BufferedIOBase:
+    # AudioClip.create_source()가 Opus 음성에 대해 여는 stream과 같음
+    if clip.remote:
+        return io.BufferedReader(HTTPRangeReader(clip.data.url), buffer_size=64 * 1024)
+    return io.BytesIO(clip.data)
+
+
+def play(clip: AudioClip) -> None:
+    stream = open_stream(clip)
+    while stream.read(READ_SIZE):
+        pass
+    stream.close()
+
+
+async def queue_clips(settings: MinIOSettings, mode: str, names: list[str]) -> list[AudioClip]:
+    async with AsyncMinIOClient(settings) as client:
+        await client.ensure_bucket()
+        # botocore가 서비스 모델을 읽어 들이는 메모리는 측정에서 제외
+        tracemalloc.start()
+        if mode == "presigned_url":
+            return [AudioClip(RemoteAudio(await client.presigned_url(name))) for name in names]
+        return [AudioClip(data) for data in await client.download_many(names)]
+
+
+def run(settings: MinIOSettings, mode: str, guilds: int, queued: int, names: list[str]) -> int:
+    clips = asyncio.run(queue_clips(settings, mode, names))
+    # 길드마다 첫 음성을 동시에 재생, 나머지는 대기열에 남아 있음
+    threads = [threading.Thread(target=play, args=(clips[guild * queued],)) for guild in range(guilds)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+async def upload(settings: MinIOSettings, names: list[str], data: bytes) -> None:
+    async with AsyncMinIOClient(settings) as client:
+        await client.upload_many(((name, data) for name in names), content_type="audio/ogg")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--guilds", type=int, default=20)
+    parser.add_argument("--queued", type=int, default=5, help="clips queued per guild")
+    parser.add_argument("--size", type=int, default=256 * 1024, help="clip size in bytes")
+    parser.add_argument("--port", type=int, default=5078)
+    args = parser.parse_args()
+
+    server = start_moto_server(args.port)
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    settings = MinIOSettings(endpoint_url=f"http://127.0.0.1:{args.port}", access_key="test", secret_key="test")
+    names = [f"audio/{i}.ogg" for i in range(args.guilds * args.queued)]
+    try:
+        asyncio.run(upload(settings, names, os.urandom(args.size)))
+        print(f"{args.guilds} guilds x {args.queued} queued clips of {args.size // 1024} KiB")
+        print(f"{'audio_source':>14}  {'peak Python memory':>18}")
+        for mode in ("download", "presigned_url"):
+            peak = run(settings, mode, args.guilds, args.queued, names)
+            print(f"{mode:>14}  {peak / 1024 / 1024:>14.1f} MiB")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
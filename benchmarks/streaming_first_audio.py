@@ -0,0 +1,156 @@
+"""Time-to-first-audio against message length, buffered vs streamed synthesis.
+
+Polly, MinIO and the broker are faked with fixed latencies and bandwidths; the
+worker code path and the bot's StreamingBuffer are the real ones. "First audio"
+is the moment the bot has the first bytes it can hand to FFmpeg.
+
+Usage:
+    uv run python benchmarks/streaming_first_audio.py [--polly-latency 0.15] [--polly-rate 262144]
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import Future
+
+from tts_bot.playback import StreamingBuffer
+from tts_worker import TTSWorker, WorkerSettings
+from tts_worker.synthesizers import Synthesizer
+
+BYTES_PER_CHAR = 1000  # mp3 48kbps, 한국어 초당 약 6자 기준
+
+
+class FakePolly(Synthesizer):
+    name = "polly"
+    voice_id = "Seoyeon"
+
+    def __init__(self, latency: float, rate: float):
+        self.latency = latency
+        self.rate = rate
+
+    def synthesize(self, text: str, voice_id: str | None = None, rate: int = 100, pitch: int = 0) -> bytes:
+        size = len(text) * BYTES_PER_CHAR
+        time.sleep(self.latency + size / self.rate)
+        return bytes(size)
+
+    def synthesize_stream(
+        self, text: str, voice_id: str | None = None, rate: int = 100, pitch: int = 0, chunk_size: int = 4096
+    ):
+        remaining = len(text) * BYTES_PER_CHAR
+        time.sleep(self.latency)
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            time.sleep(size / self.rate)
+            remaining -= size
+            yield bytes(size)
+
+
+class FakeMinIO:
+    def __init__(self, latency: float, bandwidth: float):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.objects: dict[str, bytes] = {}
+
+    def object_exists(self, object_name: str, bucket_name: str | None = None) -> bool:
+        return False
+
+    def upload_bytes(
+        self, object_name: str, data: bytes, content_type: str = "", bucket_name: str | None = None
+    ) -> str:
+        time.sleep(self.latency + len(data) / self.bandwidth)
+        self.objects[object_name] = data
+        return object_name
+
+    def download_bytes(self, object_name: str, bucket_name: str | None = None) -> bytes:
+        data = self.objects[object_name]
+        time.sleep(self.latency + len(data) / self.bandwidth)
+        return data
+
+
+class FakeBot:
+    """Receives the worker's completion messages the way the bot's consumer does."""
+
+    def __init__(self, minio: FakeMinIO):
+        self.minio = minio
+        self.first_audio = threading.Event()
+        self.first_audio_at = 0.0
+        self._streams: dict[str, StreamingBuffer] = {}
+        self._readers: list[threading.Thread] = []
+
+    def _got_audio(self) -> None:
+        if not self.first_audio.is_set():
+            self.first_audio_at = time.perf_counter()
+            self.first_audio.set()
+
+    def _play(self, buffer: StreamingBuffer) -> None:
+        # FFmpegPCMAudio의 pipe writer처럼 블록 단위로 읽음
+        while buffer.read(8192):
+            self._got_audio()
+
+    def publish_nowait(self, exchange_name: str, routing_key: str, message, headers=None, **kwargs) -> Future:
+        if isinstance(message, bytes) and headers and "stream_id" in headers:
+            if headers.get("end"):
+                self._streams.pop(headers["stream_id"]).end(headers["chunks"])
+            else:
+                self._streams[headers["stream_id"]].add_chunk(headers["chunk"], message)
+        elif isinstance(message, bytes):
+            self._got_audio()
+        elif "stream_id" in message:
+            buffer = self._streams[message["stream_id"]] = StreamingBuffer()
+            reader = threading.Thread(target=self._play, args=(buffer,))
+            reader.start()
+            self._readers.append(reader)
+        else:
+            self.minio.download_bytes(message["object_name"])
+            self._got_audio()
+
+        future = Future()
+        future.set_result(None)
+        return future
+
+    def close(self) -> None:
+        for reader in self._readers:
+            reader.join()
+
+
+def run(chars: int, stream: bool, args: argparse.Namespace) -> tuple[float, float]:
+    minio = FakeMinIO(args.minio_latency, args.minio_bandwidth)
+    bot = FakeBot(minio)
+    worker = TTSWorker(
+        worker_settings=WorkerSettings(
+            cache_max_entries=0, stats_interval=3600, stream_min_chars=1 if stream else 0, output_format="mp3"
+        ),
+        polly=FakePolly(args.polly_latency, args.polly_rate),
+        minio=minio,
+        publisher=bot,
+    )
+
+    started = time.perf_counter()
+    worker._handle_message({"text": "가" * chars, "guild_id": 1})
+    finished = time.perf_counter()
+    bot.close()
+    worker.executor.shutdown()
+    return bot.first_audio_at - started, finished - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polly-latency", type=float, default=0.15, help="seconds until Polly's first byte")
+    parser.add_argument("--polly-rate", type=float, default=256 * 1024, help="Polly output rate in bytes/s")
+    parser.add_argument("--minio-latency", type=float, default=0.01, help="per-request MinIO latency in seconds")
+    parser.add_argument("--minio-bandwidth", type=float, default=10 * 1024 * 1024, help="MinIO bytes/s")
+    parser.add_argument("--chars", type=int, nargs="+", default=[20, 100, 300, 1000])
+    args = parser.parse_args()
+
+    print(f"{'chars':>6}  {'audio KiB':>9}  {'buffered TTFA':>13}  {'streamed TTFA':>13}  {'streamed total':>14}")
+    for chars in args.chars:
+        buffered, _ = run(chars, stream=False, args=args)
+        streamed, total = run(chars, stream=True, args=args)
+        print(
+            f"{chars:>6}  {chars * BYTES_PER_CHAR / 1024:>9.0f}  "
+            f"{buffered * 1000:>10.0f} ms  {streamed * 1000:>10.0f} ms  {total * 1000:>11.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Text normalization speed and output size: TextNormalizer vs the previous regex chain.
+
+The corpus is generated from typical Korean chat patterns (short replies,
+laughter runs, links, mentions, custom emoji, code blocks).
+
+Usage:
+    uv run python benchmarks/text_normalizer.py [--messages 20000]
+"""
+
+import argparse
+import random
+import re
+import time
+
+from tts_bot.normalize import TextNormalizer
+
+WORDS = [
+    "안녕하세요",
+    "오늘",
+    "게임",
+    "한판",
+    "할래",
+    "진짜",
+    "대박",
+    "아니",
+    "근데",
+    "그거",
+    "어제",
+    "봤어",
+    "저녁",
+    "뭐",
+    "먹지",
+    "배고프다",
+    "ㅇㅇ",
+    "ㄴㄴ",
+    "gg",
+    "lol",
+    "nice",
+]
+DECORATIONS = [
+    lambda: "ㅋ" * random.randint(2, 30),
+    lambda: "ㅠ" * random.randint(2, 10),
+    lambda: "https://www.youtube.com/watch?v=" + "".join(random.choices("abcdefXYZ0123", k=11)),
+    lambda: f"<@{random.randint(10**17, 10**18)}>",
+    lambda: f"<:pepe_{random.randint(1, 9)}:{random.randint(10**17, 10**18)}>",
+    lambda: "😂" * random.randint(1, 3),
+    lambda: "!!" if random.random() < 0.5 else "??",
+    lambda: "```py\nfor i in range(10):\n    print(i)\n```",
+]
+
+
+def make_corpus(count: int, seed: int = 1) -> list[str]:
+    random.seed(seed)
+    corpus = []
+    for _ in range(count):
+        parts = random.choices(WORDS, k=random.randint(1, 12))
+        for _ in range(random.choices([0, 1, 2, 3], weights=[4, 4, 2, 1])[0]):
+            parts.insert(random.randint(0, len(parts)), random.choice(DECORATIONS)())
+        corpus.append(" ".join(parts))
+    return corpus
+
+
+def regex_chain(text: str) -> str:
+    """The filters on_message used to apply."""
+    text = re.sub(r"https?://\S+", "", text)
+    text = re.sub(r"<[^>]*>", "", text)
+    text = re.sub(r"[^\w\s]|_", "", text)
+    return text.strip()
+
+
+def measure(normalize, corpus: list[str], repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        outputs = [normalize(text) for text in corpus]
+        best = min(best, time.perf_counter() - started)
+    return best / len(corpus) * 1e6, sum(len(text) for text in outputs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.messages)
+    input_chars = sum(len(text) for text in corpus)
+    print(f"corpus: {len(corpus)} messages, {input_chars} characters")
+    print(f"{'implementation':>16}  {'us/message':>10}  {'chars to Polly':>14}")
+    for name, normalize in (("regex chain", regex_chain), ("TextNormalizer", TextNormalizer().normalize)):
+        per_message, output_chars = measure(normalize, corpus, args.repeat)
+        print(f"{name:>16}  {per_message:>10.2f}  {output_chars:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Worker throughput (messages/sec) against concurrency, with a fake Polly at fixed latency.
+
+Usage:
+    uv run python benchmarks/worker_concurrency.py [--latency 0.2] [--messages 200]
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import Future
+
+from pika.spec import BasicProperties
+from tts_worker import TTSWorker, WorkerSettings
+from tts_worker.synthesizers import Synthesizer
+
+
+class FakePolly(Synthesizer):
+    name = "polly"
+    voice_id = "Seoyeon"
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def synthesize(self, text: str, voice_id: str | None = None, rate: int = 100, pitch: int = 0) -> bytes:
+        time.sleep(self.latency)
+        return b"\xff\xfb" + text.encode()
+
+
+class FakeMinIO:
+    def object_exists(self, object_name: str, bucket_name: str | None = None) -> bool:
+        return False
+
+    def upload_bytes(
+        self, object_name: str, data: bytes, content_type: str = "", bucket_name: str | None = None
+    ) -> str:
+        return object_name
+
+
+class FakePublisher:
+    def publish_nowait(self, *args, **kwargs) -> Future:
+        future = Future()
+        future.set_result(None)
+        return future
+
+    def close(self) -> None:
+        pass
+
+
+def run(concurrency: int, latency: float, messages: int) -> float:
+    worker = TTSWorker(
+        worker_settings=WorkerSettings(
+            concurrency=concurrency, cache_max_entries=0, stats_interval=3600, output_format="mp3"
+        ),
+        polly=FakePolly(latency),
+        minio=FakeMinIO(),
+        publisher=FakePublisher(),
+    )
+    # broker의 prefetch_count처럼 동시에 전달되는 메시지 수를 제한
+    prefetch = threading.BoundedSemaphore(concurrency)
+
+    def deliver(properties: BasicProperties, body: bytes) -> None:
+        worker._handle_message(json.loads(body), properties)
+
+    started = time.perf_counter()
+    futures = []
+    for i in range(messages):
+        prefetch.acquire()
+        body = json.dumps({"text": f"message {i}", "guild_id": 1}).encode()
+        future = worker.executor.submit(deliver, BasicProperties(), body)
+        future.add_done_callback(lambda _future: prefetch.release())
+        futures.append(future)
+    for future in futures:
+        future.result()
+    elapsed = time.perf_counter() - started
+
+    worker.executor.shutdown()
+    return messages / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.2, help="fake Polly latency in seconds")
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    args = parser.parse_args()
+
+    print(f"fake Polly latency: {args.latency * 1000:.0f} ms, messages per run: {args.messages}")
+    print(f"{'concurrency':>11}  {'msg/s':>8}  {'speedup':>7}")
+    baseline = None
+    for concurrency in args.concurrency:
+        rate = run(concurrency, args.latency, args.messages)
+        baseline = baseline or rate
+        print(f"{concurrency:>11}  {rate:>8.1f}  {rate / baseline:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 from .settings import MinIOSettings
 from .client import MinIOClient, get_minio_client
+from .async_client import AsyncMinIOClient
 
 __all__ = [
     "MinIOSettings",
     "MinIOClient",
     "get_minio_client",
+    "AsyncMinIOClient",
 ]
@@ -0,0 +1,171 @@
+import asyncio
+from collections.abc import Iterable
+from contextlib import AsyncExitStack
+from typing import Any
+
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+from botocore.exceptions import ClientError
+
+from .settings import MinIOSettings
+
+
+class AsyncMinIOClient:
+    """MinIOClient for asyncio code, built on aiobotocore.
+
+    Requests never block the event loop and share one pooled HTTP session
+    (max_pool_connections connections, kept alive for keepalive_timeout
+    seconds between requests). Buckets are checked once and remembered, so
+    uploads are a single PUT. upload_many()/download_many() run a batch of
+    transfers concurrently, bounded by the pool size.
+
+    The underlying client is created on first use; call close() (or use
+    ``async with``) when done.
+    """
+
+    def __init__(self, settings: MinIOSettings | None = None):
+        self.settings = settings or MinIOSettings()
+        self._session = get_session()
+        self._exit_stack = AsyncExitStack()
+        self._client = None
+        self._client_lock = asyncio.Lock()
+        self._known_buckets: set[str] = set()
+
+    async def __aenter__(self) -> "AsyncMinIOClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _get_client(self) -> Any:
+        async with self._client_lock:
+            if self._client is None:
+                config = AioConfig(
+                    max_pool_connections=self.settings.max_pool_connections,
+                    tcp_keepalive=self.settings.tcp_keepalive,
+                    connector_args={"keepalive_timeout": self.settings.keepalive_timeout},
+                )
+                self._client = await self._exit_stack.enter_async_context(
+                    self._session.create_client(
+                        "s3",
+                        endpoint_url=self.settings.endpoint_url,
+                        aws_access_key_id=self.settings.access_key,
+                        aws_secret_access_key=self.settings.secret_key,
+                        config=config,
+                    )
+                )
+            return self._client
+
+    async def ensure_bucket(self, bucket_name: str | None = None) -> None:
+        bucket = bucket_name or self.settings.bucket_name
+        if bucket in self._known_buckets:
+            return
+        client = await self._get_client()
+        try:
+            await client.head_bucket(Bucket=bucket)
+        except ClientError:
+            await client.create_bucket(Bucket=bucket)
+        self._known_buckets.add(bucket)
+
+    async def object_exists(
+        self,
+        object_name: str,
+        bucket_name: str | None = None,
+    ) -> bool:
+        bucket = bucket_name or self.settings.bucket_name
+        client = await self._get_client()
+        try:
+            await client.head_object(Bucket=bucket, Key=object_name)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NoSuchBucket"):
+                return False
+            raise
+        return True
+
+    async def upload_bytes(
+        self,
+        object_name: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+        bucket_name: str | None = None,
+    ) -> str:
+        bucket = bucket_name or self.settings.bucket_name
+        await self.ensure_bucket(bucket)
+        client = await self._get_client()
+        try:
+            await client.put_object(Bucket=bucket, Key=object_name, Body=data, ContentType=content_type)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchBucket":
+                raise
+            # 확인한 뒤에 bucket이 삭제된 경우 다시 만들고 한 번 더 시도
+            self._known_buckets.discard(bucket)
+            await self.ensure_bucket(bucket)
+            await client.put_object(Bucket=bucket, Key=object_name, Body=data, ContentType=content_type)
+        return object_name
+
+    async def download_bytes(
+        self,
+        object_name: str,
+        bucket_name: str | None = None,
+    ) -> bytes:
+        bucket = bucket_name or self.settings.bucket_name
+        client = await self._get_client()
+        response = await client.get_object(Bucket=bucket, Key=object_name)
+        async with response["Body"] as body:
+            return await body.read()
+
+    async def presigned_url(
+        self,
+        object_name: str,
+        expires_in: int = 300,
+        bucket_name: str | None = None,
+    ) -> str:
+        """Signed GET URL for the object, valid for expires_in seconds (signed locally, supports Range)."""
+        bucket = bucket_name or self.settings.bucket_name
+        client = await self._get_client()
+        return await client.generate_presigned_url(
+            "get_object", Params={"Bucket": bucket, "Key": object_name}, ExpiresIn=expires_in
+        )
+
+    async def delete_object(
+        self,
+        object_name: str,
+        bucket_name: str | None = None,
+    ) -> None:
+        bucket = bucket_name or self.settings.bucket_name
+        client = await self._get_client()
+        await client.delete_object(Bucket=bucket, Key=object_name)
+
+    async def upload_many(
+        self,
+        objects: Iterable[tuple[str, bytes]],
+        content_type: str = "application/octet-stream",
+        bucket_name: str | None = None,
+    ) -> list[str]:
+        """Upload (object_name, data) pairs concurrently. Returns the object names in input order."""
+        bucket = bucket_name or self.settings.bucket_name
+        await self.ensure_bucket(bucket)
+        return await self._gather(self.upload_bytes(name, data, content_type, bucket) for name, data in objects)
+
+    async def download_many(
+        self,
+        object_names: Iterable[str],
+        bucket_name: str | None = None,
+    ) -> list[bytes]:
+        """Download objects concurrently. Returns their contents in input order."""
+        return await self._gather(self.download_bytes(name, bucket_name) for name in object_names)
+
+    async def _gather(self, coroutines: Iterable) -> list:
+        # 연결 풀보다 많은 요청을 한꺼번에 보내면 풀을 기다리며 타임아웃될 수 있으므로 풀 크기로 제한
+        semaphore = asyncio.Semaphore(self.settings.max_pool_connections)
+
+        async def bounded(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return list(await asyncio.gather(*(bounded(coroutine) for coroutine in coroutines)))
+
+    async def close(self) -> None:
+        async with self._client_lock:
+            await self._exit_stack.aclose()
+            self._client = None
@@ -1,10 +1,17 @@
+from collections.abc import Iterable, Iterator
+from typing import Any
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from .settings import MinIOSettings
 
 
 class MinIOClient:
+    # DeleteObjects 요청 하나에 담을 수 있는 최대 key 수
+    DELETE_BATCH_SIZE = 1000
+
     def __init__(self, settings: MinIOSettings | None = None):
         self.settings = settings or MinIOSettings()
         self._client = boto3.client(
@@ -12,14 +19,60 @@ class MinIOClient:
             endpoint_url=self.settings.endpoint_url,
             aws_access_key_id=self.settings.access_key,
             aws_secret_access_key=self.settings.secret_key,
+            config=Config(
+                max_pool_connections=self.settings.max_pool_connections,
+                tcp_keepalive=self.settings.tcp_keepalive,
+            ),
         )
+        # 이미 확인한 bucket은 업로드마다 head_bucket을 다시 보내지 않음
+        self._known_buckets: set[str] = set()
 
     def ensure_bucket(self, bucket_name: str | None = None) -> None:
         bucket = bucket_name or self.settings.bucket_name
+        if bucket in self._known_buckets:
+            return
         try:
             self._client.head_bucket(Bucket=bucket)
         except ClientError:
             self._client.create_bucket(Bucket=bucket)
+        self._known_buckets.add(bucket)
+
+    def object_exists(
+        self,
+        object_name: str,
+        bucket_name: str | None = None,
+    ) -> bool:
+        return self.head_object(object_name, bucket_name) is not None
+
+    def head_object(
+        self,
+        object_name: str,
+        bucket_name: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the object's metadata (LastModified, ContentLength, ContentType, ...) or None if it is missing."""
+        bucket = bucket_name or self.settings.bucket_name
+        try:
+            return self._client.head_object(Bucket=bucket, Key=object_name)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NoSuchBucket"):
+                return None
+            raise
+
+    def touch_object(
+        self,
+        object_name: str,
+        content_type: str = "application/octet-stream",
+        bucket_name: str | None = None,
+    ) -> None:
+        """Reset the object's LastModified by copying it onto itself (the data is not transferred)."""
+        bucket = bucket_name or self.settings.bucket_name
+        self._client.copy_object(
+            Bucket=bucket,
+            Key=object_name,
+            CopySource={"Bucket": bucket, "Key": object_name},
+            MetadataDirective="REPLACE",
+            ContentType=content_type,
+        )
 
     def upload_bytes(
         self,
@@ -31,13 +84,24 @@ class MinIOClient:
         bucket = bucket_name or self.settings.bucket_name
         self.ensure_bucket(bucket)
 
+        try:
+            self._put_object(bucket, object_name, data, content_type)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchBucket":
+                raise
+            # 확인한 뒤에 bucket이 삭제된 경우 다시 만들고 한 번 더 시도
+            self._known_buckets.discard(bucket)
+            self.ensure_bucket(bucket)
+            self._put_object(bucket, object_name, data, content_type)
+        return object_name
+
+    def _put_object(self, bucket: str, object_name: str, data: bytes, content_type: str) -> None:
         self._client.put_object(
             Bucket=bucket,
             Key=object_name,
             Body=data,
             ContentType=content_type,
         )
-        return object_name
 
     def download_bytes(
         self,
@@ -48,6 +112,79 @@ class MinIOClient:
         response = self._client.get_object(Bucket=bucket, Key=object_name)
         return response["Body"].read()
 
+    def presigned_url(
+        self,
+        object_name: str,
+        expires_in: int = 300,
+        bucket_name: str | None = None,
+    ) -> str:
+        """Signed GET URL for the object, valid for expires_in seconds.
+
+        Signing is local (no request to MinIO). The URL supports Range requests,
+        so readers can stream the object and resume where they stopped.
+        """
+        bucket = bucket_name or self.settings.bucket_name
+        return self._client.generate_presigned_url(
+            "get_object", Params={"Bucket": bucket, "Key": object_name}, ExpiresIn=expires_in
+        )
+
+    def list_prefixes(
+        self,
+        prefix: str = "",
+        delimiter: str = "/",
+        bucket_name: str | None = None,
+    ) -> Iterator[str]:
+        """Yield the "directories" directly under prefix (e.g. "audio/2025/" for prefix "audio/")."""
+        bucket = bucket_name or self.settings.bucket_name
+        paginator = self._client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter=delimiter):
+            for common_prefix in page.get("CommonPrefixes", []):
+                yield common_prefix["Prefix"]
+
+    def list_objects(
+        self,
+        prefix: str = "",
+        delimiter: str = "",
+        bucket_name: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the objects under prefix (Key, Size, LastModified, ...).
+
+        With a delimiter, objects in "directories" below prefix are skipped.
+        """
+        bucket = bucket_name or self.settings.bucket_name
+        paginator = self._client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter=delimiter):
+            yield from page.get("Contents", [])
+
+    def delete_objects(
+        self,
+        object_names: Iterable[str],
+        bucket_name: str | None = None,
+    ) -> Iterator[tuple[list[str], list[str]]]:
+        """Delete objects in batches of up to DELETE_BATCH_SIZE keys per request.
+
+        Yields (deleted, failed) key lists for each batch as it completes.
+        """
+        bucket = bucket_name or self.settings.bucket_name
+        batch: list[str] = []
+        for object_name in object_names:
+            batch.append(object_name)
+            if len(batch) == self.DELETE_BATCH_SIZE:
+                yield self._delete_batch(bucket, batch)
+                batch = []
+        if batch:
+            yield self._delete_batch(bucket, batch)
+
+    def _delete_batch(self, bucket: str, object_names: list[str]) -> tuple[list[str], list[str]]:
+        response = self._client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": object_name} for object_name in object_names], "Quiet": True},
+        )
+        # Quiet 모드에서는 실패한 key만 응답에 포함됨
+        failed = [error["Key"] for error in response.get("Errors", [])]
+        failed_set = set(failed)
+        return [object_name for object_name in object_names if object_name not in failed_set], failed
+
 
 _default_client: MinIOClient | None = None
 
@@ -12,3 +12,9 @@ class MinIOSettings(BaseSettings):
     access_key: str = "guest"
     secret_key: str = "guest"
     bucket_name: str = "tts"
+
+    # 연결 풀 크기 (동시에 진행할 수 있는 요청 수)와 유휴 연결 유지
+    max_pool_connections: int = 32
+    tcp_keepalive: bool = True
+    # 비동기 클라이언트에서 쓰지 않는 연결을 닫기 전까지 유지하는 시간 (초)
+    keepalive_timeout: float = 30.0
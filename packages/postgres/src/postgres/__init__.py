@@ -9,6 +9,7 @@ from .connection import (
     get_sync_session,
     get_sync_session_context,
 )
+from .notify import PostgresListener, notify
 from .settings import db_settings
 
 __all__ = [
@@ -19,5 +20,7 @@ __all__ = [
     "get_async_session_context",
     "get_sync_session",
     "get_sync_session_context",
+    "PostgresListener",
+    "notify",
     "db_settings",
 ]
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .settings import db_settings
+
+logger = logging.getLogger(__name__)
+
+NotificationHandler = Callable[[str], None]
+
+
+async def notify(session: AsyncSession, channel: str, payload: str) -> None:
+    """Send a NOTIFY on channel. Delivered to listeners when the session commits."""
+    await session.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": channel, "payload": payload})
+
+
+class PostgresListener:
+    """LISTEN on a channel using a dedicated asyncpg connection.
+
+    The connection is re-established automatically when it drops. Notifications
+    sent while disconnected are lost, so on_reconnect is awaited after every
+    reconnect to let the caller resynchronize its state.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        handler: NotificationHandler,
+        on_reconnect: Callable[[], Awaitable[None]] | None = None,
+        retry_delay: float = 5.0,
+    ):
+        self.channel = channel
+        self.handler = handler
+        self.on_reconnect = on_reconnect
+        self.retry_delay = retry_delay
+        self._task: asyncio.Task | None = None
+        self._connection: asyncpg.Connection | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _connect(self) -> asyncpg.Connection:
+        return await asyncpg.connect(
+            host=db_settings.POSTGRES_HOST,
+            port=db_settings.POSTGRES_PORT,
+            user=db_settings.POSTGRES_USER,
+            password=db_settings.POSTGRES_PASSWORD,
+            database=db_settings.POSTGRES_DB,
+        )
+
+    def _on_notification(self, connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            self.handler(payload)
+        except Exception as e:
+            logger.error("Failed to handle notification on %s: %s", channel, e)
+
+    async def _run(self) -> None:
+        first = True
+        while True:
+            try:
+                self._connection = await self._connect()
+                closed = asyncio.Event()
+                self._connection.add_termination_listener(lambda _conn: closed.set())
+                await self._connection.add_listener(self.channel, self._on_notification)
+
+                if not first and self.on_reconnect:
+                    await self.on_reconnect()
+                first = False
+
+                await closed.wait()
+                logger.warning("Listener connection for '%s' lost, reconnecting...", self.channel)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Listener error on '%s': %s", self.channel, e)
+                first = False
+            await asyncio.sleep(self.retry_delay)
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._connection and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
@@ -1,13 +1,24 @@
 from .settings import RabbitMQSettings
+from .topology import Topology
 from .connections import RabbitMQConnection, get_rabbitmq_connection
 from .publisher import RabbitMQPublisher
-from .consumer import RabbitMQConsumer, MessageHandler
+from .consumer import RabbitMQConsumer, MessageHandler, PropertiesMessageHandler
+from .async_connection import AsyncRabbitMQConnection
+from .async_publisher import AsyncRabbitMQPublisher
+from .confirm_publisher import AsyncConfirmPublisher, ConfirmPublisher, PublishNackedError
 
 __all__ = [
     "RabbitMQSettings",
+    "Topology",
     "RabbitMQConnection",
     "get_rabbitmq_connection",
     "RabbitMQPublisher",
     "RabbitMQConsumer",
     "MessageHandler",
+    "PropertiesMessageHandler",
+    "AsyncRabbitMQConnection",
+    "AsyncRabbitMQPublisher",
+    "AsyncConfirmPublisher",
+    "ConfirmPublisher",
+    "PublishNackedError",
 ]
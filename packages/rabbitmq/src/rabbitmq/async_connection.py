@@ -0,0 +1,109 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from pika.adapters.asyncio_connection import AsyncioConnection
+from pika.channel import Channel
+
+from .connections import build_connection_parameters
+from .settings import RabbitMQSettings
+from .topology import Declaration, Topology
+
+
+def callback_future() -> tuple[asyncio.Future, Callable[..., None]]:
+    """Create a future and a pika-style callback that resolves it with its first argument."""
+    future = asyncio.get_running_loop().create_future()
+
+    def callback(*args: Any) -> None:
+        if not future.done():
+            future.set_result(args[0] if args else None)
+
+    return future, callback
+
+
+class AsyncRabbitMQConnection:
+    """RabbitMQ connection driven by the running asyncio event loop.
+
+    Uses pika's asyncio adapter, so opening the connection, opening channels
+    and declaring topology never block the loop.
+    """
+
+    def __init__(self, settings: RabbitMQSettings | None = None, topology: Topology | None = None):
+        self.settings = settings or RabbitMQSettings()
+        self.topology = topology or Topology()
+        self._connection: AsyncioConnection | None = None
+        self._declared: set[Declaration] = set()
+        self._connect_lock: asyncio.Lock | None = None
+        self._close_callbacks: list[Callable[[BaseException], None]] = []
+
+    @property
+    def is_open(self) -> bool:
+        return self._connection is not None and self._connection.is_open
+
+    def add_on_close_callback(self, callback: Callable[[BaseException], None]) -> None:
+        self._close_callbacks.append(callback)
+
+    async def ensure_connection(self) -> AsyncioConnection:
+        if self.is_open:
+            return self._connection
+
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self.is_open:
+                return self._connection
+
+            loop = asyncio.get_running_loop()
+            opened: asyncio.Future[AsyncioConnection] = loop.create_future()
+
+            def on_open(connection: AsyncioConnection) -> None:
+                if not opened.done():
+                    opened.set_result(connection)
+
+            def on_open_error(connection: AsyncioConnection, error: BaseException | str) -> None:
+                if not opened.done():
+                    opened.set_exception(error if isinstance(error, BaseException) else ConnectionError(error))
+
+            def on_close(connection: AsyncioConnection, reason: BaseException) -> None:
+                if not opened.done():
+                    opened.set_exception(reason)
+                if self._connection is connection:
+                    self._connection = None
+                for callback in self._close_callbacks:
+                    callback(reason)
+
+            AsyncioConnection(
+                build_connection_parameters(self.settings),
+                on_open_callback=on_open,
+                on_open_error_callback=on_open_error,
+                on_close_callback=on_close,
+                custom_ioloop=loop,
+            )
+            self._connection = await opened
+            self._declared = set()
+            return self._connection
+
+    async def create_channel(self) -> Channel:
+        connection = await self.ensure_connection()
+        opened, on_open = callback_future()
+        connection.channel(on_open_callback=on_open)
+        return await opened
+
+    async def declare(self, channel: Channel, wait: Callable[[Awaitable], Awaitable] | None = None) -> None:
+        """Declare registered topology that this connection has not declared yet."""
+        await self.topology.declare_async(channel, self._declared, wait)
+
+    async def close(self) -> None:
+        connection = self._connection
+        if connection is None or connection.is_closed or connection.is_closing:
+            self._connection = None
+            return
+
+        closed, on_close = callback_future()
+        self._close_callbacks.append(on_close)
+        try:
+            connection.close()
+            await closed
+        finally:
+            self._close_callbacks.remove(on_close)
+        self._connection = None
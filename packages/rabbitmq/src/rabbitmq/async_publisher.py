@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from typing import Any
+
+import pika
+from pika.channel import Channel
+
+from .async_connection import AsyncRabbitMQConnection, callback_future
+from .publisher import build_properties, encode_body
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRabbitMQPublisher:
+    """Publisher for asyncio code.
+
+    Same interface as RabbitMQPublisher, but publish() is awaitable and never
+    blocks the event loop. Exchanges are declared once per connection instead
+    of before every publish.
+    """
+
+    def __init__(self, connection: AsyncRabbitMQConnection | None = None):
+        self.connection = connection or AsyncRabbitMQConnection()
+        self._channel: Channel | None = None
+        # 채널이 닫히면 실패시켜야 하는 응답 대기 future들
+        self._waiters: set[asyncio.Future] = set()
+        self._channel_lock = asyncio.Lock()
+
+    async def _get_channel(self) -> Channel:
+        async with self._channel_lock:
+            if self._channel is None or not self._channel.is_open:
+                channel = await self.connection.create_channel()
+                channel.add_on_close_callback(self._on_channel_closed)
+                await self._setup_channel(channel)
+                self._channel = channel
+            return self._channel
+
+    async def _setup_channel(self, channel: Channel) -> None:
+        """Hook for subclasses to configure a freshly opened channel."""
+
+    def _on_channel_closed(self, channel: Channel, reason: BaseException) -> None:
+        if channel is self._channel:
+            self._channel = None
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_exception(reason)
+        self._waiters.clear()
+
+    async def _wait(self, future: asyncio.Future) -> Any:
+        self._waiters.add(future)
+        try:
+            return await future
+        finally:
+            self._waiters.discard(future)
+
+    async def _declare_exchange(self, channel: Channel, exchange_name: str, exchange_type: str) -> None:
+        # connection당 한 번만 선언되고 재연결 시 자동으로 다시 선언됨
+        self.connection.topology.exchange(exchange_name, exchange_type)
+        await self.connection.declare(channel, self._wait)
+
+    async def publish(
+        self,
+        exchange_name: str,
+        routing_key: str,
+        message: dict[str, Any] | str | bytes,
+        exchange_type: str = "direct",
+        persistent: bool = True,
+        headers: dict[str, Any] | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        body = encode_body(message)
+        properties = build_properties(message, persistent, content_type, headers)
+
+        try:
+            channel = await self._get_channel()
+            await self._declare_exchange(channel, exchange_name, exchange_type)
+            channel.basic_publish(
+                exchange=exchange_name,
+                routing_key=routing_key,
+                body=body,
+                properties=properties,
+            )
+        except (pika.exceptions.AMQPError, ConnectionError) as e:
+            # Connection lost, reconnect and retry once
+            logger.warning("Connection lost: %s, creating new connection...", e)
+            self._channel = None
+            await self.connection.close()
+
+            channel = await self._get_channel()
+            await self._declare_exchange(channel, exchange_name, exchange_type)
+            channel.basic_publish(
+                exchange=exchange_name,
+                routing_key=routing_key,
+                body=body,
+                properties=properties,
+            )
+            logger.info("Reconnection successful")
+
+    async def close(self) -> None:
+        channel = self._channel
+        if channel and channel.is_open:
+            closed, on_close = callback_future()
+            channel.add_on_close_callback(on_close)
+            channel.close()
+            await closed
+        self._channel = None
@@ -0,0 +1,307 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future as ConcurrentFuture
+from dataclasses import dataclass
+from typing import Any
+
+import pika
+from pika.channel import Channel
+from pika.frame import Method
+
+from .async_connection import AsyncRabbitMQConnection, callback_future
+from .async_publisher import AsyncRabbitMQPublisher
+from .publisher import build_properties, encode_body
+from .settings import RabbitMQSettings
+from .topology import Topology
+
+logger = logging.getLogger(__name__)
+
+
+class PublishNackedError(Exception):
+    """The broker rejected a published message (basic.nack)."""
+
+
+@dataclass
+class _PendingPublish:
+    exchange_name: str
+    exchange_type: str
+    routing_key: str
+    body: bytes
+    properties: pika.BasicProperties
+    future: asyncio.Future
+
+
+class AsyncConfirmPublisher(AsyncRabbitMQPublisher):
+    """Publisher with RabbitMQ publisher confirms.
+
+    Messages are pipelined: up to max_outstanding messages may be waiting for
+    an ack at once, and each publish resolves its own future when the ack (or
+    a multiple-ack covering it) arrives. Messages still unconfirmed when the
+    channel or connection drops are republished, in order, once a new channel
+    is open, so callers only ever see a success, a nack, or close().
+    """
+
+    def __init__(
+        self,
+        connection: AsyncRabbitMQConnection | None = None,
+        max_outstanding: int = 1000,
+        retry_delay: float = 5.0,
+    ):
+        super().__init__(connection)
+        self.retry_delay = retry_delay
+        self._window = asyncio.Semaphore(max_outstanding)
+        self._outstanding: dict[int, _PendingPublish] = {}
+        self._unconfirmed: list[_PendingPublish] = []
+        self._next_delivery_tag = 1
+        self._recover_task: asyncio.Task | None = None
+        self._closing = False
+
+    async def _setup_channel(self, channel: Channel) -> None:
+        selected, on_select_ok = callback_future()
+        channel.confirm_delivery(self._on_delivery_confirmation, callback=on_select_ok)
+        await self._wait(selected)
+        self._next_delivery_tag = 1
+        await self._republish(channel)
+
+    async def _republish(self, channel: Channel) -> None:
+        # 연결이 끊기기 전에 확인받지 못한 메시지를 순서대로 재발행
+        pending, self._unconfirmed = self._unconfirmed, []
+        for index, item in enumerate(pending):
+            try:
+                await self._declare_exchange(channel, item.exchange_name, item.exchange_type)
+                self._send(channel, item)
+            except Exception:
+                self._unconfirmed = pending[index:] + self._unconfirmed
+                raise
+        if pending:
+            logger.info("Republished %d unconfirmed messages", len(pending))
+
+    def _send(self, channel: Channel, item: _PendingPublish) -> None:
+        delivery_tag = self._next_delivery_tag
+        self._outstanding[delivery_tag] = item
+        try:
+            channel.basic_publish(
+                exchange=item.exchange_name,
+                routing_key=item.routing_key,
+                body=item.body,
+                properties=item.properties,
+            )
+        except Exception:
+            del self._outstanding[delivery_tag]
+            raise
+        self._next_delivery_tag += 1
+
+    def _on_delivery_confirmation(self, frame: Method) -> None:
+        method = frame.method
+        if method.multiple:
+            delivery_tags = [tag for tag in self._outstanding if tag <= method.delivery_tag]
+        else:
+            delivery_tags = [method.delivery_tag]
+
+        acked = isinstance(method, pika.spec.Basic.Ack)
+        for delivery_tag in delivery_tags:
+            item = self._outstanding.pop(delivery_tag, None)
+            if item is None or item.future.done():
+                continue
+            if acked:
+                item.future.set_result(None)
+            else:
+                item.future.set_exception(PublishNackedError(f"Message {delivery_tag} was nacked by the broker"))
+
+    def _on_channel_closed(self, channel: Channel, reason: BaseException) -> None:
+        super()._on_channel_closed(channel, reason)
+        if not self._outstanding:
+            return
+        # 확인받지 못한 메시지는 새 채널에서 재발행 (delivery tag 순서 유지)
+        self._unconfirmed = [self._outstanding[tag] for tag in sorted(self._outstanding)] + self._unconfirmed
+        self._outstanding.clear()
+        self._schedule_recovery()
+
+    def _schedule_recovery(self) -> None:
+        if self._closing or (self._recover_task and not self._recover_task.done()):
+            return
+        self._recover_task = asyncio.get_running_loop().create_task(self._recover())
+
+    async def _recover(self) -> None:
+        while self._unconfirmed and not self._closing:
+            try:
+                channel = await self._get_channel()
+                await self._republish(channel)
+            except Exception as e:
+                logger.warning("Reconnect failed: %s, retrying in %ss...", e, self.retry_delay)
+                await asyncio.sleep(self.retry_delay)
+
+    async def start_publish(
+        self,
+        exchange_name: str,
+        routing_key: str,
+        message: dict[str, Any] | str | bytes,
+        exchange_type: str = "direct",
+        persistent: bool = True,
+        headers: dict[str, Any] | None = None,
+        content_type: str | None = None,
+    ) -> asyncio.Future:
+        """Send a message and return a future that resolves when the broker confirms it.
+
+        Waits only if max_outstanding messages are already unconfirmed.
+        """
+        if self._closing:
+            raise RuntimeError("Publisher is closed")
+
+        await self._window.acquire()
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda _future: self._window.release())
+        item = _PendingPublish(
+            exchange_name=exchange_name,
+            exchange_type=exchange_type,
+            routing_key=routing_key,
+            body=encode_body(message),
+            properties=build_properties(message, persistent, content_type, headers),
+            future=future,
+        )
+
+        try:
+            channel = await self._get_channel()
+            await self._declare_exchange(channel, exchange_name, exchange_type)
+            self._send(channel, item)
+        except (pika.exceptions.AMQPError, ConnectionError) as e:
+            # 연결이 복구되면 재발행
+            logger.warning("Publish failed: %s, will republish after reconnect", e)
+            self._unconfirmed.append(item)
+            self._schedule_recovery()
+        return future
+
+    async def publish(
+        self,
+        exchange_name: str,
+        routing_key: str,
+        message: dict[str, Any] | str | bytes,
+        exchange_type: str = "direct",
+        persistent: bool = True,
+        headers: dict[str, Any] | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        await (
+            await self.start_publish(
+                exchange_name, routing_key, message, exchange_type, persistent, headers, content_type
+            )
+        )
+
+    async def publish_many(
+        self,
+        exchange_name: str,
+        routing_key: str,
+        messages: list[dict[str, Any] | str | bytes],
+        exchange_type: str = "direct",
+        persistent: bool = True,
+    ) -> None:
+        """Publish a batch back-to-back and wait until every message is confirmed."""
+        futures = [
+            await self.start_publish(exchange_name, routing_key, message, exchange_type, persistent)
+            for message in messages
+        ]
+        await asyncio.gather(*futures)
+
+    async def close(self) -> None:
+        self._closing = True
+        if self._recover_task:
+            self._recover_task.cancel()
+            self._recover_task = None
+
+        # 이미 발행된 메시지의 확인을 잠시 기다림
+        if self._outstanding:
+            await asyncio.wait([item.future for item in self._outstanding.values()], timeout=5)
+
+        await super().close()
+
+        error = ConnectionError("Publisher closed before the message was confirmed")
+        for item in [*self._outstanding.values(), *self._unconfirmed]:
+            if not item.future.done():
+                item.future.set_exception(error)
+        self._outstanding.clear()
+        self._unconfirmed.clear()
+
+
+class ConfirmPublisher:
+    """Thread-safe blocking facade over AsyncConfirmPublisher.
+
+    Runs its own event loop in a background thread, so it can be shared by
+    any number of threads (e.g. a pika consumer thread or a worker pool)
+    while still pipelining confirms.
+    """
+
+    def __init__(
+        self,
+        settings: RabbitMQSettings | None = None,
+        max_outstanding: int = 1000,
+        topology: Topology | None = None,
+    ):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="rabbitmq-confirm-publisher", daemon=True)
+        self._thread.start()
+        self._connection = AsyncRabbitMQConnection(settings, topology)
+        self._publisher = AsyncConfirmPublisher(self._connection, max_outstanding=max_outstanding)
+
+    def publish_nowait(
+        self,
+        exchange_name: str,
+        routing_key: str,
+        message: dict[str, Any] | str | bytes,
+        exchange_type: str = "direct",
+        persistent: bool = True,
+        headers: dict[str, Any] | None = None,
+        content_type: str | None = None,
+    ) -> ConcurrentFuture:
+        """Publish without waiting; the returned future completes when the broker confirms."""
+        return asyncio.run_coroutine_threadsafe(
+            self._publisher.publish(
+                exchange_name, routing_key, message, exchange_type, persistent, headers, content_type
+            ),
+            self._loop,
+        )
+
+    def publish(
+        self,
+        exchange_name: str,
+        routing_key: str,
+        message: dict[str, Any] | str | bytes,
+        exchange_type: str = "direct",
+        persistent: bool = True,
+        headers: dict[str, Any] | None = None,
+        content_type: str | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        self.publish_nowait(
+            exchange_name, routing_key, message, exchange_type, persistent, headers, content_type
+        ).result(timeout)
+
+    def publish_many(
+        self,
+        exchange_name: str,
+        routing_key: str,
+        messages: list[dict[str, Any] | str | bytes],
+        exchange_type: str = "direct",
+        persistent: bool = True,
+        timeout: float | None = None,
+    ) -> None:
+        asyncio.run_coroutine_threadsafe(
+            self._publisher.publish_many(exchange_name, routing_key, messages, exchange_type, persistent),
+            self._loop,
+        ).result(timeout)
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+
+        async def shutdown() -> None:
+            await self._publisher.close()
+            await self._connection.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=10)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+        self._loop.close()
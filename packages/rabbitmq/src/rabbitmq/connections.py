@@ -3,34 +3,44 @@ from pika import BlockingConnection
 from pika.adapters.blocking_connection import BlockingChannel
 
 from .settings import RabbitMQSettings
+from .topology import Declaration, Topology
+
+
+def build_connection_parameters(settings: RabbitMQSettings) -> pika.ConnectionParameters:
+    return pika.ConnectionParameters(
+        host=settings.host,
+        port=settings.port,
+        virtual_host=settings.vhost,
+        credentials=pika.PlainCredentials(
+            username=settings.username,
+            password=settings.password,
+        ),
+        heartbeat=600,  # 10분마다 heartbeat
+        blocked_connection_timeout=300,  # 5분 block timeout
+    )
 
 
 class RabbitMQConnection:
-    def __init__(self, settings: RabbitMQSettings | None = None):
+    def __init__(self, settings: RabbitMQSettings | None = None, topology: Topology | None = None):
         self.settings = settings or RabbitMQSettings()
+        self.topology = topology or Topology()
         self._connection: BlockingConnection | None = None
-
-    def _get_credentials(self) -> pika.PlainCredentials:
-        return pika.PlainCredentials(
-            username=self.settings.username,
-            password=self.settings.password,
-        )
+        # 현재 connection에 이미 선언된 topology (재연결 시 초기화되어 다시 선언됨)
+        self._declared: set[Declaration] = set()
 
     def _get_parameters(self) -> pika.ConnectionParameters:
-        return pika.ConnectionParameters(
-            host=self.settings.host,
-            port=self.settings.port,
-            virtual_host=self.settings.vhost,
-            credentials=self._get_credentials(),
-            heartbeat=600,  # 10분마다 heartbeat
-            blocked_connection_timeout=300,  # 5분 block timeout
-        )
+        return build_connection_parameters(self.settings)
 
     def ensure_connection(self) -> BlockingConnection:
         if self._connection is None or self._connection.is_closed:
             self._connection = pika.BlockingConnection(self._get_parameters())
+            self._declared = set()
         return self._connection
 
+    def declare(self, channel: BlockingChannel) -> None:
+        """Declare registered topology that this connection has not declared yet."""
+        self.topology.declare(channel, self._declared)
+
     def create_channel(self) -> BlockingChannel:
         connection = self.ensure_connection()
         return connection.channel()
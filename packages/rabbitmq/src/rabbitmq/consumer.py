@@ -1,13 +1,26 @@
+import copy
+import functools
 import json
+import logging
+from concurrent.futures import Executor, Future
 from typing import Any, Callable
 
+import pika.exceptions
 from pika.adapters.blocking_connection import BlockingChannel
 from pika.spec import Basic, BasicProperties
 
 from .connections import RabbitMQConnection, get_rabbitmq_connection
 
+logger = logging.getLogger(__name__)
+
 
 MessageHandler = Callable[[dict[str, Any] | bytes], None]
+PropertiesMessageHandler = Callable[[dict[str, Any] | bytes, BasicProperties], None]
+
+JSON_CONTENT_TYPES = (None, "application/json")
+
+# 실패한 메시지를 다시 넣을 때 몇 번째 시도였는지 기록하는 헤더
+ATTEMPTS_HEADER = "x-attempts"
 
 
 class RabbitMQConsumer:
@@ -24,31 +37,75 @@ class RabbitMQConsumer:
     def consume(
         self,
         queue_name: str,
-        handler: MessageHandler,
+        handler: MessageHandler | PropertiesMessageHandler,
         exchange_name: str | None = None,
         routing_key: str | None = None,
         exchange_type: str = "direct",
         prefetch_count: int = 1,
         auto_ack: bool = False,
         parse_json: bool = True,
+        executor: Executor | None = None,
+        with_properties: bool = False,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
     ) -> str:
+        """Start consuming queue_name with handler.
+
+        With parse_json, bodies are decoded as JSON unless the message declares
+        a non-JSON content type, in which case the raw bytes are passed. If
+        with_properties is set, the handler also receives the message's
+        BasicProperties (headers, content type, ...).
+
+        If executor is given, handlers run on it instead of the connection
+        thread, so up to prefetch_count messages are processed concurrently
+        and heartbeats keep flowing during slow handlers. Acks and nacks are
+        marshalled back to the connection thread.
+
+        A message whose handler raises is not requeued in place (it would be
+        redelivered immediately, over and over). After retry_delay seconds,
+        doubling with each attempt, it is republished to the back of
+        queue_name with its attempt count in the x-attempts header. After
+        max_attempts it is rejected without requeue: dead-lettered if the
+        queue has a dead-letter exchange policy, dropped otherwise.
+        """
         channel = self._get_channel()
         channel.basic_qos(prefetch_count=prefetch_count)
 
-        channel.queue_declare(queue=queue_name, durable=True)
+        topology = self.connection.topology
+        topology.queue(queue_name)
 
         # exchange가 지정되면 bind
         if exchange_name:
-            channel.exchange_declare(
-                exchange=exchange_name,
-                exchange_type=exchange_type,
-                durable=True,
-            )
-            channel.queue_bind(
-                queue=queue_name,
-                exchange=exchange_name,
-                routing_key=routing_key or queue_name,
-            )
+            topology.exchange(exchange_name, exchange_type)
+            topology.binding(queue_name, exchange_name, routing_key or queue_name)
+
+        # connection에 아직 선언되지 않은 것만 선언
+        self.connection.declare(channel)
+
+        def dispatch(properties: BasicProperties, body: bytes) -> None:
+            if parse_json and properties.content_type in JSON_CONTENT_TYPES:
+                data = json.loads(body.decode())
+            else:
+                data = body
+            if with_properties:
+                handler(data, properties)
+            else:
+                handler(data)
+
+        def settle(
+            ch: BlockingChannel,
+            method: Basic.Deliver,
+            properties: BasicProperties,
+            body: bytes,
+            error: BaseException | None,
+        ) -> None:
+            # connection 스레드에서 실행
+            if auto_ack or not ch.is_open:
+                return  # 채널이 닫혔으면 broker가 메시지를 다시 전달함
+            if error is None:
+                ch.basic_ack(delivery_tag=method.delivery_tag)
+            else:
+                self._retry_later(ch, queue_name, method.delivery_tag, properties, body, max_attempts, retry_delay)
 
         def on_message(
             ch: BlockingChannel,
@@ -56,18 +113,19 @@ class RabbitMQConsumer:
             properties: BasicProperties,
             body: bytes,
         ) -> None:
+            if executor is not None:
+                future = executor.submit(dispatch, properties, body)
+                on_settle = functools.partial(settle, ch, method, properties, body)
+                future.add_done_callback(functools.partial(self._on_handler_done, ch, on_settle))
+                return
+
             try:
-                if parse_json:
-                    data = json.loads(body.decode())
-                else:
-                    data = body
-                handler(data)
-                if not auto_ack:
-                    ch.basic_ack(delivery_tag=method.delivery_tag)
-            except Exception:
-                if not auto_ack:
-                    ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
-                raise
+                dispatch(properties, body)
+            except Exception as e:
+                logger.error("Handler failed: %r", e, exc_info=e)
+                settle(ch, method, properties, body, e)
+            else:
+                settle(ch, method, properties, body, None)
 
         consumer_tag = channel.basic_consume(
             queue=queue_name,
@@ -77,6 +135,46 @@ class RabbitMQConsumer:
         self._consumer_tags.append(consumer_tag)
         return consumer_tag
 
+    def _on_handler_done(
+        self, channel: BlockingChannel, settle: Callable[[BaseException | None], None], future: Future
+    ) -> None:
+        """Runs on an executor thread; schedules the ack/retry on the connection thread."""
+        error = future.exception()
+        if error is not None:
+            logger.error("Handler failed: %r", error, exc_info=error)
+        try:
+            channel.connection.add_callback_threadsafe(functools.partial(settle, error))
+        except pika.exceptions.ConnectionWrongStateError:
+            pass
+
+    def _retry_later(
+        self,
+        channel: BlockingChannel,
+        queue_name: str,
+        delivery_tag: int,
+        properties: BasicProperties,
+        body: bytes,
+        max_attempts: int,
+        retry_delay: float,
+    ) -> None:
+        """Runs on the connection thread; republishes a failed message after a backoff, or rejects it."""
+        attempts = int((properties.headers or {}).get(ATTEMPTS_HEADER, 0)) + 1
+        if attempts >= max_attempts:
+            logger.error("Rejecting message from %s after %d failed attempts", queue_name, attempts)
+            channel.basic_nack(delivery_tag=delivery_tag, requeue=False)
+            return
+
+        def retry() -> None:
+            if not channel.is_open:
+                return  # 채널이 닫혔으면 broker가 메시지를 다시 전달함
+            retried = copy.copy(properties)
+            retried.headers = {**(properties.headers or {}), ATTEMPTS_HEADER: attempts}
+            # 기다리는 동안 prefetch 한 칸을 차지하므로 실패가 이어지면 소비 속도도 함께 줄어듦
+            channel.basic_publish(exchange="", routing_key=queue_name, body=body, properties=retried)
+            channel.basic_ack(delivery_tag=delivery_tag)
+
+        channel.connection.call_later(retry_delay * 2 ** (attempts - 1), retry)
+
     def start_consuming(self) -> None:
         channel = self._get_channel()
         channel.start_consuming()
@@ -1,4 +1,5 @@
 import json
+import logging
 from typing import Any
 
 import pika
@@ -6,6 +7,31 @@ from pika.adapters.blocking_connection import BlockingChannel
 
 from .connections import RabbitMQConnection, get_rabbitmq_connection
 
+logger = logging.getLogger(__name__)
+
+
+def encode_body(message: dict[str, Any] | str | bytes) -> bytes:
+    if isinstance(message, dict):
+        return json.dumps(message).encode()
+    if isinstance(message, str):
+        return message.encode()
+    return message
+
+
+def build_properties(
+    message: dict[str, Any] | str | bytes,
+    persistent: bool = True,
+    content_type: str | None = None,
+    headers: dict[str, Any] | None = None,
+) -> pika.BasicProperties:
+    if content_type is None and isinstance(message, dict):
+        content_type = "application/json"
+    return pika.BasicProperties(
+        delivery_mode=pika.DeliveryMode.Persistent if persistent else pika.DeliveryMode.Transient,
+        content_type=content_type,
+        headers=headers,
+    )
+
 
 class RabbitMQPublisher:
     def __init__(self, connection: RabbitMQConnection | None = None):
@@ -34,27 +60,19 @@ class RabbitMQPublisher:
         message: dict[str, Any] | str | bytes,
         exchange_type: str = "direct",
         persistent: bool = True,
+        headers: dict[str, Any] | None = None,
+        content_type: str | None = None,
     ) -> None:
-        if isinstance(message, dict):
-            body = json.dumps(message).encode()
-        elif isinstance(message, str):
-            body = message.encode()
-        else:
-            body = message
+        body = encode_body(message)
+        properties = build_properties(message, persistent, content_type, headers)
 
-        properties = pika.BasicProperties(
-            delivery_mode=pika.DeliveryMode.Persistent if persistent else pika.DeliveryMode.Transient,
-        )
+        # exchange는 connection당 한 번만 선언 (재연결 시 자동으로 다시 선언됨)
+        self.connection.topology.exchange(exchange_name, exchange_type)
 
         # First attempt with existing channel
         try:
             channel = self._get_channel()
-
-            channel.exchange_declare(
-                exchange=exchange_name,
-                exchange_type=exchange_type,
-                durable=True,
-            )
+            self.connection.declare(channel)
 
             channel.basic_publish(
                 exchange=exchange_name,
@@ -65,7 +83,7 @@ class RabbitMQPublisher:
         except (pika.exceptions.StreamLostError, pika.exceptions.AMQPConnectionError,
                 pika.exceptions.ChannelWrongStateError, BrokenPipeError) as e:
             # Connection lost, create new connection and retry once
-            print(f"[RABBITMQ] Connection lost: {e}, creating new connection...")
+            logger.warning("Connection lost: %s, creating new connection...", e)
 
             # Force close old connection
             try:
@@ -76,12 +94,7 @@ class RabbitMQPublisher:
 
             # Get fresh channel (will create new connection)
             channel = self._get_channel(force_new=True)
-
-            channel.exchange_declare(
-                exchange=exchange_name,
-                exchange_type=exchange_type,
-                durable=True,
-            )
+            self.connection.declare(channel)
 
             channel.basic_publish(
                 exchange=exchange_name,
@@ -89,7 +102,7 @@ class RabbitMQPublisher:
                 body=body,
                 properties=properties,
             )
-            print(f"[RABBITMQ] Reconnection successful")
+            logger.info("Reconnection successful")
 
     def close(self) -> None:
         if self._channel and self._channel.is_open:
@@ -0,0 +1,142 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.channel import Channel
+
+
+@dataclass(frozen=True)
+class ExchangeDeclaration:
+    name: str
+    exchange_type: str = "direct"
+    durable: bool = True
+
+
+@dataclass(frozen=True)
+class QueueDeclaration:
+    name: str
+    durable: bool = True
+    exclusive: bool = False
+    auto_delete: bool = False
+
+
+@dataclass(frozen=True)
+class BindingDeclaration:
+    queue: str
+    exchange: str
+    routing_key: str
+
+
+Declaration = ExchangeDeclaration | QueueDeclaration | BindingDeclaration
+
+
+class Topology:
+    """Registry of the exchanges, queues and bindings an application uses.
+
+    Components register what they need; connections declare each item once
+    and keep track of what they have declared. A reconnected connection starts
+    with an empty set, so the whole registry is re-applied automatically.
+    """
+
+    def __init__(self):
+        self._declarations: dict[Declaration, None] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._declarations)
+
+    def _add(self, declaration: Declaration) -> Declaration:
+        if declaration not in self._declarations:
+            with self._lock:
+                self._declarations[declaration] = None
+        return declaration
+
+    def exchange(self, name: str, exchange_type: str = "direct", durable: bool = True) -> ExchangeDeclaration:
+        return self._add(ExchangeDeclaration(name, exchange_type, durable))
+
+    def queue(
+        self,
+        name: str,
+        durable: bool = True,
+        exclusive: bool = False,
+        auto_delete: bool = False,
+    ) -> QueueDeclaration:
+        return self._add(QueueDeclaration(name, durable, exclusive, auto_delete))
+
+    def binding(self, queue: str, exchange: str, routing_key: str) -> BindingDeclaration:
+        return self._add(BindingDeclaration(queue, exchange, routing_key))
+
+    def pending(self, declared: set[Declaration]) -> list[Declaration]:
+        if len(declared) >= len(self._declarations):
+            return []
+        with self._lock:
+            return [declaration for declaration in self._declarations if declaration not in declared]
+
+    def declare(self, channel: BlockingChannel, declared: set[Declaration]) -> None:
+        """Declare everything not yet in declared on a blocking channel."""
+        for declaration in self.pending(declared):
+            if isinstance(declaration, ExchangeDeclaration):
+                channel.exchange_declare(
+                    exchange=declaration.name,
+                    exchange_type=declaration.exchange_type,
+                    durable=declaration.durable,
+                )
+            elif isinstance(declaration, QueueDeclaration):
+                channel.queue_declare(
+                    queue=declaration.name,
+                    durable=declaration.durable,
+                    exclusive=declaration.exclusive,
+                    auto_delete=declaration.auto_delete,
+                )
+            else:
+                channel.queue_bind(
+                    queue=declaration.queue,
+                    exchange=declaration.exchange,
+                    routing_key=declaration.routing_key,
+                )
+            declared.add(declaration)
+
+    async def declare_async(
+        self,
+        channel: Channel,
+        declared: set[Declaration],
+        wait: Callable[[Awaitable], Awaitable] | None = None,
+    ) -> None:
+        """Declare everything not yet in declared on an asyncio channel.
+
+        wait lets the caller wrap each broker reply, e.g. to fail it when the
+        channel closes.
+        """
+        for declaration in self.pending(declared):
+            done = asyncio.get_running_loop().create_future()
+
+            def callback(_frame: Any, done: asyncio.Future = done) -> None:
+                if not done.done():
+                    done.set_result(None)
+
+            if isinstance(declaration, ExchangeDeclaration):
+                channel.exchange_declare(
+                    exchange=declaration.name,
+                    exchange_type=declaration.exchange_type,
+                    durable=declaration.durable,
+                    callback=callback,
+                )
+            elif isinstance(declaration, QueueDeclaration):
+                channel.queue_declare(
+                    queue=declaration.name,
+                    durable=declaration.durable,
+                    exclusive=declaration.exclusive,
+                    auto_delete=declaration.auto_delete,
+                    callback=callback,
+                )
+            else:
+                channel.queue_bind(
+                    queue=declaration.queue,
+                    exchange=declaration.exchange,
+                    routing_key=declaration.routing_key,
+                    callback=callback,
+                )
+            await (wait(done) if wait else done)
+            declared.add(declaration)
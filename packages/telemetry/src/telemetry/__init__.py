@@ -0,0 +1,39 @@
+"""Metrics (exposed for Prometheus) and logging shared by the bot and the worker."""
+
+from .log import (
+    ContextFilter,
+    NonBlockingQueueHandler,
+    RateLimitFilter,
+    StructuredFormatter,
+    bind_log_context,
+    configure_logging,
+    log_context,
+    shutdown_logging,
+)
+from .metrics import DEFAULT_BUCKETS, Counter, Gauge, Histogram, MetricsRegistry, registry
+from .server import MetricsServer
+from .settings import LogSettings, MetricsSettings
+from .timeline import Timeline, elapsed, mark
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "ContextFilter",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "LogSettings",
+    "MetricsRegistry",
+    "MetricsServer",
+    "MetricsSettings",
+    "NonBlockingQueueHandler",
+    "RateLimitFilter",
+    "StructuredFormatter",
+    "Timeline",
+    "bind_log_context",
+    "configure_logging",
+    "elapsed",
+    "log_context",
+    "mark",
+    "registry",
+    "shutdown_logging",
+]
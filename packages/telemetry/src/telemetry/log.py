@@ -0,0 +1,213 @@
+"""Logging that never blocks the caller on output.
+
+configure_logging() puts a QueueHandler on the root logger: a log call only
+formats its message and appends the record to an in-memory queue, and a
+QueueListener thread writes it to stdout. If that thread falls behind (slow
+terminal, log collector back-pressure), records beyond LOG_QUEUE_SIZE are
+dropped and counted in log_records_dropped instead of stalling the event loop.
+
+Records carry structured fields (guild_id, message_id, trace_id, ...) passed
+with extra= or bound to the current context with log_context() /
+bind_log_context(). DEBUG records are rate limited per call site.
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+from .metrics import registry
+from .settings import LogSettings
+
+# LogRecord의 기본 속성. 이 외의 속성은 extra=나 context로 더해진 구조화 필드
+_RECORD_ATTRIBUTES = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime"}
+
+_context: contextvars.ContextVar[dict[str, object]] = contextvars.ContextVar("log_context", default={})
+
+# configure_logging()이 시작한 출력 스레드
+_listener: QueueListener | None = None
+
+DROPPED = registry.counter("log_records_dropped", "Log records dropped because the output thread fell behind")
+
+
+@contextmanager
+def log_context(**fields: object) -> Iterator[None]:
+    """Add fields to every record logged inside the with block (in this thread or task)."""
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+def bind_log_context(**fields: object) -> None:
+    """Add fields to every record logged from now on in the current context.
+
+    Each asyncio task runs in a copy of the context it was created in, so
+    fields bound inside a task do not leak into other tasks.
+    """
+    _context.set({**_context.get(), **fields})
+
+
+def record_fields(record: logging.LogRecord) -> dict[str, object]:
+    return {key: value for key, value in record.__dict__.items() if key not in _RECORD_ATTRIBUTES}
+
+
+class ContextFilter(logging.Filter):
+    """Copies the fields bound with log_context() onto the record (extra= takes precedence)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _context.get().items():
+            if value is not None and not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets at most rate DEBUG records per second through from each call site.
+
+    The next record that gets through reports how many were suppressed
+    before it (suppressed field).
+    """
+
+    def __init__(self, rate: float, level: int = logging.DEBUG):
+        super().__init__()
+        self.rate = rate
+        self.level = level
+        # 호출 위치별 (남은 토큰, 마지막 갱신 시각, 버린 개수)
+        self._buckets: dict[tuple[str, int], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level:
+            return True
+        now = time.monotonic()
+        key = (record.pathname, record.lineno)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.rate, now, 0]
+            bucket[0] = min(self.rate, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1
+            suppressed, bucket[2] = bucket[2], 0
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops records beyond capacity instead of waiting for the writer.
+
+    The queue itself is unbounded (SimpleQueue), so the listener's stop
+    sentinel always fits; capacity is enforced here.
+    """
+
+    def __init__(self, queue: queue.SimpleQueue, capacity: int):
+        super().__init__(queue)
+        self.capacity = capacity
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 인자와 예외는 호출한 쪽에서 문자열로 만들어 둠 (나중에 값이 바뀌거나 traceback이 사라지지 않도록)
+        # 기본 구현과 달리 traceback을 message에 합치지 않아 JSON 형식에서 따로 출력할 수 있음
+        message = record.getMessage()
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg, record.args = message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.queue.qsize() >= self.capacity:
+            self.dropped += 1
+            DROPPED.inc()
+            return
+        self.queue.put_nowait(record)
+
+
+class StructuredFormatter(logging.Formatter):
+    """One line per record: "time level logger: message key=value ..." or a JSON object."""
+
+    def __init__(self, output_format: str = "text"):
+        super().__init__()
+        self.output_format = output_format
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        fields = record_fields(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        timestamp = self.formatTime(record)
+        if self.output_format == "json":
+            entry = {
+                "time": timestamp,
+                "level": record.levelname,
+                "logger": record.name,
+                "message": message,
+                **fields,
+            }
+            if record.exc_text:
+                entry["exception"] = record.exc_text
+            return json.dumps(entry, ensure_ascii=False, default=str)
+        line = f"{timestamp} {record.levelname:<7} {record.name}: {message}"
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        if record.exc_text:
+            line += "\n" + record.exc_text
+        return line
+
+
+def configure_logging(settings: LogSettings | None = None) -> NonBlockingQueueHandler:
+    """Route all logging through a queue to a stdout writer thread.
+
+    Replaces the root logger's handlers (and a writer thread started by an
+    earlier call), so call it once at startup. The queue is flushed by
+    shutdown_logging(), which also runs at interpreter exit.
+    """
+    global _listener
+    shutdown_logging()
+    settings = settings or LogSettings()
+    records: queue.SimpleQueue = queue.SimpleQueue()
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(StructuredFormatter(settings.format))
+    listener = QueueListener(records, output)
+
+    handler = NonBlockingQueueHandler(records, settings.queue_size)
+    # 버릴 DEBUG 로그는 context를 복사하기 전에 걸러냄
+    if settings.debug_rate > 0:
+        handler.addFilter(RateLimitFilter(settings.debug_rate))
+    handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    for previous in root.handlers[:]:
+        root.removeHandler(previous)
+    root.addHandler(handler)
+    root.setLevel(settings.level.upper())
+    for name, level in settings.levels.items():
+        logging.getLogger(name).setLevel(level.upper())
+
+    listener.start()
+    _listener = listener
+    return handler
+
+
+@atexit.register
+def shutdown_logging() -> None:
+    """Write out the queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
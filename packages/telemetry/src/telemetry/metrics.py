@@ -0,0 +1,222 @@
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+
+# 초 단위 지연 시간용 기본 구간 (5ms ~ 30s)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metric:
+    """A named metric with optional labels, rendered in the Prometheus text format."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, object]) -> LabelValues:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {list(self.labelnames)}, got {list(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, values: LabelValues, extra: tuple[tuple[str, str], ...] = ()) -> str:
+        pairs = [*zip(self.labelnames, values), *extra]
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {_escape(self.help)}", f"# TYPE {self.name} {self.type}", *self.samples()]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = dict(self._values)
+        for key, value in values.items():
+            yield f"{self.name}_total{self._labels(key)} {_format_value(value)}"
+
+
+class Gauge(Metric):
+    """A value that goes up and down, or is read from function when scraped."""
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        function: Callable[[], float] | None = None,
+    ):
+        super().__init__(name, help, labelnames)
+        self._values: dict[LabelValues, float] = {}
+        self._function = function
+
+    def set_function(self, function: Callable[[], float] | None) -> None:
+        """Read the (unlabelled) value from function on every scrape."""
+        self._function = function
+
+    def set(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def samples(self) -> Iterator[str]:
+        if self._function is not None:
+            try:
+                yield f"{self.name} {_format_value(self._function())}"
+            except Exception:
+                pass  # 값을 읽지 못하면 이번 수집에서는 생략
+            return
+        with self._lock:
+            values = dict(self._values)
+        for key, value in values.items():
+            yield f"{self.name}{self._labels(key)} {_format_value(value)}"
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값별 [구간별 개수..., 합계, 전체 개수] (구간을 넘는 값은 전체 개수에만 포함)
+        self._values: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            counts[-2] += value
+            counts[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        """Observe how long the with block took (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = {key: list(counts) for key, counts in self._values.items()}
+        for key, counts in values.items():
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = self._labels(key, (("le", _format_value(bound)),))
+                yield f"{self.name}_bucket{labels} {_format_value(cumulative)}"
+            # 모든 관측값은 +Inf 구간에 포함
+            yield f"{self.name}_bucket{self._labels(key, (('le', '+Inf'),))} {_format_value(counts[-1])}"
+            yield f"{self.name}_sum{self._labels(key)} {_format_value(counts[-2])}"
+            yield f"{self.name}_count{self._labels(key)} {_format_value(counts[-1])}"
+
+
+class MetricsRegistry:
+    """Named metrics of one process.
+
+    counter()/gauge()/histogram() return the existing metric when the name
+    is already registered, so modules (and reloaded cogs) can declare the
+    metrics they use without coordinating.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, kind: type[Metric], create: Callable[[], Metric]) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = create()
+            elif not isinstance(metric, kind):
+                raise ValueError(f"{name} is already registered as a {metric.type}")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(name, Counter, lambda: Counter(name, help, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        function: Callable[[], float] | None = None,
+    ) -> Gauge:
+        gauge = self._get_or_create(name, Gauge, lambda: Gauge(name, help, labelnames))
+        if function is not None:
+            gauge.set_function(function)
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(name, Histogram, lambda: Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.render() for metric in metrics)
+
+
+# 프로세스 기본 registry
+registry = MetricsRegistry()
@@ -0,0 +1,64 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .metrics import MetricsRegistry
+from .metrics import registry as default_registry
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """Serves a registry on GET /metrics (Prometheus text format) from a background thread."""
+
+    def __init__(self, registry: MetricsRegistry | None = None, host: str = "0.0.0.0", port: int = 9100):
+        self.registry = registry or default_registry
+        self.host = host
+        self.port = port
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> bool:
+        """Start serving; returns False (and logs why) if the address cannot be bound.
+
+        Metrics are optional, so a port already taken by another process on
+        the host must not stop the service itself.
+        """
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass  # 수집 요청마다 로그를 남기지 않음
+
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            logger.error("Cannot serve metrics on %s:%d: %s", self.host, self.port, e)
+            return False
+        self._server.daemon_threads = True
+        # port 0이면 OS가 고른 port
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        logger.info("Serving metrics on http://%s:%d/metrics", self.host, self.port)
+        return True
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
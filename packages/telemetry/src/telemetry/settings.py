@@ -0,0 +1,35 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class MetricsSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="METRICS_",
+        env_file=".env",
+        extra="ignore",
+    )
+
+    # Prometheus가 수집할 /metrics 엔드포인트 (port가 0이면 비활성화)
+    # 서비스마다 env_prefix와 기본 port를 바꾼 하위 클래스를 사용 (같은 호스트에서 port가 겹치지 않도록)
+    host: str = "0.0.0.0"
+    port: int = 9100
+
+
+class LogSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="LOG_",
+        env_file=".env",
+        extra="ignore",
+    )
+
+    level: str = "INFO"
+    # 모듈별 level (logger 이름 -> level). 예: LOG_LEVELS='{"tts_bot.playback": "DEBUG", "discord": "WARNING"}'
+    # 기본값은 연결/인증 과정마다 INFO를 남기는 라이브러리를 줄임 (LOG_LEVELS를 지정하면 대체됨)
+    levels: dict[str, str] = {"pika": "WARNING", "botocore": "WARNING"}
+    # text: 사람이 읽는 한 줄, json: 한 줄에 JSON 객체 하나 (로그 수집기용)
+    format: Literal["text", "json"] = "text"
+    # 같은 위치의 DEBUG 로그는 초당 이 개수까지만 출력 (0이면 제한 없음)
+    debug_rate: float = 5.0
+    # 출력 스레드가 밀렸을 때 쌓아 둘 최대 로그 수. 넘치면 버림 (이벤트 루프가 출력을 기다리지 않음)
+    queue_size: int = 10000
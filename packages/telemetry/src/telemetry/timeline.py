@@ -0,0 +1,27 @@
+"""Timestamps that travel with a request from the bot to the worker and back.
+
+Each process marks the events it sees in a dict that is sent along in the
+message headers or completion fields, so the bot can compute end-to-end
+latency and the time spent in each hop. Times are stored as integer epoch
+milliseconds because AMQP headers (pika) cannot carry floats. Events marked
+on different hosts are only as comparable as their clocks are synchronized.
+"""
+
+import time
+from collections.abc import Mapping
+
+Timeline = dict[str, int]
+
+
+def mark(timeline: Timeline, event: str, at: float | None = None) -> Timeline:
+    """Record event at epoch seconds at (default: now)."""
+    timeline[event] = int((at if at is not None else time.time()) * 1000)
+    return timeline
+
+
+def elapsed(timeline: Mapping[str, int] | None, start: str, end: str) -> float | None:
+    """Seconds from start to end, or None if either event is missing."""
+    if not timeline or start not in timeline or end not in timeline:
+        return None
+    # 호스트 간 시계 차이로 음수가 되는 경우는 0으로
+    return max(0.0, (timeline[end] - timeline[start]) / 1000)
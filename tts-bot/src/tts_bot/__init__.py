@@ -1,7 +1,8 @@
-from .settings import BotSettings
+from .settings import BotMetricsSettings, BotSettings
 from .bot import TTSBot
 
 __all__ = [
     "BotSettings",
+    "BotMetricsSettings",
     "TTSBot",
 ]
@@ -1,8 +1,17 @@
+import logging
+
 import discord
+from telemetry import configure_logging
+
 from .bot import TTSBot
 
+logger = logging.getLogger(__name__)
+
 
 def main() -> None:
+    # 로그는 큐에 넣고 별도 스레드가 출력 (이벤트 루프가 stdout 쓰기를 기다리지 않음)
+    configure_logging()
+
     # Load opus library for voice support
     if not discord.opus.is_loaded():
         # Try to load opus from homebrew path
@@ -13,7 +22,7 @@ def main() -> None:
                 # Fallback to system path
                 discord.opus.load_opus('libopus.0.dylib')
             except Exception:
-                print("Warning: Could not load opus library. Voice support may not work.")
+                logger.warning("Could not load opus library. Voice support may not work.")
 
     bot = TTSBot()
     bot.run_bot()
@@ -1,9 +1,22 @@
+import logging
+
 import discord
 from discord.ext import commands
-from minio import MinIOClient, MinIOSettings
-from rabbitmq import RabbitMQConnection, RabbitMQConsumer, RabbitMQPublisher, RabbitMQSettings
+from minio import AsyncMinIOClient, MinIOSettings
+from rabbitmq import (
+    AsyncConfirmPublisher,
+    AsyncRabbitMQConnection,
+    RabbitMQConnection,
+    RabbitMQConsumer,
+    RabbitMQSettings,
+    Topology,
+)
+from telemetry import MetricsServer, MetricsSettings
+
+from .cache import GuildConfigIndex, UserSettingsCache
+from .settings import BotMetricsSettings, BotSettings
 
-from .settings import BotSettings
+logger = logging.getLogger(__name__)
 
 COGS = [
     "tts_bot.cogs.voice",
@@ -17,6 +30,7 @@ class TTSBot(commands.Bot):
         bot_settings: BotSettings | None = None,
         minio_settings: MinIOSettings | None = None,
         rabbitmq_settings: RabbitMQSettings | None = None,
+        metrics_settings: MetricsSettings | None = None,
     ):
         intents = discord.Intents.default()
         intents.message_content = True
@@ -25,34 +39,53 @@ class TTSBot(commands.Bot):
         super().__init__(command_prefix="!", intents=intents)
 
         self.bot_settings = bot_settings or BotSettings()
-        self.minio = MinIOClient(minio_settings)
+        # 음성 다운로드는 이벤트 루프에서 여러 개를 동시에 진행
+        self.minio = AsyncMinIOClient(minio_settings)
 
-        # publisher와 consumer는 별도 connection 사용 (pika는 thread-safe하지 않음)
-        self._publisher_conn = RabbitMQConnection(rabbitmq_settings)
-        self._consumer_conn = RabbitMQConnection(rabbitmq_settings)
-        self.publisher = RabbitMQPublisher(self._publisher_conn)
+        # publisher는 이벤트 루프 위에서 동작하는 비동기 connection 사용 (broker I/O가 루프를 막지 않음)
+        # publisher confirm으로 재연결 중 유실된 메시지는 자동으로 재발행
+        # consumer는 별도 스레드에서 blocking connection 사용 (pika는 thread-safe하지 않음)
+        # 두 connection은 topology를 공유하여 각자 한 번씩만 선언하고 재연결 시 다시 적용
+        self.rabbitmq_topology = Topology()
+        self._publisher_conn = AsyncRabbitMQConnection(rabbitmq_settings, self.rabbitmq_topology)
+        self._consumer_conn = RabbitMQConnection(rabbitmq_settings, self.rabbitmq_topology)
+        self.publisher = AsyncConfirmPublisher(self._publisher_conn)
         self.consumer = RabbitMQConsumer(self._consumer_conn)
 
+        self.guild_config = GuildConfigIndex()
+        self.user_settings = UserSettingsCache()
+
+        # 단계별 지연 시간, 대기열 길이, DB 연결 풀 사용량을 Prometheus 형식으로 제공
+        self.metrics_settings = metrics_settings or BotMetricsSettings()
+        self.metrics_server = MetricsServer(host=self.metrics_settings.host, port=self.metrics_settings.port)
+
     async def setup_hook(self) -> None:
+        if self.metrics_settings.port:
+            self.metrics_server.start()
+        await self.guild_config.start()
+        self.user_settings.start()
+
         for cog in COGS:
             await self.load_extension(cog)
 
         # Sync slash commands
         synced = await self.tree.sync()
-        print(f"Slash commands synced: {len(synced)} commands", flush=True)
-        for cmd in synced:
-            print(f"  - /{cmd.name}", flush=True)
+        logger.info("Slash commands synced: %s", ", ".join(f"/{cmd.name}" for cmd in synced))
 
     async def on_ready(self) -> None:
-        print(f"Logged in as {self.user}", flush=True)
-        print(f"Bot is ready! Guilds: {len(self.guilds)}", flush=True)
+        logger.info("Logged in as %s, guilds: %d", self.user, len(self.guilds))
 
     def run_bot(self) -> None:
-        self.run(self.bot_settings.token)
+        # 로깅은 configure_logging()으로 설정되어 있으므로 discord.py가 따로 handler를 붙이지 않게 함
+        self.run(self.bot_settings.token, log_handler=None)
 
     async def close(self) -> None:
         self.consumer.close()
-        self.publisher.close()
+        await self.publisher.close()
         self._consumer_conn.close()
-        self._publisher_conn.close()
+        await self._publisher_conn.close()
+        await self.guild_config.close()
+        await self.user_settings.close()
+        await self.minio.close()
+        self.metrics_server.stop()
         await super().close()
@@ -0,0 +1,6 @@
+"""In-memory caches for hot-path lookups."""
+
+from .guild_config import GuildConfig, GuildConfigIndex
+from .user_settings import UserSettingsCache, VoiceSettings
+
+__all__ = ["GuildConfig", "GuildConfigIndex", "UserSettingsCache", "VoiceSettings"]
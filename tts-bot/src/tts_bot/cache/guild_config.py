@@ -0,0 +1,169 @@
+import asyncio
+import logging
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+
+from postgres import PostgresListener, notify
+from postgres.connection import get_async_session_context
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from tts_bot.repository import GuildChannelRepository, GuildSettingsRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GuildConfig:
+    """TTS configuration of a single guild."""
+
+    channel_ids: frozenset[int] = field(default_factory=frozenset)
+    default_voice_channel_id: int | None = None
+
+
+EMPTY_CONFIG = GuildConfig()
+
+
+class GuildConfigIndex:
+    """In-memory index of guild_channels and guild_settings.
+
+    The whole table set is bulk-loaded at startup so on_message can answer
+    "is this channel enabled?" and "where should I auto-join?" without a
+    database round trip. Guilds with nothing configured are cached as an
+    empty config (negative cache).
+
+    Changes made through the bot commands are applied locally once their
+    transaction commits and broadcast with Postgres NOTIFY. Other bot
+    processes mark the guild stale and reload it from the database on next
+    access. Every change or invalidation bumps the guild's generation; a
+    reload that was already running when the generation changed does not
+    mark the guild fresh, so the change is not lost.
+    """
+
+    NOTIFY_CHANNEL = "tts_guild_config"
+
+    def __init__(self):
+        self._configs: dict[int, GuildConfig] = {}
+        self._stale: set[int] = set()
+        self._generations: dict[int, int] = {}
+        self._loading: dict[int, asyncio.Future[GuildConfig]] = {}
+        self._loaded = False
+        self._instance_id = uuid.uuid4().hex
+        self._listener = PostgresListener(self.NOTIFY_CHANNEL, self._on_notification, on_reconnect=self.load)
+
+    async def start(self) -> None:
+        await self.load()
+        self._listener.start()
+
+    async def close(self) -> None:
+        await self._listener.close()
+
+    async def load(self) -> None:
+        """Bulk-load every guild's configuration, replacing the current index."""
+        channels: dict[int, set[int]] = {}
+        voice_channels: dict[int, int | None] = {}
+        generations = dict(self._generations)
+
+        async with get_async_session_context() as session:
+            for guild_channel in await GuildChannelRepository(session).get_all_channels():
+                channels.setdefault(guild_channel.guild_id, set()).add(guild_channel.channel_id)
+            for settings in await GuildSettingsRepository(session).get_all_guild_settings():
+                voice_channels[settings.guild_id] = settings.default_voice_channel_id
+
+        self._configs = {
+            guild_id: GuildConfig(frozenset(channels.get(guild_id, ())), voice_channels.get(guild_id))
+            for guild_id in channels.keys() | voice_channels.keys()
+        }
+        # 로드하는 사이 변경/무효화된 길드는 stale로 남겨 다음 접근 때 다시 조회
+        self._stale = {guild_id for guild_id in self._generations if self._changed_since(guild_id, generations)}
+        self._loaded = True
+        logger.info("Loaded configuration for %d guilds", len(self._configs))
+
+    async def get(self, guild_id: int) -> GuildConfig:
+        if guild_id not in self._stale:
+            config = self._configs.get(guild_id)
+            if config is not None:
+                return config
+            # 전체 로드 이후에 없는 길드는 설정이 없는 길드
+            if self._loaded:
+                return EMPTY_CONFIG
+
+        # 동시에 들어온 미스는 하나의 DB 조회를 공유
+        future = self._loading.get(guild_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._loading[guild_id] = future
+            generation = self._generations.get(guild_id, 0)
+            try:
+                config = await self._load_guild(guild_id)
+                # 조회하는 사이 무효화 알림이 왔으면 stale을 유지 (기다리던 호출에는 조회한 값을 돌려줌)
+                if self._generations.get(guild_id, 0) == generation:
+                    self._configs[guild_id] = config
+                    self._stale.discard(guild_id)
+                future.set_result(config)
+            except Exception as e:
+                future.set_exception(e)
+                # 아무도 기다리지 않는 future의 예외 경고 방지
+                future.exception()
+                raise
+            finally:
+                del self._loading[guild_id]
+        return await future
+
+    async def is_channel_enabled(self, guild_id: int, channel_id: int) -> bool:
+        return channel_id in (await self.get(guild_id)).channel_ids
+
+    async def get_default_voice_channel(self, guild_id: int) -> int | None:
+        return (await self.get(guild_id)).default_voice_channel_id
+
+    async def _load_guild(self, guild_id: int) -> GuildConfig:
+        async with get_async_session_context() as session:
+            guild_channels = await GuildChannelRepository(session).get_guild_channels(guild_id)
+            default_voice_channel_id = await GuildSettingsRepository(session).get_default_voice_channel(guild_id)
+        return GuildConfig(frozenset(c.channel_id for c in guild_channels), default_voice_channel_id)
+
+    async def add_channel(self, session: AsyncSession, guild_id: int, channel_id: int) -> None:
+        await self._update(
+            session, guild_id, lambda config: replace(config, channel_ids=config.channel_ids | {channel_id})
+        )
+
+    async def remove_channel(self, session: AsyncSession, guild_id: int, channel_id: int) -> None:
+        await self._update(
+            session, guild_id, lambda config: replace(config, channel_ids=config.channel_ids - {channel_id})
+        )
+
+    async def set_default_voice_channel(self, session: AsyncSession, guild_id: int, channel_id: int) -> None:
+        await self._update(session, guild_id, lambda config: replace(config, default_voice_channel_id=channel_id))
+
+    def invalidate(self, guild_id: int) -> None:
+        self._bump(guild_id)
+        self._stale.add(guild_id)
+
+    async def _update(self, session: AsyncSession, guild_id: int, update: Callable[[GuildConfig], GuildConfig]) -> None:
+        """Apply update to the index when session commits (never on rollback) and notify other processes."""
+        event.listen(session.sync_session, "after_commit", lambda _: self._apply(guild_id, update), once=True)
+        await self._broadcast(session, guild_id)
+
+    def _apply(self, guild_id: int, update: Callable[[GuildConfig], GuildConfig]) -> None:
+        self._bump(guild_id)
+        if guild_id in self._stale or guild_id in self._loading:
+            # 로컬 값이 오래되었거나 조회 중이면 커밋된 DB에서 다시 읽음
+            self._stale.add(guild_id)
+            return
+        self._configs[guild_id] = update(self._configs.get(guild_id, EMPTY_CONFIG))
+
+    def _bump(self, guild_id: int) -> None:
+        self._generations[guild_id] = self._generations.get(guild_id, 0) + 1
+
+    def _changed_since(self, guild_id: int, generations: dict[int, int]) -> bool:
+        return self._generations.get(guild_id, 0) != generations.get(guild_id, 0)
+
+    async def _broadcast(self, session: AsyncSession, guild_id: int) -> None:
+        await notify(session, self.NOTIFY_CHANNEL, f"{self._instance_id}:{guild_id}")
+
+    def _on_notification(self, payload: str) -> None:
+        instance_id, _, guild_id = payload.partition(":")
+        # 자신이 보낸 알림은 이미 로컬에 반영됨
+        if instance_id == self._instance_id:
+            return
+        self.invalidate(int(guild_id))
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from postgres.connection import get_async_session_context
+from tts_bot.repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+UserKey = tuple[int, int]  # (discord_id, guild_id)
+
+
+@dataclass(frozen=True)
+class VoiceSettings:
+    rate: int = 100
+    pitch: int = 0
+
+
+DEFAULT_VOICE_SETTINGS = VoiceSettings()
+
+
+class UserSettingsCache:
+    """Bounded, TTL-evicting cache of per-user voice settings.
+
+    Concurrent misses for the same user share a single database load.
+    Users seen for the first time get the default settings immediately and
+    are created in the database later by a periodic batched upsert, so the
+    steady-state message path does not touch the database at all.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 600.0, flush_interval: float = 5.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+        self._entries: OrderedDict[UserKey, tuple[VoiceSettings, float]] = OrderedDict()
+        self._loading: dict[UserKey, asyncio.Future[VoiceSettings]] = {}
+        self._pending_creates: dict[UserKey, str] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def get(self, discord_id: int, guild_id: int, username: str) -> VoiceSettings:
+        key = (discord_id, guild_id)
+        entry = self._entries.get(key)
+        if entry is not None:
+            settings, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return settings
+            del self._entries[key]
+
+        future = self._loading.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._loading[key] = future
+            try:
+                settings = await self._load(key, username)
+                # 로딩 중에 set()으로 갱신되었으면 그 값을 우선
+                if key not in self._entries:
+                    self._store(key, settings)
+                future.set_result(self._entries[key][0])
+            except Exception as e:
+                future.set_exception(e)
+                # 아무도 기다리지 않는 future의 예외 경고 방지
+                future.exception()
+                raise
+            finally:
+                del self._loading[key]
+        return await future
+
+    def set(self, discord_id: int, guild_id: int, rate: int, pitch: int) -> None:
+        """Update cached settings immediately, e.g. after the user changed them."""
+        key = (discord_id, guild_id)
+        self._store(key, VoiceSettings(rate, pitch))
+
+    def invalidate(self, discord_id: int, guild_id: int) -> None:
+        self._entries.pop((discord_id, guild_id), None)
+
+    async def _load(self, key: UserKey, username: str) -> VoiceSettings:
+        discord_id, guild_id = key
+        async with get_async_session_context() as session:
+            user = await UserRepository(session).get_user(discord_id, guild_id)
+
+        if user is None:
+            # 신규 유저는 기본값으로 바로 응답하고 생성은 배치로 처리
+            self._pending_creates[key] = username
+            return DEFAULT_VOICE_SETTINGS
+        return VoiceSettings(user.rate, user.pitch)
+
+    def _store(self, key: UserKey, settings: VoiceSettings) -> None:
+        self._entries[key] = (settings, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def flush(self) -> None:
+        """Create all pending new users with one batched upsert."""
+        if not self._pending_creates:
+            return
+
+        pending = self._pending_creates
+        self._pending_creates = {}
+        try:
+            async with get_async_session_context() as session:
+                await UserRepository(session).create_users_if_missing(
+                    [(discord_id, guild_id, username) for (discord_id, guild_id), username in pending.items()]
+                )
+        except Exception:
+            # 실패한 항목은 다음 flush에서 재시도
+            for key, username in pending.items():
+                self._pending_creates.setdefault(key, username)
+            raise
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("Failed to flush new users: %s", e)
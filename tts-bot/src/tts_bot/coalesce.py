@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# 병합된 메시지 사이 구분자. 워커가 SSML break로 바꾸고, 긴 텍스트를 나눌 때도 문장 경계로 사용
+BURST_SEPARATOR = "\n"
+
+
+@dataclass(frozen=True)
+class BurstKey:
+    """Messages are only merged if all of these match."""
+
+    guild_id: int
+    channel_id: int
+    author_id: int
+    rate: int
+    pitch: int
+
+
+@dataclass
+class _Burst:
+    key: BurstKey
+    # 첫 메시지를 받은 시각 (epoch 초)
+    received_at: float
+    texts: list[str] = field(default_factory=list)
+    length: int = 0
+    timer: asyncio.TimerHandle | None = None
+
+
+class BurstCoalescer:
+    """Merges rapid consecutive messages into one synthesis request.
+
+    While a guild is busy (audio playing or requests in flight), a message
+    is held for up to window seconds; further messages from the same author
+    and channel with the same voice settings are appended to it, and each
+    one restarts the window. The burst is flushed when the window expires,
+    when it reaches max_chars, or when a message with a different key
+    arrives in the same guild (so playback order is preserved). When the
+    guild is idle, messages are flushed immediately and never delayed.
+
+    flush receives the key, the merged text and when the burst's first
+    message was received.
+    """
+
+    def __init__(self, flush: Callable[[BurstKey, str, float], None], window: float = 0.5, max_chars: int = 500):
+        self.flush = flush
+        self.window = window
+        self.max_chars = max_chars
+        self._bursts: dict[int, _Burst] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0
+
+    def add(self, key: BurstKey, text: str, busy: bool, received_at: float | None = None) -> None:
+        received_at = received_at if received_at is not None else time.time()
+        burst = self._bursts.get(key.guild_id)
+        if burst is not None and (burst.key != key or burst.length + len(text) > self.max_chars):
+            self._flush(key.guild_id)
+            burst = None
+
+        if burst is None:
+            if not self.enabled or not busy:
+                self.flush(key, text, received_at)
+                return
+            burst = self._bursts[key.guild_id] = _Burst(key, received_at)
+
+        burst.texts.append(text)
+        burst.length += len(text) + len(BURST_SEPARATOR)
+        if burst.timer is not None:
+            burst.timer.cancel()
+        burst.timer = asyncio.get_running_loop().call_later(self.window, self._flush, key.guild_id)
+
+    def _flush(self, guild_id: int) -> None:
+        burst = self._bursts.pop(guild_id, None)
+        if burst is None:
+            return
+        if burst.timer is not None:
+            burst.timer.cancel()
+        if len(burst.texts) > 1:
+            logger.debug("Merged %d messages", len(burst.texts), extra={"guild_id": guild_id})
+        self.flush(burst.key, BURST_SEPARATOR.join(burst.texts), burst.received_at)
+
+    def close(self) -> None:
+        """Flush every pending burst."""
+        for guild_id in list(self._bursts):
+            self._flush(guild_id)
@@ -1,18 +1,37 @@
 import asyncio
+import logging
 import threading
-from io import BytesIO
+import time
+import uuid
+from dataclasses import dataclass
 from typing import Any, TYPE_CHECKING
-import re
 import discord
 from discord.ext import commands
-from minio import MinIOClient
-from rabbitmq import RabbitMQConsumer, RabbitMQPublisher
-from postgres.connection import get_async_session_context
-from tts_bot.repository import UserRepository, GuildChannelRepository, GuildSettingsRepository
+from minio import AsyncMinIOClient
+from pika.spec import BasicProperties
+from rabbitmq import AsyncConfirmPublisher, RabbitMQConsumer
+from telemetry import bind_log_context, elapsed, log_context, mark, registry
+from tts_bot.coalesce import BurstCoalescer, BurstKey
+from tts_bot.metrics import STAGE_SECONDS, TIME_TO_FIRST_AUDIO
+from tts_bot.normalize import TextNormalizer
+from tts_bot.playback import AudioClip, GuildPlayer, RemoteAudio, ReorderBuffer, StreamingBuffer, guess_content_type
 
 if TYPE_CHECKING:
     from ..bot import TTSBot
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Stream:
+    """A streamed completion being received; its messages may arrive in any order after a republish."""
+
+    # 청크 없이 종료 표시가 먼저 오면 None
+    buffer: StreamingBuffer | None
+    expires: float
+    started: bool = False
+    ended: bool = False
+
 
 class TTSCog(commands.Cog):
     PUBLISH_EXCHANGE = "tts"
@@ -20,16 +39,67 @@ class TTSCog(commands.Cog):
     CONSUME_EXCHANGE = "tts"
     CONSUME_QUEUE = "tts.bot"
     CONSUME_ROUTING_KEY = "tts.bot"
+    # 완료 메시지는 바로 처리되므로(다운로드는 이벤트 루프에서) broker가 미리 보내 두도록 함
+    CONSUME_PREFETCH = 32
+    REORDER_HOLD_TIMEOUT = 3.0  # 순서가 빠진 음성을 기다리는 최대 시간 (초)
+    STREAM_IDLE_TIMEOUT = 30.0  # 재생 기한이 지난 스트림을 메시지 없이 유지하는 최대 시간 (초)
+    SKIPPED_NOTICE = "메시지 {count}개를 건너뛰었습니다"
 
     def __init__(self, bot: "TTSBot"):
         self.bot = bot
-        self.minio: MinIOClient = bot.minio
-        self.publisher: RabbitMQPublisher = bot.publisher
+        self.minio: AsyncMinIOClient = bot.minio
+        self.publisher: AsyncConfirmPublisher = bot.publisher
         self.consumer: RabbitMQConsumer = bot.consumer
 
+        self.normalizer = TextNormalizer(max_chars=bot.bot_settings.max_text_chars)
+        self.coalescer = BurstCoalescer(
+            self._publish_burst,
+            window=bot.bot_settings.coalesce_window,
+            max_chars=bot.bot_settings.coalesce_max_chars,
+        )
         self._consumer_thread: threading.Thread | None = None
-        self._audio_queues: dict[int, asyncio.Queue[bytes]] = {}
-        self._player_tasks: dict[int, asyncio.Task] = {}
+        # 길드별 플레이어 (다음 음성을 미리 준비해 간격 없이 이어서 재생)
+        self._players: dict[int, GuildPlayer] = {}
+
+        # 길드별 요청 순번. 워커가 병렬로 합성해도 완료 메시지에 담겨 돌아온 순번으로 재생 순서를 맞춤
+        # epoch는 재시작 전 프로세스가 보낸 요청을 구분하기 위한 값
+        self._sequence_epoch = uuid.uuid4().hex
+        self._sequences: dict[int, int] = {}
+        self._reorder_buffers: dict[int, ReorderBuffer[AudioClip | None]] = {}
+        # 길드별로 받은 가장 큰 순번 (발급한 순번보다 작으면 합성 중인 요청이 있음)
+        self._received_sequences: dict[int, int] = {}
+        # 스트리밍 중인 음성 (consumer 스레드에서만 접근)
+        self._streams: dict[str, _Stream] = {}
+        # MinIO 다운로드 (이벤트 루프에서 동시에 진행, 동시 다운로드 수 제한)
+        self._download_slots = asyncio.Semaphore(bot.bot_settings.download_concurrency)
+        self._downloads: set[asyncio.Task] = set()
+        # 재생이 끝난 일회용 음성 삭제
+        self._deletes: set[asyncio.Task] = set()
+        self._register_gauges()
+
+    def _register_gauges(self) -> None:
+        registry.gauge(
+            "tts_bot_queued_clips",
+            "Clips waiting to be played in all guilds",
+            function=lambda: sum(player.queued for player in self._players.values()),
+        )
+        registry.gauge(
+            "tts_bot_requests_in_flight",
+            "Requests published and not answered yet",
+            function=lambda: sum(
+                sequence - self._received_sequences.get(guild_id, 0) for guild_id, sequence in self._sequences.items()
+            ),
+        )
+        registry.gauge(
+            "tts_bot_downloads_in_flight", "MinIO downloads in progress", function=lambda: len(self._downloads)
+        )
+
+    async def cog_unload(self) -> None:
+        self.coalescer.close()
+        for task in self._downloads:
+            task.cancel()
+        for player in self._players.values():
+            player.close()
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
@@ -37,112 +107,174 @@ class TTSCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
+        received_at = time.time()
         if message.author.bot:
             return
 
         if not message.guild:
             return
 
+        # 이 메시지를 처리하는 동안 남기는 로그에 붙는 필드 (이벤트마다 별도 태스크이므로 다른 메시지와 섞이지 않음)
+        bind_log_context(guild_id=message.guild.id, message_id=message.id)
+
         # 명령어는 처리하지 않음
         if message.content.startswith(self.bot.command_prefix):
             return
 
-        # 링크 제거 필터
-        message.content = re.sub(r'https?://\S+', '', message.content)
-
-        # 멘션 제거 필터
-        message.content = re.sub(r'<[^>]*>', '', message.content)
+        # Check if channel is registered for TTS first (정규화는 TTS가 켜진 채널에서만 수행)
+        try:
+            with STAGE_SECONDS.time(stage="db_channel_lookup"):
+                enabled = await self.bot.guild_config.is_channel_enabled(message.guild.id, message.channel.id)
+            if not enabled:
+                logger.debug("Channel %s not enabled for TTS", message.channel.id)
+                return
+        except Exception as e:
+            logger.error("Failed to check channel registration: %s", e)
+            return
 
-        # 특수문자 제거 필터
-        message.content = re.sub(r'[^\w\s]|_', '', message.content)
+        # 링크, 멘션, 이모지, 코드 블록, 특수문자 제거 및 반복 자모/길이 제한
+        with STAGE_SECONDS.time(stage="normalize"):
+            text = self.normalizer.normalize(message.content)
 
         # 빈 메시지는 무시
-        if not message.content.strip():
+        if not text:
             return
 
-        print(f"[MESSAGE] Received message from {message.author}: '{message.content}'", flush=True)
-
-        # Check if channel is registered for TTS first
-        try:
-            async with get_async_session_context() as session:
-                channel_repo = GuildChannelRepository(session)
-                if not await channel_repo.is_channel_enabled(message.guild.id, message.channel.id):
-                    print(f"[MESSAGE] Channel {message.channel.id} not enabled for TTS", flush=True)
-                    return
-        except Exception as e:
-            print(f"[ERROR] Failed to check channel registration: {e}")
-            return
+        # 메시지 내용은 로그에 남기지 않음 (guild_id, message_id는 context에 있음)
+        logger.debug("Received message from user %s (%d chars)", message.author.id, len(text))
 
         # 봇이 음성 채널에 연결되어 있지 않으면 기본 음성 채널에 자동 입장
         if not message.guild.voice_client:
             try:
-                async with get_async_session_context() as session:
-                    settings_repo = GuildSettingsRepository(session)
-                    default_voice_channel_id = await settings_repo.get_default_voice_channel(message.guild.id)
-
-                    if not default_voice_channel_id:
-                        print(f"[VOICE] No default voice channel set for guild {message.guild.id}", flush=True)
-                        return
-
-                    # Get voice channel
-                    voice_channel = message.guild.get_channel(default_voice_channel_id)
-                    if not voice_channel:
-                        print(f"[VOICE] Default voice channel {default_voice_channel_id} not found", flush=True)
-                        return
-
-                    # Join the voice channel (same as !join command)
-                    print(f"[VOICE] Auto-joining voice channel {voice_channel.name}", flush=True)
-                    await voice_channel.connect(reconnect=True, timeout=60.0)
-                    print(f"[VOICE] Successfully joined {voice_channel.name}", flush=True)
-
-                    # Wait for voice client to be fully ready
-                    max_wait = 5  # 최대 5초 대기
-                    for i in range(max_wait * 10):  # 0.1초씩 체크
-                        if message.guild.voice_client and message.guild.voice_client.is_connected():
-                            print(f"[VOICE] Voice client is ready after {i * 0.1:.1f}s", flush=True)
-                            break
-                        await asyncio.sleep(0.1)
-                    else:
-                        print(f"[ERROR] Voice client not ready after {max_wait}s wait", flush=True)
-                        return
-            except Exception as e:
-                print(f"[ERROR] Failed to auto-join voice channel: {e}")
-                import traceback
-                traceback.print_exc()
+                default_voice_channel_id = await self.bot.guild_config.get_default_voice_channel(message.guild.id)
+
+                if not default_voice_channel_id:
+                    logger.info("No default voice channel set")
+                    return
+
+                # Get voice channel
+                voice_channel = message.guild.get_channel(default_voice_channel_id)
+                if not voice_channel:
+                    logger.warning("Default voice channel %s not found", default_voice_channel_id)
+                    return
+
+                # Join the voice channel (same as !join command)
+                logger.info("Auto-joining voice channel %s", voice_channel.name)
+                await voice_channel.connect(reconnect=True, timeout=60.0)
+                logger.info("Successfully joined %s", voice_channel.name)
+
+                # Wait for voice client to be fully ready
+                max_wait = 5  # 최대 5초 대기
+                for i in range(max_wait * 10):  # 0.1초씩 체크
+                    if message.guild.voice_client and message.guild.voice_client.is_connected():
+                        logger.info("Voice client is ready after %.1fs", i * 0.1)
+                        break
+                    await asyncio.sleep(0.1)
+                else:
+                    logger.error("Voice client not ready after %ds wait", max_wait)
+                    return
+            except Exception:
+                logger.exception("Failed to auto-join voice channel")
                 return
 
         # Verify voice client is connected
         if not message.guild.voice_client or not message.guild.voice_client.is_connected():
-            print(f"[ERROR] Voice client not connected, skipping TTS", flush=True)
+            logger.error("Voice client not connected, skipping TTS")
             return
 
-        # Get or create user settings
+        # Get user settings (cached, new users are created in the background)
         try:
-            async with get_async_session_context() as session:
-                user_repository = UserRepository(session)
-                user = await user_repository.get_or_create_user(
+            with STAGE_SECONDS.time(stage="db_user_lookup"):
+                voice_settings = await self.bot.user_settings.get(
                     discord_id=message.author.id,
                     guild_id=message.guild.id,
                     username=str(message.author)
                 )
 
-                print(f"[DEBUG] User retrieved: id={user.id}, discord_id={user.discord_id}, rate={user.rate}, pitch={user.pitch}")
+            logger.debug(
+                "User settings: discord_id=%s, rate=%s, pitch=%s",
+                message.author.id,
+                voice_settings.rate,
+                voice_settings.pitch,
+            )
 
-                # Publish message with user's voice settings
-                self.publisher.publish(
+            # 재생 중인 길드에서 같은 사용자가 연달아 보낸 짧은 메시지는 하나의 요청으로 합쳐서 발행
+            key = BurstKey(
+                guild_id=message.guild.id,
+                channel_id=message.channel.id,
+                author_id=message.author.id,
+                rate=voice_settings.rate,
+                pitch=voice_settings.pitch,
+            )
+            self.coalescer.add(key, text, busy=self._is_guild_busy(message.guild), received_at=received_at)
+        except Exception:
+            logger.exception("Failed to process message")
+
+    def _is_guild_busy(self, guild: discord.Guild) -> bool:
+        """True if audio is playing, queued, or still being synthesized for the guild."""
+        player = self._players.get(guild.id)
+        if player is not None and player.is_busy:
+            return True
+        return self._sequences.get(guild.id, 0) > self._received_sequences.get(guild.id, 0)
+
+    def _publish_burst(self, key: BurstKey, text: str, received_at: float) -> None:
+        # 순번은 태스크의 첫 단계에서 매겨지므로 생성 순서대로 발급됨
+        self.bot.loop.create_task(self._publish_tts(key.guild_id, text, key.rate, key.pitch, received_at))
+
+    def _publish_skipped_notice(self, guild_id: int, count: int) -> None:
+        """Called by a guild player that dropped its backlog (summarize overflow policy)."""
+        self.bot.loop.create_task(self._publish_tts(guild_id, self.SKIPPED_NOTICE.format(count=count), 100, 0))
+
+    async def _publish_tts(
+        self, guild_id: int, text: str, rate: int, pitch: int, received_at: float | None = None
+    ) -> None:
+        sequence = self._next_sequence(guild_id)
+        # 요청마다 trace id를 붙여 워커와 봇의 로그를 이어 볼 수 있게 함 (완료 메시지로 돌아옴)
+        trace_id = uuid.uuid4().hex[:16]
+        bind_log_context(guild_id=guild_id, trace_id=trace_id)
+        # 단계별 시각은 헤더로 워커에 전달되고 완료 메시지로 돌아옴 (재생 시작까지의 시간 계산용)
+        timeline = mark({}, "published")
+        if received_at is not None:
+            mark(timeline, "received", received_at)
+            STAGE_SECONDS.observe(elapsed(timeline, "received", "published"), stage="handle")
+        headers: dict[str, Any] = {"trace_id": trace_id, "timeline": timeline}
+        # 요청 유효 시간이 지나면 워커는 합성을 건너뛰고 봇은 재생하지 않음
+        ttl = self.bot.bot_settings.request_ttl
+        if ttl > 0:
+            # pika는 헤더에 float을 담지 못하므로 epoch 밀리초 정수로 보냄
+            headers["deadline"] = int((time.time() + ttl) * 1000)
+        try:
+            with STAGE_SECONDS.time(stage="publish"):
+                await self.publisher.publish(
                     exchange_name=self.PUBLISH_EXCHANGE,
                     routing_key=self.PUBLISH_ROUTING_KEY,
                     message={
-                        "text": message.content,
-                        "guild_id": message.guild.id,
-                        "rate": user.rate,
-                        "pitch": user.pitch,
+                        "text": text,
+                        "guild_id": guild_id,
+                        "rate": rate,
+                        "pitch": pitch,
+                        "seq": sequence,
+                        "seq_epoch": self._sequence_epoch,
                     },
+                    headers=headers,
                 )
-        except Exception as e:
-            print(f"[ERROR] Failed to process message: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Failed to publish TTS request")
+            self._release_sequence(guild_id, sequence)
+
+    def _next_sequence(self, guild_id: int) -> int:
+        sequence = self._sequences.get(guild_id, 0) + 1
+        self._sequences[guild_id] = sequence
+        return sequence
+
+    def _release_sequence(self, guild_id: int, sequence: int) -> None:
+        """Give back the sequence of a request that was never published, so the guild is not left busy."""
+        if self._sequences.get(guild_id) == sequence:
+            # 뒤에 발급된 순번이 없으면 되돌림
+            self._sequences[guild_id] = sequence - 1
+        else:
+            # 뒤의 음성이 이 순번을 기다리지 않도록 건너뛴 요청으로 채움
+            self._receive_audio(guild_id, sequence, None)
 
     def _start_consumer_thread(self) -> None:
         self._consumer_thread = threading.Thread(target=self._consume_messages, daemon=True)
@@ -154,93 +286,260 @@ class TTSCog(commands.Cog):
             handler=self._handle_tts_response,
             exchange_name=self.CONSUME_EXCHANGE,
             routing_key=self.CONSUME_ROUTING_KEY,
+            prefetch_count=self.CONSUME_PREFETCH,
+            with_properties=True,
         )
         self.consumer.start_consuming()
 
-    def _handle_tts_response(self, message: dict[str, Any]) -> None:
-        object_name = message.get("object_name")
-        guild_id = message.get("guild_id")
+    def _handle_tts_response(self, message: dict[str, Any] | bytes, properties: BasicProperties) -> None:
+        # 작은 음성은 본문에 직접 담겨 오고(메타데이터는 헤더), 큰 음성은 MinIO object 이름이 JSON으로 옴
+        # 스트리밍 음성은 시작 메시지(JSON) 뒤에 번호가 붙은 청크와 종료 표시가 이어서 옴
+        # 기한이 지나 워커가 건너뛴 요청은 skipped 표시만 옴
+        object_name = None
+        delete_after_play = False
+        if isinstance(message, bytes):
+            fields = properties.headers or {}
+            if "stream_id" in fields:
+                self._handle_stream_chunk(fields, message)
+                return
+            audio_data = message
+            content_type = properties.content_type
+        elif "stream_id" in message:
+            fields = message
+            audio_data = self._start_stream(message["stream_id"], message.get("deadline"))
+            content_type = message.get("content_type")
+            if audio_data is None:
+                # 청크 없이 끝난 스트림 (합성 실패)은 순번만 채움
+                fields = {**message, "skipped": True}
+        elif message.get("skipped"):
+            fields = message
+            audio_data = content_type = None
+        else:
+            fields = message
+            object_name = message.get("object_name")
+            if not object_name:
+                return
+            audio_data = None
+            content_type = message.get("content_type") or guess_content_type(object_name)
+            # 캐시하지 않은 일회용 음성은 봇이 다 쓰면 바로 삭제 (워커의 보존 기간 정리는 봇이 죽은 경우의 대비)
+            delete_after_play = bool(message.get("delete_after_play"))
 
-        if not object_name or not guild_id:
+        guild_id = fields.get("guild_id")
+        if not guild_id:
             return
 
         guild_id = int(guild_id)
-        audio_data = self.minio.download_bytes(object_name)
-
-        self.bot.loop.call_soon_threadsafe(
-            lambda gid=guild_id, data=audio_data: self.bot.loop.create_task(
-                self._enqueue_audio(gid, data)
-            )
+        sequence = fields.get("seq") if fields.get("seq_epoch") == self._sequence_epoch else None
+        # 재생 기한은 epoch 밀리초로 오고 AudioClip은 epoch 초를 사용
+        deadline = fields["deadline"] / 1000 if fields.get("deadline") is not None else None
+        timeline = mark(dict(fields.get("timeline") or {}), "delivered")
+        delivery = elapsed(timeline, "completed", "delivered")
+        if delivery is not None:
+            STAGE_SECONDS.observe(delivery, stage="delivery")
+        # 이벤트 루프로 넘기는 콜백(다운로드 태스크 포함)은 이 context를 복사해 가므로 그쪽 로그에도 요청 필드가 붙음
+        with log_context(guild_id=guild_id, trace_id=fields.get("trace_id")):
+            clip = None
+            if audio_data is not None:
+                clip = AudioClip(audio_data, content_type, deadline, timeline)
+            elif not fields.get("skipped") and not (deadline is not None and time.time() > deadline):
+                # consumer 스레드는 다운로드를 기다리지 않고 바로 다음 완료 메시지를 처리
+                self.bot.loop.call_soon_threadsafe(
+                    self._start_download,
+                    guild_id,
+                    sequence,
+                    object_name,
+                    content_type,
+                    deadline,
+                    timeline,
+                    delete_after_play,
+                )
+                return
+            elif object_name and delete_after_play:
+                self.bot.loop.call_soon_threadsafe(self._delete_object, object_name)
+
+            # 건너뛴 요청도 순번은 전달해 뒤의 음성이 빈 순번을 기다리지 않게 함
+            self.bot.loop.call_soon_threadsafe(self._receive_audio, guild_id, sequence, clip)
+
+    def _start_download(
+        self,
+        guild_id: int,
+        sequence: int | None,
+        object_name: str,
+        content_type: str,
+        deadline: float | None,
+        timeline: dict[str, int],
+        delete_after_play: bool = False,
+    ) -> None:
+        task = self.bot.loop.create_task(
+            self._download_audio(guild_id, sequence, object_name, content_type, deadline, timeline, delete_after_play)
         )
-
-    async def _enqueue_audio(self, guild_id: int, audio_data: bytes) -> None:
-        if guild_id not in self._audio_queues:
-            self._audio_queues[guild_id] = asyncio.Queue()
-
-        await self._audio_queues[guild_id].put(audio_data)
-        queue_size = self._audio_queues[guild_id].qsize()
-        print(f"[AUDIO] Enqueued audio for guild {guild_id}, queue size: {queue_size}", flush=True)
-
-        # 플레이어 태스크가 없거나 완료되었으면 새로 시작
-        if guild_id not in self._player_tasks or self._player_tasks[guild_id].done():
-            print(f"[AUDIO] Starting new player loop for guild {guild_id}", flush=True)
-            self._player_tasks[guild_id] = self.bot.loop.create_task(self._player_loop(guild_id))
-        else:
-            print(f"[AUDIO] Player loop already running for guild {guild_id}", flush=True)
-
-    async def _player_loop(self, guild_id: int) -> None:
-        queue = self._audio_queues[guild_id]
-
-        while True:
-            try:
-                # Wait for audio with timeout to check if we should stop
-                audio_data = await asyncio.wait_for(queue.get(), timeout=0.1)
-                await self._play_audio(guild_id, audio_data)
-            except asyncio.TimeoutError:
-                # Check if queue is empty and voice client is still connected
-                if queue.empty():
-                    guild = self.bot.get_guild(guild_id)
-                    if not guild or not guild.voice_client:
-                        break
-                    # Queue is empty, exit loop
-                    break
-
-    async def _play_audio(self, guild_id: int, audio_data: bytes) -> None:
-        guild = self.bot.get_guild(guild_id)
-        if not guild:
-            print(f"[AUDIO] Guild {guild_id} not found", flush=True)
+        self._downloads.add(task)
+        task.add_done_callback(self._downloads.discard)
+
+    async def _download_audio(
+        self,
+        guild_id: int,
+        sequence: int | None,
+        object_name: str,
+        content_type: str,
+        deadline: float | None,
+        timeline: dict[str, int],
+        delete_after_play: bool = False,
+    ) -> None:
+        """Download (or sign a URL for) one clip and hand it to the guild as soon as it is ready.
+
+        With delete_after_play the object is deleted once the bot no longer
+        needs it: right after the download, or when a clip played from a
+        presigned URL is finished or dropped.
+        """
+        clip = None
+        settings = self.bot.bot_settings
+        try:
+            if settings.audio_source == "presigned_url":
+                # 서명만 하므로 MinIO 요청 없음. 음성은 재생할 때 MinIO에서 직접 읽어 봇 메모리를 거치지 않음
+                url = await self.minio.presigned_url(object_name, expires_in=settings.presigned_url_ttl)
+                clip = AudioClip(RemoteAudio(url), content_type, deadline, timeline)
+            else:
+                async with self._download_slots:
+                    # 다운로드 차례를 기다리는 사이 기한이 지났으면 받지 않음
+                    if deadline is None or time.time() <= deadline:
+                        with STAGE_SECONDS.time(stage="download"):
+                            data = await self.minio.download_bytes(object_name)
+                        clip = AudioClip(data, content_type, deadline, timeline)
+        except Exception as e:
+            logger.error("Failed to download %s: %s", object_name, e)
+        if delete_after_play:
+            if clip is not None and clip.remote:
+                clip.on_close = lambda: self.bot.loop.call_soon_threadsafe(self._delete_object, object_name)
+            else:
+                self._delete_object(object_name)
+        # 실패해도 순번은 채워 뒤의 음성이 빈 순번을 기다리지 않게 함
+        self._receive_audio(guild_id, sequence, clip)
+
+    def _start_stream(self, stream_id: str, deadline_ms: int | None) -> StreamingBuffer | None:
+        """Buffer to play for a stream-start message, or None if the stream ended without any audio."""
+        deadline = deadline_ms / 1000 if deadline_ms is not None else None
+        stream = self._get_stream(stream_id, deadline)
+        stream.started = True
+        if stream.buffer is None and not stream.ended:
+            stream.buffer = StreamingBuffer()
+        if stream.ended:
+            self._streams.pop(stream_id)
+        return stream.buffer
+
+    def _delete_object(self, object_name: str) -> None:
+        task = self.bot.loop.create_task(self._delete_audio(object_name))
+        self._deletes.add(task)
+        task.add_done_callback(self._deletes.discard)
+
+    async def _delete_audio(self, object_name: str) -> None:
+        try:
+            await self.minio.delete_object(object_name)
+        except Exception as e:
+            logger.warning("Failed to delete %s: %s", object_name, e)
+
+    def _handle_stream_chunk(self, headers: dict[str, Any], data: bytes) -> None:
+        stream = self._get_stream(headers["stream_id"])
+        if headers.get("end"):
+            stream.ended = True
+            if stream.buffer is not None:
+                stream.buffer.end(int(headers.get("chunks", 0)))
+            # 시작 메시지를 아직 받지 않았으면 그때까지 남겨 둠 (종료 표시만 있으면 시작 메시지는 건너뜀)
+            if stream.started:
+                self._streams.pop(headers["stream_id"])
             return
-
-        voice_client = guild.voice_client
-        if not voice_client:
-            print(f"[AUDIO] Voice client not found for guild {guild_id}", flush=True)
+        if stream.ended:
+            return  # 종료 표시 뒤에 온 청크는 재생하지 않음
+        if stream.buffer is None:
+            stream.buffer = StreamingBuffer()
+        stream.buffer.add_chunk(int(headers.get("chunk", 0)), data)
+
+    def _get_stream(self, stream_id: str, deadline: float | None = None) -> _Stream:
+        """Stream entry for stream_id, created by whichever of its messages arrives first.
+
+        An entry is kept until its playback deadline has passed and no
+        message arrived for STREAM_IDLE_TIMEOUT, so streams whose worker died
+        (or whose start message was lost) do not pile up.
+        """
+        now = time.time()
+        for expired_id in [key for key, stream in self._streams.items() if stream.expires < now]:
+            expired = self._streams.pop(expired_id)
+            logger.warning("Dropping stream %s, no message for %.0fs", expired_id, self.STREAM_IDLE_TIMEOUT)
+            if expired.buffer is not None:
+                expired.buffer.abort()
+
+        expires = max(now + self.STREAM_IDLE_TIMEOUT, deadline or 0)
+        stream = self._streams.get(stream_id)
+        if stream is None:
+            stream = self._streams[stream_id] = _Stream(None, expires)
+        stream.expires = max(stream.expires, expires)
+        return stream
+
+    def _receive_audio(self, guild_id: int, sequence: int | None, clip: AudioClip | None) -> None:
+        """Pass audio through the guild's reorder buffer so it is queued in request order.
+
+        clip is None for a request that was skipped; it only fills its slot in the order.
+        """
+        if clip is not None and clip.timeline is not None:
+            mark(clip.timeline, "ready")
+        if sequence is not None:
+            self._received_sequences[guild_id] = max(self._received_sequences.get(guild_id, 0), sequence)
+        buffer = self._reorder_buffers.get(guild_id)
+        if buffer is None:
+            buffer = ReorderBuffer(
+                lambda clip: self._release_clip(guild_id, clip),
+                hold_timeout=self.REORDER_HOLD_TIMEOUT,
+            )
+            self._reorder_buffers[guild_id] = buffer
+        buffer.push(sequence, clip)
+
+    def _release_clip(self, guild_id: int, clip: AudioClip | None) -> None:
+        if clip is not None:
+            if clip.timeline is not None:
+                mark(clip.timeline, "enqueued")
+                STAGE_SECONDS.observe(elapsed(clip.timeline, "ready", "enqueued"), stage="reorder")
+            self._get_player(guild_id).enqueue(clip)
+
+    @staticmethod
+    def _on_play_start(clip: AudioClip) -> None:
+        # AudioPlayer 스레드에서 호출됨
+        if clip.timeline is None:
             return
+        mark(clip.timeline, "play_start")
+        queue_wait = elapsed(clip.timeline, "enqueued", "play_start")
+        if queue_wait is not None:
+            STAGE_SECONDS.observe(queue_wait, stage="queue_wait")
+        time_to_first_audio = elapsed(clip.timeline, "received", "play_start")
+        if time_to_first_audio is not None:
+            TIME_TO_FIRST_AUDIO.observe(time_to_first_audio)
+
+    @staticmethod
+    def _on_play_end(clip: AudioClip) -> None:
+        if clip.timeline is None:
+            return
+        play = elapsed(mark(clip.timeline, "play_end"), "play_start", "play_end")
+        if play is not None:
+            STAGE_SECONDS.observe(play, stage="play")
+
+    def _get_player(self, guild_id: int) -> GuildPlayer:
+        player = self._players.get(guild_id)
+        if player is None:
+            settings = self.bot.bot_settings
+            player = GuildPlayer(
+                guild_id,
+                lambda: self._get_voice_client(guild_id),
+                max_queued=settings.queue_max_clips,
+                overflow=settings.queue_overflow,
+                on_summarize=lambda count: self._publish_skipped_notice(guild_id, count),
+                on_play_start=self._on_play_start,
+                on_play_end=self._on_play_end,
+            )
+            self._players[guild_id] = player
+        return player
 
-        print(f"[AUDIO] Playing audio for guild {guild_id}, size: {len(audio_data)} bytes", flush=True)
-
-        audio_source = None
-        try:
-            audio_source = discord.FFmpegPCMAudio(BytesIO(audio_data), pipe=True)
-
-            play_finished = asyncio.Event()
-
-            def after_play(error: Exception | None) -> None:
-                if error:
-                    print(f"[AUDIO] Play error: {error}", flush=True)
-                else:
-                    print(f"[AUDIO] Finished playing audio for guild {guild_id}", flush=True)
-                self.bot.loop.call_soon_threadsafe(play_finished.set)
-
-            voice_client.play(audio_source, after=after_play)
-
-            await play_finished.wait()
-        finally:
-            # Cleanup audio source to prevent flush error
-            if audio_source:
-                try:
-                    audio_source.cleanup()
-                except Exception:
-                    pass  # Ignore cleanup errors
+    def _get_voice_client(self, guild_id: int) -> discord.VoiceClient | None:
+        guild = self.bot.get_guild(guild_id)
+        return guild.voice_client if guild else None
 
 
 async def setup(bot: "TTSBot") -> None:
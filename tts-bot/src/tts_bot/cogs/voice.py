@@ -1,9 +1,13 @@
+import logging
+
 import discord
 from discord.ext import commands
 from discord import ui, app_commands
 from postgres.connection import get_async_session_context
 from tts_bot.repository import UserRepository, GuildChannelRepository, GuildSettingsRepository
 
+logger = logging.getLogger(__name__)
+
 
 class VoiceSettingsModal(ui.Modal, title="Voice Settings"):
     """Modal for configuring voice settings."""
@@ -81,10 +85,13 @@ class VoiceSettingsModal(ui.Modal, title="Voice Settings"):
                 rate_value,
                 pitch_value
             )
-            await interaction.response.send_message(
-                f"Voice settings updated!\nRate: {rate_value}% (100 = normal)\nPitch: {pitch_value:+d} (0 = normal)",
-                ephemeral=True
-            )
+
+        # 커밋이 끝난 뒤 다음 메시지부터 바로 적용되도록 캐시 갱신
+        interaction.client.user_settings.set(self.discord_id, self.guild_id, rate_value, pitch_value)
+        await interaction.response.send_message(
+            f"Voice settings updated!\nRate: {rate_value}% (100 = normal)\nPitch: {pitch_value:+d} (0 = normal)",
+            ephemeral=True
+        )
 
 
 class VoiceCog(commands.Cog):
@@ -115,7 +122,9 @@ class VoiceCog(commands.Cog):
 
         # 사람이 아무도 없으면 퇴장
         if len(human_members) == 0:
-            print(f"[VOICE] No humans left in channel {bot_channel.name}, leaving...", flush=True)
+            logger.info(
+                "No humans left in channel %s, leaving...", bot_channel.name, extra={"guild_id": member.guild.id}
+            )
             await voice_client.disconnect()
 
     @commands.command(name="join")
@@ -156,6 +165,7 @@ class VoiceCog(commands.Cog):
 
             # Add channel
             await channel_repo.add_channel(ctx.guild.id, ctx.channel.id)
+            await self.bot.guild_config.add_channel(session, ctx.guild.id, ctx.channel.id)
             await ctx.send(f"채널 {ctx.channel.mention}을 TTS 채널로 등록했습니다.")
 
     @commands.command(name="rm-channel")
@@ -172,6 +182,7 @@ class VoiceCog(commands.Cog):
             removed = await channel_repo.remove_channel(ctx.guild.id, ctx.channel.id)
 
             if removed:
+                await self.bot.guild_config.remove_channel(session, ctx.guild.id, ctx.channel.id)
                 await ctx.send(f"채널 {ctx.channel.mention}을 TTS 채널에서 제거했습니다.")
             else:
                 await ctx.send(f"채널 {ctx.channel.mention}은 TTS 채널로 등록되어 있지 않습니다.")
@@ -195,6 +206,7 @@ class VoiceCog(commands.Cog):
 
             # Set default voice channel
             await settings_repo.set_default_voice_channel(ctx.guild.id, voice_channel.id)
+            await self.bot.guild_config.set_default_voice_channel(session, ctx.guild.id, voice_channel.id)
             await ctx.send(f"기본 음성 채널을 {voice_channel.mention}로 설정했습니다.")
 
     @app_commands.command(name="gyak-voice-config", description="Configure your TTS voice settings (rate and pitch)")
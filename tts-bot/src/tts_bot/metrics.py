@@ -0,0 +1,30 @@
+"""Bot metrics, served on BOT_METRICS_PORT at /metrics.
+
+tts_bot_stage_seconds stages, in the order a message goes through them:
+    normalize, db_channel_lookup, db_user_lookup  parts of handling the Discord message
+    handle                                        message received -> request published (includes the above
+                                                  and waiting to be merged with the next messages)
+    publish                                       publishing the request (until confirmed)
+    delivery                                      worker's completion publish -> bot received it
+    download                                      MinIO download (DISCORD_AUDIO_SOURCE=download)
+    reorder                                       waiting for earlier requests of the guild
+    queue_wait                                    queued in the guild player -> first frame sent
+    play                                          first frame -> playback ended
+The worker's side (dequeue, synthesis, upload, ...) is in tts_worker_stage_seconds.
+"""
+
+from postgres.connection import async_engine
+from telemetry import registry
+
+STAGE_SECONDS = registry.histogram(
+    "tts_bot_stage_seconds", "Time a TTS message spends in each stage on the bot", ["stage"]
+)
+TIME_TO_FIRST_AUDIO = registry.histogram(
+    "tts_time_to_first_audio_seconds", "Time from receiving a Discord message to sending its first audio frame"
+)
+
+# DB 연결 풀 사용량 (수집할 때 읽음)
+registry.gauge(
+    "tts_bot_db_pool_checked_out", "Database connections in use", function=lambda: async_engine.pool.checkedout()
+)
+registry.gauge("tts_bot_db_pool_size", "Database connection pool size", function=lambda: async_engine.pool.size())
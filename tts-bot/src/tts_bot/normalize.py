@@ -0,0 +1,55 @@
+import re
+
+# 한 번의 스캔으로 처리하는 토큰들. 앞의 lookahead로 일반 글자(한글 음절, 영숫자)에서는 바로 다음으로 넘어감
+# 읽지 않는 토큰은 앞뒤 공백까지 함께 지워 단어가 붙거나 공백이 겹치지 않게 함
+TOKEN_PATTERN = re.compile(
+    r"(?=[\W_hㄱ-ㅣ])(?:"
+    r"(?P<newline>\s*\n\s*)"  # 줄바꿈 (주변 공백 포함)
+    r"|(?P<jamo>([ㄱ-ㅎㅏ-ㅣ])\3+)"  # 같은 자모 반복 (ㅋㅋㅋㅋ, ㅠㅠㅠ)
+    r"|(?P<drop>[^\S\n]*(?:"
+    r"```.*?(?:```|$)"  # 코드 블록 (닫히지 않은 경우 끝까지)
+    r"|https?://\S+"  # 링크
+    r"|<[^<>\s]+>"  # 멘션, 채널, 역할, 커스텀 이모지(<:name:id>), 타임스탬프 등
+    r"|(?P<symbol>(?:[^\w\s]|_)+)"  # 특수문자, 이모지, 밑줄
+    r")[^\S\n]*)"
+    r"|(?P<space>[^\S\n]{2,}|[^\S\n ])"  # 연속 공백, 탭 등 (공백 하나는 그대로 통과)
+    r")",
+    re.DOTALL,
+)
+
+
+class TextNormalizer:
+    """Turns a chat message into the text that is sent to Polly, in a single pass.
+
+    Code blocks, links, Discord tags (mentions, custom emoji, ...) and
+    symbols are dropped, runs of the same jamo are shortened to max_repeat,
+    whitespace is collapsed (line breaks are kept), and the result is cut
+    at max_chars on a word boundary.
+    """
+
+    def __init__(self, max_chars: int = 500, max_repeat: int = 3):
+        self.max_chars = max_chars
+        self.max_repeat = max_repeat
+
+    def normalize(self, text: str) -> str:
+        text = TOKEN_PATTERN.sub(self._replace, text).strip()
+        if self.max_chars and len(text) > self.max_chars:
+            cut = text[: self.max_chars]
+            # 단어 중간에서 자르지 않음 (공백이 없으면 그대로 자름)
+            boundary = max(cut.rfind(" "), cut.rfind("\n"))
+            text = (cut[:boundary] if boundary > 0 else cut).rstrip()
+        return text
+
+    def _replace(self, match: re.Match) -> str:
+        kind = match.lastgroup
+        if kind == "jamo":
+            return match.group(kind)[: self.max_repeat]
+        if kind == "newline":
+            return "\n"
+        if kind == "space":
+            return " "
+        token = match.group(0)
+        # 단어 안의 기호는 그냥 지우고(don't -> dont), 그 외에는 공백 하나로
+        if match.group("symbol") is not None and not (token[0].isspace() or token[-1].isspace()):
+            return ""
+        return " "
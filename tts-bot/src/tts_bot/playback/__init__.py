@@ -0,0 +1,20 @@
+"""Per-guild audio playback pipeline."""
+
+from .clip import AudioClip, guess_content_type
+from .opus import OggOpusAudio
+from .player import GuildPlayer, PrefetchedSource
+from .remote import HTTPRangeReader, RemoteAudio
+from .reorder import ReorderBuffer
+from .stream import StreamingBuffer
+
+__all__ = [
+    "AudioClip",
+    "GuildPlayer",
+    "HTTPRangeReader",
+    "OggOpusAudio",
+    "PrefetchedSource",
+    "RemoteAudio",
+    "ReorderBuffer",
+    "StreamingBuffer",
+    "guess_content_type",
+]
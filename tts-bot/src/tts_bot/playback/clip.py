@@ -0,0 +1,78 @@
+import io
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import discord
+
+from .opus import OggOpusAudio
+from .remote import FFMPEG_RECONNECT_OPTIONS, HTTPRangeReader, RemoteAudio
+from .stream import StreamingBuffer
+
+DEFAULT_CONTENT_TYPE = "audio/mpeg"
+OPUS_CONTENT_TYPES = ("audio/ogg", "audio/opus")
+
+
+def guess_content_type(object_name: str) -> str:
+    return "audio/ogg" if object_name.endswith((".ogg", ".opus")) else DEFAULT_CONTENT_TYPE
+
+
+@dataclass
+class AudioClip:
+    """One utterance to play: complete bytes, a stream that is still arriving, or an object read at playback."""
+
+    data: bytes | StreamingBuffer | RemoteAudio
+    # 없으면 이전 워커와 같은 mp3로 간주
+    content_type: str | None = DEFAULT_CONTENT_TYPE
+    # 이 시각(epoch 초)이 지나면 재생하지 않음
+    deadline: float | None = None
+    # 요청이 거쳐 온 단계별 시각 (telemetry.timeline). 재생 시작/종료 시각도 여기에 기록
+    timeline: dict[str, int] | None = None
+    # 재생이 끝나거나 버려져 더 이상 쓰지 않을 때 한 번 호출 (AudioPlayer 스레드에서 호출될 수 있음)
+    on_close: Callable[[], None] | None = None
+
+    @property
+    def streaming(self) -> bool:
+        return isinstance(self.data, StreamingBuffer)
+
+    @property
+    def remote(self) -> bool:
+        return isinstance(self.data, RemoteAudio)
+
+    @property
+    def expired(self) -> bool:
+        return self.deadline is not None and time.time() > self.deadline
+
+    @property
+    def is_opus(self) -> bool:
+        return self.content_type in OPUS_CONTENT_TYPES
+
+    def describe(self) -> str:
+        if self.streaming:
+            size = "streamed"
+        elif self.remote:
+            size = "remote"
+        else:
+            size = f"{len(self.data)} bytes"
+        return f"{'opus' if self.is_opus else 'mp3'}, {size}"
+
+    def create_source(self) -> discord.AudioSource:
+        if self.remote:
+            # 음성을 봇 메모리에 올리지 않고 재생하면서 MinIO에서 직접 읽음
+            if self.is_opus:
+                return OggOpusAudio(io.BufferedReader(HTTPRangeReader(self.data.url), buffer_size=64 * 1024))
+            return discord.FFmpegPCMAudio(self.data.url, before_options=FFMPEG_RECONNECT_OPTIONS)
+        if self.is_opus:
+            # Opus 패킷을 그대로 전송 (FFmpeg 프로세스 없음). 스트림은 Ogg 페이지 단위로 읽을 수 있게 버퍼링
+            stream = io.BufferedReader(self.data) if self.streaming else io.BytesIO(self.data)
+            return OggOpusAudio(stream)
+        # mp3 폴백: 청크가 도착하는 대로 FFmpeg에 전달됨
+        return discord.FFmpegPCMAudio(self.data if self.streaming else io.BytesIO(self.data), pipe=True)
+
+    def close(self) -> None:
+        if self.streaming:
+            # 재생이 중간에 끝나도 읽는 쪽이 청크를 기다리며 남지 않도록
+            self.data.abort()
+        on_close, self.on_close = self.on_close, None
+        if on_close is not None:
+            on_close()
@@ -0,0 +1,42 @@
+import logging
+from typing import IO
+
+import discord
+from discord.oggparse import OggError, OggStream
+
+logger = logging.getLogger(__name__)
+
+# Ogg/Opus 스트림 맨 앞의 헤더 패킷 (음성 데이터가 아니므로 Discord로 보내지 않음)
+OPUS_HEADER_PREFIXES = (b"OpusHead", b"OpusTags")
+
+
+class OggOpusAudio(discord.AudioSource):
+    """Plays an Ogg/Opus stream by forwarding its packets as-is.
+
+    The worker encodes 48 kHz stereo audio in 20 ms frames, which is exactly
+    what Discord expects, so each Ogg packet is one voice packet. Unlike
+    FFmpegPCMAudio this spawns no process and does no decoding or Opus
+    encoding on the bot.
+    """
+
+    def __init__(self, stream: IO[bytes]):
+        self._stream = stream
+        self._packets = OggStream(stream).iter_packets()
+
+    def read(self) -> bytes:
+        try:
+            for packet in self._packets:
+                if not packet.startswith(OPUS_HEADER_PREFIXES):
+                    return packet
+        except OggError as e:
+            # 스트림이 중간에 끊긴 경우 등: 여기까지만 재생
+            logger.warning("Invalid Ogg stream, stopping playback: %s", e)
+        return b""
+
+    def is_opus(self) -> bool:
+        return True
+
+    def cleanup(self) -> None:
+        self._packets.close()
+        # MinIO에서 직접 읽는 경우 연결을 닫음
+        self._stream.close()
@@ -0,0 +1,250 @@
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Callable, Literal
+
+import discord
+
+from .clip import AudioClip
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["drop_oldest", "drop_newest", "summarize"]
+
+
+class PrefetchedSource(discord.AudioSource):
+    """An audio source that was started ahead of time.
+
+    Opening the source (spawning FFmpeg for MP3, parsing Ogg headers for
+    Opus) and decoding the first frames happens on a worker thread before
+    the clip's turn, so playback can switch to it without a spin-up gap.
+    """
+
+    def __init__(self, clip: AudioClip, prefetch_frames: int = 5):
+        self.clip = clip
+        self.source = clip.create_source()
+        self._frames: deque[bytes] = deque()
+        for _ in range(prefetch_frames):
+            frame = self.source.read()
+            if not frame:
+                break
+            self._frames.append(frame)
+
+    def read(self) -> bytes:
+        if self._frames:
+            return self._frames.popleft()
+        return self.source.read()
+
+    def is_opus(self) -> bool:
+        return self.source.is_opus()
+
+    def cleanup(self) -> None:
+        self.clip.close()
+        self.source.cleanup()
+
+
+class _ChainedSource(discord.AudioSource):
+    """Plays the player's prepared sources back to back within one voice_client.play() call."""
+
+    def __init__(self, player: "GuildPlayer"):
+        self.player = player
+        self.current: PrefetchedSource | None = None
+
+    def read(self) -> bytes:
+        while True:
+            if self.current is None:
+                self.current = self.player._next_ready()
+                if self.current is None:
+                    return b""
+                self.player._clip_started(self.current.clip)
+            frame = self.current.read()
+            if frame:
+                return frame
+            # 다음 클립으로 바로 넘어감 (AudioPlayer 스레드가 멈추지 않으므로 간격 없음)
+            self._finish_current()
+
+    def is_opus(self) -> bool:
+        # AudioPlayer는 read() 직후 호출하므로 방금 읽은 프레임의 source 기준
+        return self.current is not None and self.current.is_opus()
+
+    def cleanup(self) -> None:
+        if self.current is not None:
+            self._finish_current()
+
+    def _finish_current(self) -> None:
+        self.current.cleanup()
+        self.player._clip_finished(self.current.clip)
+        self.current = None
+
+
+class GuildPlayer:
+    """Long-lived, event-driven audio player for one guild.
+
+    Clips are queued with enqueue(). A background task prepares up to
+    lookahead clips ahead of the one playing (source opened, first frames
+    decoded), and a single chained audio source switches from one clip to
+    the next as soon as the previous one ends, so consecutive utterances
+    play back-to-back. The task sleeps until a clip is queued or a prepared
+    clip starts playing; nothing is polled.
+
+    At most max_queued clips wait to be played (0 means unbounded). When a
+    clip arrives at a full queue the overflow policy decides what is lost:
+    drop_oldest discards the oldest waiting clip, drop_newest discards the
+    new one, and summarize discards the whole backlog and reports how many
+    clips were skipped to on_summarize. Clips past their deadline are never
+    played. on_play_start/on_play_end are called from the audio thread when
+    a clip's first frame is sent and when it stops.
+    """
+
+    def __init__(
+        self,
+        guild_id: int,
+        get_voice_client: Callable[[], discord.VoiceClient | None],
+        prefetch_frames: int = 5,
+        lookahead: int = 1,
+        max_queued: int = 0,
+        overflow: OverflowPolicy = "drop_oldest",
+        on_summarize: Callable[[int], None] | None = None,
+        on_play_start: Callable[[AudioClip], None] | None = None,
+        on_play_end: Callable[[AudioClip], None] | None = None,
+    ):
+        self.guild_id = guild_id
+        # 이 플레이어의 로그에 붙는 구조화 필드
+        self._log_fields = {"guild_id": guild_id}
+        self.get_voice_client = get_voice_client
+        self.prefetch_frames = prefetch_frames
+        self.lookahead = lookahead
+        self.max_queued = max_queued
+        self.overflow = overflow
+        self.on_summarize = on_summarize
+        self.on_play_start = on_play_start
+        self.on_play_end = on_play_end
+        self._loop = asyncio.get_running_loop()
+        self._pending: deque[AudioClip] = deque()
+        # 준비된 source는 AudioPlayer 스레드에서 꺼내므로 lock으로 보호
+        self._ready: deque[PrefetchedSource] = deque()
+        self._ready_lock = threading.Lock()
+        self._playing = False
+        self._wake = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+
+    @property
+    def is_busy(self) -> bool:
+        return self._playing or bool(self._pending) or bool(self._ready)
+
+    @property
+    def queued(self) -> int:
+        """Clips waiting to be played (prepared or not)."""
+        return len(self._pending) + len(self._ready)
+
+    def enqueue(self, clip: AudioClip) -> None:
+        if clip.expired:
+            logger.info("Skipping expired audio", extra=self._log_fields)
+            clip.close()
+            return
+        if self.max_queued and self.queued >= self.max_queued and not self._overflow(clip):
+            return
+        self._pending.append(clip)
+        logger.debug("Enqueued audio (%s), queued: %d", clip.describe(), self.queued, extra=self._log_fields)
+        self._wake.set()
+
+    def _overflow(self, clip: AudioClip) -> bool:
+        """Apply the overflow policy to a full queue. Returns False if the new clip was dropped."""
+        if self.overflow == "drop_newest" or not self._pending:
+            # 준비가 끝난 클립만 남아 있으면 새 클립을 버림
+            logger.warning("Queue full, dropping new audio", extra=self._log_fields)
+            clip.close()
+            return False
+        if self.overflow == "drop_oldest":
+            logger.warning("Queue full, dropping oldest audio", extra=self._log_fields)
+            self._pending.popleft().close()
+            return True
+
+        dropped = len(self._pending) + 1
+        logger.warning("Queue full, skipping %d queued clips", dropped, extra=self._log_fields)
+        while self._pending:
+            self._pending.popleft().close()
+        clip.close()
+        if self.on_summarize is not None:
+            self.on_summarize(dropped)
+        return False
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+
+            while self._pending and len(self._ready) < self.lookahead:
+                clip = self._pending.popleft()
+                if clip.expired:
+                    logger.info("Skipping expired audio", extra=self._log_fields)
+                    clip.close()
+                    continue
+                try:
+                    source = await self._loop.run_in_executor(None, PrefetchedSource, clip, self.prefetch_frames)
+                except Exception as e:
+                    logger.error("Failed to prepare audio: %s", e, extra=self._log_fields)
+                    clip.close()
+                    continue
+                with self._ready_lock:
+                    self._ready.append(source)
+                self._start_playback()
+
+    def _next_ready(self) -> PrefetchedSource | None:
+        """Called from the audio thread when the current clip ends."""
+        while True:
+            with self._ready_lock:
+                source = self._ready.popleft() if self._ready else None
+            if source is None or not source.clip.expired:
+                break
+            # 준비된 뒤 앞 클립을 재생하는 사이 기한이 지남
+            source.cleanup()
+        # 자리가 비었으니 다음 클립 준비
+        self._loop.call_soon_threadsafe(self._wake.set)
+        return source
+
+    def _clip_started(self, clip: AudioClip) -> None:
+        if self.on_play_start is not None:
+            self.on_play_start(clip)
+
+    def _clip_finished(self, clip: AudioClip) -> None:
+        if self.on_play_end is not None:
+            self.on_play_end(clip)
+
+    def _start_playback(self) -> None:
+        if self._playing or not self._ready:
+            return
+
+        voice_client = self.get_voice_client()
+        if not voice_client or not voice_client.is_connected():
+            logger.warning("Voice client not found, dropping queued audio", extra=self._log_fields)
+            self._drop_queued()
+            return
+
+        self._playing = True
+        voice_client.play(_ChainedSource(self), after=self._after_play)
+
+    def _after_play(self, error: Exception | None) -> None:
+        if error:
+            logger.error("Play error: %s", error, extra=self._log_fields)
+        self._loop.call_soon_threadsafe(self._on_finished)
+
+    def _on_finished(self) -> None:
+        self._playing = False
+        logger.debug("Finished playing audio", extra=self._log_fields)
+        # 재생이 끝나는 사이 준비된 클립이 있으면 바로 이어서 재생
+        self._start_playback()
+        self._wake.set()
+
+    def _drop_queued(self) -> None:
+        with self._ready_lock:
+            ready, self._ready = self._ready, deque()
+        for source in ready:
+            source.cleanup()
+        while self._pending:
+            self._pending.popleft().close()
+
+    def close(self) -> None:
+        self._task.cancel()
+        self._drop_queued()
@@ -0,0 +1,99 @@
+import http.client
+import io
+import logging
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# FFmpeg가 MinIO에서 직접 읽다가 연결이 끊기면 읽은 위치부터 다시 요청 (HTTP Range)
+FFMPEG_RECONNECT_OPTIONS = "-reconnect 1 -reconnect_on_network_error 1 -reconnect_delay_max 2"
+
+
+@dataclass(frozen=True)
+class RemoteAudio:
+    """Audio that stays in object storage and is read through a (presigned) URL at playback time."""
+
+    url: str
+
+
+class HTTPRangeReader(io.RawIOBase):
+    """Reads an HTTP object front to back without keeping it in memory.
+
+    The body is streamed from a single GET. If the connection drops midway,
+    reading resumes where it stopped with a Range request, up to retries
+    times. Wrap it in io.BufferedReader so the Ogg parser's small reads are
+    served from memory instead of the socket.
+    """
+
+    def __init__(self, url: str, timeout: float = 10.0, retries: int = 2):
+        self.url = url
+        self.timeout = timeout
+        self.retries = retries
+        self._position = 0
+        self._response: http.client.HTTPResponse | None = None
+        # object 전체 크기 (알 수 없으면 None). 그 전에 응답이 끝나면 연결이 끊긴 것으로 봄
+        self._size: int | None = None
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        attempts = 0
+        while not self._eof:
+            try:
+                if self._response is None:
+                    self._response = self._open()
+                    if self._response is None:
+                        break
+                read = self._response.readinto(buffer)
+                if not read and self._size is not None and self._position < self._size:
+                    raise http.client.IncompleteRead(b"", self._size - self._position)
+            except urllib.error.HTTPError:
+                raise  # 만료된 URL(403), 없는 object(404) 등은 다시 시도해도 같음
+            except (OSError, http.client.HTTPException) as e:
+                self._close_response()
+                if attempts >= self.retries:
+                    raise
+                attempts += 1
+                logger.warning("Connection lost at byte %d, resuming: %s", self._position, e)
+                continue
+            if not read:
+                self._eof = True
+                break
+            self._position += read
+            return read
+        return 0
+
+    def _open(self) -> http.client.HTTPResponse | None:
+        request = urllib.request.Request(self.url)
+        if self._position:
+            request.add_header("Range", f"bytes={self._position}-")
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 416:
+                # 이미 끝까지 읽은 뒤 다시 연결한 경우
+                self._eof = True
+                return None
+            raise
+        if self._position and response.status != 206:
+            response.close()
+            raise urllib.error.HTTPError(self.url, response.status, "Range request not honored", response.headers, None)
+        content_range = response.headers.get("Content-Range")
+        if content_range and not content_range.endswith("/*"):
+            self._size = int(content_range.rsplit("/", 1)[1])
+        elif response.headers.get("Content-Length") and not self._position:
+            self._size = int(response.headers["Content-Length"])
+        return response
+
+    def _close_response(self) -> None:
+        if self._response is not None:
+            self._response.close()
+            self._response = None
+
+    def close(self) -> None:
+        self._close_response()
+        super().close()
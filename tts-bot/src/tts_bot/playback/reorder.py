@@ -0,0 +1,74 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class ReorderBuffer(Generic[T]):
+    """Releases items in sequence-number order.
+
+    Items that arrive ahead of the next expected sequence number are held
+    until the gap is filled. A gap is never waited on for longer than
+    hold_timeout: after that the buffer skips ahead to the oldest held item,
+    so one slow or lost synthesis cannot block a guild forever. Items that
+    arrive after their slot was skipped are released immediately.
+    """
+
+    def __init__(self, release: Callable[[T], None], hold_timeout: float = 3.0, first_sequence: int = 1):
+        self.release = release
+        self.hold_timeout = hold_timeout
+        self._next = first_sequence
+        self._held: list[tuple[int, int, T]] = []
+        # 같은 seq가 중복되어도 heap 비교가 item까지 내려가지 않도록 하는 tie-breaker
+        self._counter = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def held(self) -> int:
+        return len(self._held)
+
+    def push(self, sequence: int | None, item: T) -> None:
+        if sequence is None or sequence < self._next:
+            # 순서 정보가 없거나 이미 건너뛴 순번
+            self.release(item)
+            return
+
+        heapq.heappush(self._held, (sequence, next(self._counter), item))
+        self._drain()
+
+    def _drain(self) -> None:
+        released = False
+        while self._held and self._held[0][0] <= self._next:
+            sequence, _, item = heapq.heappop(self._held)
+            self._next = max(self._next, sequence + 1)
+            self.release(item)
+            released = True
+
+        # 진행이 있었으면 남은 항목 기준으로 대기 시간을 다시 계산
+        if released or not self._held:
+            self._cancel_timer()
+        if self._held and self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.hold_timeout, self._on_timeout)
+
+    def _on_timeout(self) -> None:
+        self._timer = None
+        if not self._held:
+            return
+        skipped_to = self._held[0][0]
+        logger.warning("Gave up waiting for sequence %d..%d, skipping ahead", self._next, skipped_to - 1)
+        self._next = skipped_to
+        self._drain()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def close(self) -> None:
+        self._cancel_timer()
+        self._held.clear()
@@ -0,0 +1,79 @@
+import io
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingBuffer(io.RawIOBase):
+    """Blocking file-like object fed with numbered audio chunks as they arrive.
+
+    read() blocks until the next chunk is available, so it can be handed to
+    FFmpegPCMAudio(pipe=True) or an Ogg parser before the audio is complete:
+    playback starts with the first chunk. Chunks may be added out of order; they
+    are read back in index order. read() returns b"" (EOF) once every chunk
+    up to the announced count has been read, or if no chunk arrives within
+    stall_timeout, so a lost stream cannot block the player forever.
+    """
+
+    def __init__(self, stall_timeout: float = 10.0):
+        self.stall_timeout = stall_timeout
+        self._chunks: dict[int, bytes] = {}
+        self._next = 0
+        self._total: int | None = None
+        self._current = b""
+        self._offset = 0
+        self._condition = threading.Condition()
+        self.size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def add_chunk(self, index: int, data: bytes) -> None:
+        with self._condition:
+            if index < self._next:
+                return
+            self._chunks[index] = data
+            self.size += len(data)
+            self._condition.notify_all()
+
+    def end(self, total_chunks: int) -> None:
+        with self._condition:
+            self._total = total_chunks
+            self._condition.notify_all()
+
+    def abort(self) -> None:
+        """Stop the stream; pending and future reads return EOF."""
+        with self._condition:
+            self._total = self._next
+            self._chunks.clear()
+            self._current = b""
+            self._condition.notify_all()
+
+    def read(self, size: int = -1) -> bytes:
+        with self._condition:
+            while self._offset >= len(self._current):
+                if self._total is not None and self._next >= self._total:
+                    return b""
+                if self._next not in self._chunks:
+                    if not self._condition.wait_for(self._chunk_ready, timeout=self.stall_timeout):
+                        logger.warning("Stream stalled at chunk %d, stopping playback", self._next)
+                        self._total = self._next
+                        return b""
+                    continue
+                self._current = self._chunks.pop(self._next)
+                self._offset = 0
+                self._next += 1
+
+            end = len(self._current) if size < 0 else self._offset + size
+            data = self._current[self._offset : end]
+            self._offset += len(data)
+            return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def _chunk_ready(self) -> bool:
+        return self._next in self._chunks or (self._total is not None and self._next >= self._total)
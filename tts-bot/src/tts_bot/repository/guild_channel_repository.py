@@ -32,6 +32,11 @@ class GuildChannelRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_all_channels(self) -> list[GuildChannel]:
+        """Get all TTS-enabled channels across every guild."""
+        result = await self.session.execute(select(GuildChannel))
+        return list(result.scalars().all())
+
     async def is_channel_enabled(self, guild_id: int, channel_id: int) -> bool:
         """Check if a channel is TTS-enabled for a guild."""
         stmt = select(GuildChannel).where(
@@ -14,6 +14,11 @@ class GuildSettingsRepository:
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
+    async def get_all_guild_settings(self) -> list[GuildSettings]:
+        """Get settings for every guild."""
+        result = await self.session.execute(select(GuildSettings))
+        return list(result.scalars().all())
+
     async def get_or_create_guild_settings(self, guild_id: int) -> GuildSettings:
         """Get or create guild settings."""
         settings = await self.get_guild_settings(guild_id)
@@ -2,6 +2,7 @@
 
 from typing import Optional
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from tts_bot.orm.user import User
 
@@ -111,6 +112,25 @@ class UserRepository:
             user = await self.create_user(discord_id, guild_id, username)
         return user
 
+    async def create_users_if_missing(self, users: list[tuple[int, int, str]]) -> None:
+        """Create users with default settings in a single statement.
+
+        Rows that already exist are left untouched.
+
+        Args:
+            users: List of (discord_id, guild_id, username) tuples
+        """
+        if not users:
+            return
+        stmt = insert(User).values(
+            [
+                {"discord_id": discord_id, "guild_id": guild_id, "username": username}
+                for discord_id, guild_id, username in users
+            ]
+        )
+        stmt = stmt.on_conflict_do_nothing(index_elements=[User.discord_id, User.guild_id])
+        await self.session.execute(stmt)
+
     async def delete_user(self, discord_id: int, guild_id: int) -> bool:
         """Delete user.
 
@@ -1,4 +1,7 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from telemetry import MetricsSettings
 
 
 class BotSettings(BaseSettings):
@@ -9,3 +12,38 @@ class BotSettings(BaseSettings):
     )
 
     token: str
+
+    # 메시지당 읽을 최대 글자 수 (정규화 후)
+    max_text_chars: int = 300
+
+    # 재생 중인 길드에서 연달아 오는 메시지를 합치기 위해 기다리는 시간 (초, 0이면 비활성화)
+    coalesce_window: float = 0.5
+    # 하나로 합칠 최대 글자 수
+    coalesce_max_chars: int = 500
+
+    # 요청 유효 시간 (초, 0이면 비활성화). 지난 요청은 워커가 합성하지 않고 봇도 재생하지 않음
+    request_ttl: float = 30.0
+    # 길드별로 재생을 기다릴 수 있는 최대 음성 수와 넘쳤을 때의 처리 방식
+    # drop_oldest: 가장 오래된 음성을 버림, drop_newest: 새 음성을 버림, summarize: 밀린 음성을 모두 버리고 건너뛴 개수를 읽음
+    queue_max_clips: int = 20
+    queue_overflow: Literal["drop_oldest", "drop_newest", "summarize"] = "drop_oldest"
+
+    # MinIO에서 동시에 받을 음성 수 (한 길드의 느린 다운로드가 다른 길드를 막지 않음)
+    download_concurrency: int = 8
+
+    # download: 음성 전체를 받아 메모리에서 재생
+    # presigned_url: 서명된 URL만 만들고 재생할 때 FFmpeg(mp3)/Ogg reader(opus)가 MinIO에서 직접 읽음
+    audio_source: Literal["download", "presigned_url"] = "download"
+    # presigned URL 유효 시간 (초). 재생을 기다리는 시간보다 길어야 함
+    presigned_url_ttl: int = 300
+
+
+class BotMetricsSettings(MetricsSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="BOT_METRICS_",
+        env_file=".env",
+        extra="ignore",
+    )
+
+    # 같은 호스트에서 워커와 겹치지 않도록 서비스마다 다른 기본 port
+    port: int = 9100
@@ -0,0 +1,110 @@
+import asyncio
+
+from tts_bot.coalesce import BurstCoalescer, BurstKey
+
+KEY = BurstKey(guild_id=1, channel_id=10, author_id=100, rate=100, pitch=0)
+
+
+def collect(window: float = 0.05, max_chars: int = 500) -> tuple[BurstCoalescer, list[tuple[BurstKey, str, float]]]:
+    flushed: list[tuple[BurstKey, str, float]] = []
+    return BurstCoalescer(lambda *args: flushed.append(args), window=window, max_chars=max_chars), flushed
+
+
+def test_idle_guild_is_flushed_immediately():
+    async def run() -> list:
+        coalescer, flushed = collect()
+        coalescer.add(KEY, "안녕", busy=False, received_at=1.0)
+        return flushed
+
+    assert asyncio.run(run()) == [(KEY, "안녕", 1.0)]
+
+
+def test_disabled_coalescer_never_holds_messages():
+    async def run() -> list:
+        coalescer, flushed = collect(window=0)
+        coalescer.add(KEY, "하나", busy=True, received_at=1.0)
+        coalescer.add(KEY, "둘", busy=True, received_at=2.0)
+        return flushed
+
+    assert asyncio.run(run()) == [(KEY, "하나", 1.0), (KEY, "둘", 2.0)]
+
+
+def test_burst_is_merged_after_the_window():
+    async def run() -> list:
+        coalescer, flushed = collect()
+        coalescer.add(KEY, "하나", busy=True, received_at=1.0)
+        coalescer.add(KEY, "둘", busy=True, received_at=2.0)
+        assert flushed == []
+        await asyncio.sleep(0.1)
+        return flushed
+
+    # 첫 메시지를 받은 시각을 유지
+    assert asyncio.run(run()) == [(KEY, "하나\n둘", 1.0)]
+
+
+def test_each_message_restarts_the_window():
+    async def run() -> list:
+        coalescer, flushed = collect(window=0.2)
+        coalescer.add(KEY, "하나", busy=True)
+        await asyncio.sleep(0.12)
+        coalescer.add(KEY, "둘", busy=True)
+        await asyncio.sleep(0.12)
+        assert flushed == []
+        await asyncio.sleep(0.12)
+        return [text for _, text, _ in flushed]
+
+    assert asyncio.run(run()) == ["하나\n둘"]
+
+
+def test_different_key_flushes_the_pending_burst_first():
+    other = BurstKey(guild_id=1, channel_id=10, author_id=200, rate=100, pitch=0)
+
+    async def run() -> list:
+        coalescer, flushed = collect()
+        coalescer.add(KEY, "하나", busy=True)
+        coalescer.add(other, "다른 사람", busy=True)
+        assert [text for _, text, _ in flushed] == ["하나"]
+        await asyncio.sleep(0.1)
+        return [(key, text) for key, text, _ in flushed]
+
+    assert asyncio.run(run()) == [(KEY, "하나"), (other, "다른 사람")]
+
+
+def test_other_guilds_are_independent():
+    other = BurstKey(guild_id=2, channel_id=20, author_id=100, rate=100, pitch=0)
+
+    async def run() -> list:
+        coalescer, flushed = collect()
+        coalescer.add(KEY, "하나", busy=True)
+        coalescer.add(other, "둘", busy=True)
+        coalescer.add(KEY, "셋", busy=True)
+        assert flushed == []
+        await asyncio.sleep(0.1)
+        return sorted(text for _, text, _ in flushed)
+
+    assert asyncio.run(run()) == ["둘", "하나\n셋"]
+
+
+def test_burst_reaching_max_chars_is_flushed():
+    async def run() -> list:
+        coalescer, flushed = collect(max_chars=10)
+        coalescer.add(KEY, "가" * 5, busy=True)
+        # 구분자 포함 6자 + 5자 > 10자이므로 앞의 묶음을 먼저 보냄
+        coalescer.add(KEY, "나" * 5, busy=True)
+        assert [text for _, text, _ in flushed] == ["가" * 5]
+        await asyncio.sleep(0.1)
+        return [text for _, text, _ in flushed]
+
+    assert asyncio.run(run()) == ["가" * 5, "나" * 5]
+
+
+def test_close_flushes_pending_bursts():
+    async def run() -> list:
+        coalescer, flushed = collect(window=10)
+        coalescer.add(KEY, "하나", busy=True)
+        coalescer.add(KEY, "둘", busy=True)
+        coalescer.close()
+        await asyncio.sleep(0)
+        return [text for _, text, _ in flushed]
+
+    assert asyncio.run(run()) == ["하나\n둘"]
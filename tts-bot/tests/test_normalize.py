@@ -0,0 +1,50 @@
+from tts_bot.normalize import TextNormalizer
+
+
+def test_plain_text_is_unchanged():
+    assert TextNormalizer().normalize("안녕하세요 반갑습니다") == "안녕하세요 반갑습니다"
+    assert TextNormalizer().normalize("") == ""
+
+
+def test_discord_tags_and_links_are_dropped_without_doubling_spaces():
+    normalizer = TextNormalizer()
+
+    assert normalizer.normalize("안녕 <@123> 하세요") == "안녕 하세요"
+    assert normalizer.normalize("봐 https://example.com/a?b=1 이거") == "봐 이거"
+    assert normalizer.normalize("<:pepe:123>") == ""
+
+
+def test_code_blocks_are_dropped_even_when_unclosed():
+    normalizer = TextNormalizer()
+
+    assert normalizer.normalize("코드 ```print(1)``` 끝") == "코드 끝"
+    assert normalizer.normalize("코드 ```열림\n끝") == "코드"
+
+
+def test_symbols_inside_a_word_are_removed_and_between_words_become_a_space():
+    normalizer = TextNormalizer()
+
+    assert normalizer.normalize("don't stop") == "dont stop"
+    assert normalizer.normalize("snake_case") == "snakecase"
+    assert normalizer.normalize("hello, world!") == "hello world"
+    assert normalizer.normalize("이모지 😀 좋아") == "이모지 좋아"
+    assert normalizer.normalize("!!!") == ""
+
+
+def test_repeated_jamo_is_shortened():
+    assert TextNormalizer().normalize("ㅋㅋㅋㅋㅋㅋ 웃겨") == "ㅋㅋㅋ 웃겨"
+    assert TextNormalizer(max_repeat=2).normalize("ㅠㅠㅠㅠ") == "ㅠㅠ"
+
+
+def test_whitespace_is_collapsed_but_line_breaks_are_kept():
+    normalizer = TextNormalizer()
+
+    assert normalizer.normalize("a  \t b") == "a b"
+    assert normalizer.normalize("줄1  \n\n  줄2") == "줄1\n줄2"
+
+
+def test_long_text_is_cut_on_a_word_boundary():
+    assert TextNormalizer(max_chars=10).normalize("안녕하세요 반갑습니다 여러분") == "안녕하세요"
+    # 공백이 없으면 max_chars에서 그대로 자름
+    assert TextNormalizer(max_chars=5).normalize("가나다라마바사") == "가나다라마"
+    assert len(TextNormalizer(max_chars=0).normalize("가" * 600)) == 600
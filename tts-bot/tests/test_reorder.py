@@ -0,0 +1,121 @@
+import asyncio
+
+from tts_bot.playback import ReorderBuffer
+
+
+def collect(hold_timeout: float = 3.0, first_sequence: int = 1) -> tuple[ReorderBuffer[str], list[str]]:
+    released: list[str] = []
+    return ReorderBuffer(released.append, hold_timeout=hold_timeout, first_sequence=first_sequence), released
+
+
+def test_in_order_items_are_released_immediately():
+    async def run() -> list[str]:
+        buffer, released = collect()
+        buffer.push(1, "a")
+        buffer.push(2, "b")
+        assert buffer.held == 0
+        return released
+
+    assert asyncio.run(run()) == ["a", "b"]
+
+
+def test_items_are_held_until_the_gap_is_filled():
+    async def run() -> list[str]:
+        buffer, released = collect()
+        buffer.push(3, "c")
+        buffer.push(2, "b")
+        assert released == []
+        assert buffer.held == 2
+        buffer.push(1, "a")
+        assert buffer.held == 0
+        return released
+
+    assert asyncio.run(run()) == ["a", "b", "c"]
+
+
+def test_items_without_sequence_bypass_the_order():
+    async def run() -> list[str]:
+        buffer, released = collect()
+        buffer.push(2, "b")
+        buffer.push(None, "x")
+        return released
+
+    assert asyncio.run(run()) == ["x"]
+
+
+def test_gap_is_skipped_after_hold_timeout():
+    async def run() -> list[str]:
+        buffer, released = collect(hold_timeout=0.05)
+        buffer.push(3, "c")
+        buffer.push(2, "b")
+        await asyncio.sleep(0.1)
+        assert released == ["b", "c"]
+        # 건너뛴 순번이 늦게 오면 기다리지 않고 바로 내보냄
+        buffer.push(1, "a")
+        return released
+
+    assert asyncio.run(run()) == ["b", "c", "a"]
+
+
+def test_timeout_only_skips_to_the_oldest_held_item():
+    async def run() -> list[str]:
+        buffer, released = collect(hold_timeout=0.05)
+        buffer.push(2, "b")
+        buffer.push(4, "d")
+        await asyncio.sleep(0.07)
+        # 1을 건너뛰어 2를 내보낸 뒤 3은 다시 hold_timeout 동안 기다림
+        assert released == ["b"]
+        buffer.push(3, "c")
+        return released
+
+    assert asyncio.run(run()) == ["b", "c", "d"]
+
+
+def test_progress_restarts_the_hold_timeout():
+    async def run() -> list[str]:
+        buffer, released = collect(hold_timeout=0.2)
+        buffer.push(3, "c")
+        await asyncio.sleep(0.12)
+        buffer.push(1, "a")
+        await asyncio.sleep(0.12)
+        # 1이 도착해 진행이 있었으므로 2는 아직 기다리는 중
+        assert released == ["a"]
+        await asyncio.sleep(0.12)
+        return released
+
+    assert asyncio.run(run()) == ["a", "c"]
+
+
+def test_duplicate_sequence_is_released_once_per_push():
+    async def run() -> list[str]:
+        buffer, released = collect()
+        buffer.push(2, "b1")
+        buffer.push(2, "b2")
+        buffer.push(1, "a")
+        return released
+
+    assert asyncio.run(run()) == ["a", "b1", "b2"]
+
+
+def test_skipped_slot_filled_with_none_unblocks_later_items():
+    async def run() -> list[str | None]:
+        released: list[str | None] = []
+        buffer: ReorderBuffer[str | None] = ReorderBuffer(released.append)
+        buffer.push(2, "b")
+        # 발행에 실패했거나 워커가 건너뛴 요청은 None으로 순번만 채움
+        buffer.push(1, None)
+        return released
+
+    assert asyncio.run(run()) == [None, "b"]
+
+
+def test_close_drops_held_items_and_cancels_the_timer():
+    async def run() -> list[str]:
+        buffer, released = collect(hold_timeout=0.05)
+        buffer.push(2, "b")
+        buffer.close()
+        await asyncio.sleep(0.07)
+        assert buffer.held == 0
+        return released
+
+    assert asyncio.run(run()) == []
@@ -0,0 +1,146 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from tts_bot.cogs.tts import TTSCog
+from tts_bot.playback import StreamingBuffer
+from tts_bot.settings import BotSettings
+
+
+def read_all(buffer: StreamingBuffer) -> bytes:
+    data = b""
+    while chunk := buffer.read(4):
+        data += chunk
+    return data
+
+
+def test_chunks_are_read_in_index_order():
+    buffer = StreamingBuffer()
+    buffer.add_chunk(1, b"world")
+    buffer.add_chunk(0, b"hello ")
+    buffer.end(2)
+
+    assert read_all(buffer) == b"hello world"
+    assert buffer.size == 11
+
+
+def test_read_waits_for_the_next_chunk():
+    buffer = StreamingBuffer(stall_timeout=5)
+
+    def feed() -> None:
+        time.sleep(0.05)
+        buffer.add_chunk(0, b"late")
+        buffer.end(1)
+
+    feeder = threading.Thread(target=feed)
+    feeder.start()
+    assert buffer.read() == b"late"
+    assert buffer.read() == b""
+    feeder.join()
+
+
+def test_end_stops_at_the_announced_count():
+    buffer = StreamingBuffer()
+    buffer.add_chunk(0, b"a")
+    # 합성이 중간에 실패해 앞의 한 청크만 재생
+    buffer.end(1)
+    buffer.add_chunk(2, b"c")
+
+    assert read_all(buffer) == b"a"
+
+
+def test_stalled_stream_ends_playback():
+    buffer = StreamingBuffer(stall_timeout=0.05)
+    buffer.add_chunk(0, b"a")
+
+    started = time.monotonic()
+    assert read_all(buffer) == b"a"
+    assert time.monotonic() - started < 1
+
+
+def test_chunk_arriving_after_it_was_read_is_ignored():
+    buffer = StreamingBuffer()
+    buffer.add_chunk(0, b"a")
+    assert buffer.read() == b"a"
+    buffer.add_chunk(0, b"again")
+    buffer.add_chunk(1, b"b")
+    buffer.end(2)
+
+    assert read_all(buffer) == b"b"
+
+
+def test_abort_unblocks_a_waiting_reader():
+    buffer = StreamingBuffer(stall_timeout=5)
+    result: list[bytes] = []
+    reader = threading.Thread(target=lambda: result.append(buffer.read()))
+    reader.start()
+    time.sleep(0.05)
+    buffer.abort()
+    reader.join(timeout=1)
+
+    assert result == [b""]
+
+
+def test_readinto_fills_the_buffer():
+    buffer = StreamingBuffer()
+    buffer.add_chunk(0, b"abcdef")
+    buffer.end(1)
+    target = bytearray(4)
+
+    assert buffer.readinto(target) == 4
+    assert bytes(target) == b"abcd"
+
+
+def create_cog() -> TTSCog:
+    bot = SimpleNamespace(loop=None, minio=None, publisher=None, consumer=None, bot_settings=BotSettings(token="x"))
+    return TTSCog(bot)
+
+
+def test_stream_in_normal_order_is_forgotten_after_its_end():
+    cog = create_cog()
+    buffer = cog._start_stream("s", None)
+    cog._handle_stream_chunk({"stream_id": "s", "chunk": 0}, b"audio")
+    cog._handle_stream_chunk({"stream_id": "s", "end": True, "chunks": 1}, b"")
+
+    assert read_all(buffer) == b"audio"
+    assert cog._streams == {}
+
+
+def test_chunks_before_the_start_message_are_kept():
+    cog = create_cog()
+    cog._handle_stream_chunk({"stream_id": "s", "chunk": 0}, b"audio")
+    cog._handle_stream_chunk({"stream_id": "s", "end": True, "chunks": 1}, b"")
+
+    buffer = cog._start_stream("s", None)
+
+    assert read_all(buffer) == b"audio"
+    assert cog._streams == {}
+
+
+def test_end_marker_before_any_chunk_skips_the_stream():
+    cog = create_cog()
+    cog._handle_stream_chunk({"stream_id": "s", "end": True, "chunks": 0}, b"")
+    cog._handle_stream_chunk({"stream_id": "s", "chunk": 0}, b"late")
+
+    # 빈 버퍼를 만들어 stall_timeout 동안 멈추지 않고 순번만 채움
+    assert cog._start_stream("s", None) is None
+    assert cog._streams == {}
+
+
+def test_abandoned_stream_is_aborted_after_its_deadline():
+    cog = create_cog()
+    buffer = cog._start_stream("dead", None)
+    cog._streams["dead"].expires = time.time() - 1
+
+    cog._handle_stream_chunk({"stream_id": "other", "chunk": 0}, b"audio")
+
+    assert list(cog._streams) == ["other"]
+    assert buffer.read() == b""
+
+
+def test_stream_is_kept_until_its_playback_deadline():
+    cog = create_cog()
+    deadline_ms = int((time.time() + 3600) * 1000)
+    cog._start_stream("s", deadline_ms)
+
+    assert cog._streams["s"].expires >= deadline_ms / 1000
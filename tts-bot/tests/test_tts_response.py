@@ -0,0 +1,64 @@
+import time
+from types import SimpleNamespace
+
+from pika.spec import BasicProperties
+from tts_bot.cogs.tts import TTSCog
+from tts_bot.settings import BotSettings
+
+
+class FakeLoop:
+    """Records the callbacks the consumer thread hands to the event loop instead of running them."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, tuple]] = []
+
+    def call_soon_threadsafe(self, callback, *args) -> None:
+        self.calls.append((callback.__name__, args))
+
+
+def create_cog() -> tuple[TTSCog, FakeLoop]:
+    loop = FakeLoop()
+    bot = SimpleNamespace(loop=loop, minio=None, publisher=None, consumer=None, bot_settings=BotSettings(token="x"))
+    return TTSCog(bot), loop
+
+
+def completion(cog: TTSCog, **fields) -> dict:
+    return {"guild_id": "1", "seq": 7, "seq_epoch": cog._sequence_epoch, **fields}
+
+
+def test_skipped_completion_fills_its_sequence():
+    cog, loop = create_cog()
+
+    cog._handle_tts_response(completion(cog, skipped=True), BasicProperties())
+
+    assert loop.calls == [("_receive_audio", (1, 7, None))]
+
+
+def test_empty_stream_start_fills_its_sequence():
+    cog, loop = create_cog()
+    cog._handle_stream_chunk({"stream_id": "s", "end": True, "chunks": 0}, b"")
+
+    cog._handle_tts_response(completion(cog, stream_id="s"), BasicProperties())
+
+    assert loop.calls == [("_receive_audio", (1, 7, None))]
+
+
+def test_expired_one_shot_object_is_deleted_without_download():
+    cog, loop = create_cog()
+    deadline = int((time.time() - 1) * 1000)
+
+    cog._handle_tts_response(
+        completion(cog, object_name="tts/a.ogg", deadline=deadline, delete_after_play=True), BasicProperties()
+    )
+
+    assert loop.calls == [("_delete_object", ("tts/a.ogg",)), ("_receive_audio", (1, 7, None))]
+
+
+def test_completed_object_is_downloaded_on_the_event_loop():
+    cog, loop = create_cog()
+
+    cog._handle_tts_response(completion(cog, object_name="tts/a.ogg", delete_after_play=True), BasicProperties())
+
+    [(name, args)] = loop.calls
+    assert name == "_start_download"
+    assert args[:3] == (1, 7, "tts/a.ogg") and args[-1] is True
@@ -1,9 +1,11 @@
-from .settings import PollySettings
+from .settings import PollySettings, WorkerMetricsSettings, WorkerSettings
 from .polly import PollyClient
 from .worker import TTSWorker
 
 __all__ = [
     "PollySettings",
+    "WorkerSettings",
+    "WorkerMetricsSettings",
     "PollyClient",
     "TTSWorker",
 ]
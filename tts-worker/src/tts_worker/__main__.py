@@ -1,7 +1,11 @@
+from telemetry import configure_logging
+
 from .worker import TTSWorker
 
 
 def main() -> None:
+    # 로그는 큐에 넣고 별도 스레드가 출력 (합성 스레드가 stdout 쓰기를 기다리지 않음)
+    configure_logging()
     worker = TTSWorker()
     try:
         worker.run()
@@ -0,0 +1,141 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from minio import MinIOClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    storage_hits: int = 0
+    misses: int = 0
+    # 캐시 히트로 Polly 호출을 건너뛴 글자 수 (Polly는 글자 수 기준 과금)
+    saved_characters: int = 0
+    # 캐시 미스에서 실제로 소요된 합성 시간 합계 (초)
+    synth_seconds: float = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.storage_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """Estimated Polly latency saved, based on the average synthesis time of misses."""
+        if not self.misses:
+            return 0.0
+        return self.hits * (self.synth_seconds / self.misses)
+
+
+class SynthesisCache:
+    """Content-addressed cache of synthesized audio.
+
+    Audio is stored in MinIO under a key derived from a hash of
+    (normalized text, rate, pitch, voice_id, output format), so identical
+    requests always map to the same object. A bounded in-process LRU of
+    known object names sits in front of MinIO to skip the HEAD request
+    for hot entries. Small clips also keep their bytes in the LRU so they can
+    be sent inline without touching MinIO at all.
+
+    With max_age (seconds), objects are expected to be deleted once they
+    have not been used for that long (see RetentionSweeper). An object that
+    is still in use has its modification time refreshed when it is older
+    than max_age / 2, and remembered names without bytes are checked
+    against MinIO again after max_age / 4, so the cache never hands out a
+    name that has been swept.
+    """
+
+    def __init__(self, minio: MinIOClient, max_entries: int = 1024, prefix: str = "cache", max_age: float = 0.0):
+        self.minio = minio
+        self.max_entries = max_entries
+        self.prefix = prefix
+        self.max_age = max_age
+        self.stats = CacheStats()
+        # object 이름 -> (메모리에 둔 음성, MinIO에서 마지막으로 확인한 시각)
+        self._entries: OrderedDict[str, tuple[bytes | None, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        # 줄바꿈은 쉼(Polly의 <break>)으로 읽히므로 키에 남김. 빈 줄은 연속된 줄바꿈처럼 쉼 하나가 되므로 버림
+        return "\n".join(" ".join(line.split()) for line in text.split("\n") if line.strip())
+
+    def object_name(self, text: str, rate: int, pitch: int, voice_id: str, output_format: str) -> str:
+        key = "\x1f".join([self.normalize(text), str(rate), str(pitch), voice_id, output_format])
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return f"{self.prefix}/{digest}.{output_format}"
+
+    def lookup(self, object_name: str, text: str = "") -> bool:
+        """Return True if the audio for object_name already exists."""
+        with self._lock:
+            entry = self._entries.get(object_name)
+            if entry is not None and (entry[0] is not None or not self._needs_check(entry[1])):
+                self._entries.move_to_end(object_name)
+                self.stats.memory_hits += 1
+                self.stats.saved_characters += len(text)
+                return True
+
+        # 메모리에 없거나 확인한 지 오래되었으면 MinIO에 존재하는지 확인 (다른 워커가 만들었거나 정리되었을 수 있음)
+        if self._check_storage(object_name):
+            self._remember(object_name)
+            with self._lock:
+                self.stats.storage_hits += 1
+                self.stats.saved_characters += len(text)
+            return True
+
+        with self._lock:
+            self._entries.pop(object_name, None)
+            self.stats.misses += 1
+        return False
+
+    def _needs_check(self, checked_at: float) -> bool:
+        return bool(self.max_age) and time.monotonic() - checked_at >= self.max_age / 4
+
+    def _check_storage(self, object_name: str) -> bool:
+        metadata = self.minio.head_object(object_name)
+        if metadata is None:
+            return False
+        if self.max_age:
+            age = (datetime.now(timezone.utc) - metadata["LastModified"]).total_seconds()
+            if age > self.max_age / 2:
+                # 계속 쓰이는 항목은 보존 기간이 지나도 정리되지 않도록 수정 시각을 갱신
+                try:
+                    self.minio.touch_object(object_name, metadata.get("ContentType", "application/octet-stream"))
+                except Exception as e:
+                    logger.warning("Failed to refresh %s: %s", object_name, e)
+        return True
+
+    def get_audio(self, object_name: str) -> bytes | None:
+        """Return the audio bytes if they are held in memory."""
+        with self._lock:
+            entry = self._entries.get(object_name)
+            return entry[0] if entry is not None else None
+
+    def store(self, object_name: str, synth_seconds: float = 0.0, audio_data: bytes | None = None) -> None:
+        self._remember(object_name, audio_data)
+        with self._lock:
+            self.stats.synth_seconds += synth_seconds
+
+    def _remember(self, object_name: str, audio_data: bytes | None = None) -> None:
+        with self._lock:
+            if audio_data is None and object_name in self._entries:
+                audio_data = self._entries[object_name][0]
+            self._entries[object_name] = (audio_data, time.monotonic())
+            self._entries.move_to_end(object_name)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,124 @@
+import threading
+import time
+from dataclasses import dataclass
+
+
+class TokenBucket:
+    """Thread-safe token bucket: allows rate calls per second on average, bursts up to capacity."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def drain(self) -> None:
+        """Drop the stored burst so the next calls are paced at rate."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+@dataclass
+class LimiterStats:
+    limit: int
+    in_flight: int
+    throttled: int
+    slow: int
+    decreases: int
+
+
+class AdaptiveLimiter:
+    """Caps calls to a rate-limited service with a token bucket and an AIMD concurrency limit.
+
+    Every call takes a token (the configured TPS) and a concurrency slot.
+    The number of slots grows by one per limit successful calls (additive
+    increase) and is cut by decrease_factor when the service throttles or
+    answers slower than latency_threshold (multiplicative decrease). Cuts
+    are at most one per cooldown, so the calls that were in flight when
+    the service started struggling do not collapse the limit to minimum.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: int | None = None,
+        latency_threshold: float = 2.0,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        self.bucket = TokenBucket(rate)
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.latency_threshold = latency_threshold
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._limit = float(initial_limit if initial_limit is not None else max_limit)
+        self._in_flight = 0
+        self._throttled = 0
+        self._slow = 0
+        self._decreases = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+        # 슬롯을 잡은 뒤 토큰을 기다리므로 대기 중인 호출 수도 limit을 넘지 않음
+        self.bucket.acquire()
+
+    def release(self, latency: float | None = None, throttled: bool = False) -> None:
+        """Return a slot. latency is None for calls that failed for other reasons."""
+        with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self._throttled += 1
+                self._decrease()
+            elif latency is not None and latency > self.latency_threshold:
+                self._slow += 1
+                self._decrease()
+            elif latency is not None:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+        if throttled:
+            self.bucket.drain()
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._decreases += 1
+        self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+
+    def stats(self) -> LimiterStats:
+        with self._condition:
+            return LimiterStats(self.limit, self._in_flight, self._throttled, self._slow, self._decreases)
@@ -0,0 +1,17 @@
+"""Worker metrics, served on WORKER_METRICS_PORT at /metrics.
+
+tts_worker_stage_seconds stages:
+    dequeue             bot published the request -> worker started it (broker and scheduler wait)
+    synthesis           synthesizing the whole text (not streamed requests)
+    upload              MinIO upload
+    completion_publish  publishing the completion message (until confirmed)
+    process             the whole request on the worker
+The bot's side (delivery, download, playback, ...) is in tts_bot_stage_seconds.
+"""
+
+from telemetry import registry
+
+STAGE_SECONDS = registry.histogram(
+    "tts_worker_stage_seconds", "Time a TTS request spends in each stage on the worker", ["stage"]
+)
+MESSAGES = registry.counter("tts_worker_messages", "Requests handled by the worker", ["result"])
@@ -0,0 +1,55 @@
+from collections.abc import Iterable
+
+# Layer III 비트레이트 (kbps): MPEG-1, MPEG-2/2.5
+BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# 버전 비트(00: MPEG-2.5, 10: MPEG-2, 11: MPEG-1)별 샘플레이트
+SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+# 첫 프레임에 음성 대신 길이 정보를 담는 VBR 헤더 (LAME/FFmpeg의 Xing·Info, Fraunhofer의 VBRI)
+VBR_TAGS = (b"Xing", b"Info", b"VBRI")
+
+
+def strip_mp3_headers(data: bytes) -> bytes:
+    """Return the bare MP3 frames of data.
+
+    Drops a leading ID3v2 tag, a trailing ID3v1 tag and a leading Xing/Info
+    or VBRI frame. These describe a whole file (its length in frames, for
+    instance), so they are wrong, or would be decoded as a glitch, once the
+    audio is joined with other segments.
+    """
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = (data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | (data[9] & 0x7F)
+        # 플래그의 footer 비트가 있으면 10바이트가 더 붙음
+        data = data[10 + size + (10 if data[5] & 0x10 else 0) :]
+    if len(data) >= 128 and data[-128:-125] == b"TAG":
+        data = data[:-128]
+
+    frame_length = _frame_length(data)
+    if frame_length and any(tag in data[: min(frame_length, 64)] for tag in VBR_TAGS):
+        data = data[frame_length:]
+    return data
+
+
+def join_mp3(segments: Iterable[bytes]) -> bytes:
+    """Join separately synthesized MP3 segments into one stream of frames."""
+    return b"".join(strip_mp3_headers(segment) for segment in segments)
+
+
+def _frame_length(data: bytes) -> int | None:
+    """Length in bytes of the Layer III frame at the start of data, or None if there is none."""
+    if len(data) < 4 or data[0] != 0xFF or data[1] & 0xE0 != 0xE0:
+        return None
+    version = (data[1] >> 3) & 0x03
+    layer = (data[1] >> 1) & 0x03
+    bitrate_index = data[2] >> 4
+    sample_rate_index = (data[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    padding = (data[2] >> 1) & 0x01
+    bitrate = BITRATES[1 if version == 3 else 2][bitrate_index] * 1000
+    sample_rate = SAMPLE_RATES[version][sample_rate_index]
+    # 프레임당 샘플 수 / 8 (MPEG-1은 1152 샘플, MPEG-2/2.5는 576 샘플)
+    factor = 144 if version == 3 else 72
+    return factor * bitrate // sample_rate + padding
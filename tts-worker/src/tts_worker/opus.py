@@ -0,0 +1,95 @@
+import shutil
+import subprocess
+import threading
+from collections.abc import Iterable, Iterator
+
+
+class OpusEncoder:
+    """Transcodes Polly's MP3 output to Ogg/Opus with FFmpeg.
+
+    The output is what Discord sends over the wire (48 kHz stereo, 20 ms
+    frames), so the bot can forward the packets as they are without
+    decoding or re-encoding. Pages are flushed every page_duration_ms so
+    streamed output reaches the bot in small pieces.
+    """
+
+    def __init__(self, bitrate: str = "64k", page_duration_ms: int = 100, executable: str = "ffmpeg"):
+        self.bitrate = bitrate
+        self.page_duration_ms = page_duration_ms
+        self.executable = executable
+
+    @property
+    def available(self) -> bool:
+        return shutil.which(self.executable) is not None
+
+    def _command(self) -> list[str]:
+        return [
+            self.executable,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "mp3",
+            "-i",
+            "pipe:0",
+            "-c:a",
+            "libopus",
+            "-b:a",
+            self.bitrate,
+            "-ar",
+            "48000",
+            "-ac",
+            "2",
+            "-frame_duration",
+            "20",
+            "-application",
+            "voip",
+            "-page_duration",
+            str(self.page_duration_ms * 1000),
+            "-f",
+            "ogg",
+            "pipe:1",
+        ]
+
+    def encode(self, mp3_data: bytes) -> bytes:
+        result = subprocess.run(self._command(), input=mp3_data, capture_output=True, check=False)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {result.stderr.decode(errors='replace').strip()}")
+        return result.stdout
+
+    def encode_stream(self, mp3_chunks: Iterable[bytes], chunk_size: int = 4096) -> Iterator[bytes]:
+        """Encode MP3 chunks as they arrive, yielding Ogg/Opus output as FFmpeg produces it."""
+        process = subprocess.Popen(
+            self._command(), stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        feed_error: list[BaseException] = []
+
+        def feed() -> None:
+            try:
+                for chunk in mp3_chunks:
+                    process.stdin.write(chunk)
+            except BaseException as e:
+                feed_error.append(e)
+            finally:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+
+        # 입력(Polly 스트림)과 출력을 동시에 처리해야 파이프가 막히지 않음
+        feeder = threading.Thread(target=feed, name="opus-encoder-feed", daemon=True)
+        feeder.start()
+        try:
+            while data := process.stdout.read1(chunk_size):
+                yield data
+        finally:
+            # 중간에 중단되면 stdout을 먼저 닫아 ffmpeg와 feed 스레드가 끝나도록 함
+            process.stdout.close()
+            feeder.join()
+            returncode = process.wait()
+            stderr = process.stderr.read().decode(errors="replace").strip()
+            process.stderr.close()
+        if feed_error:
+            raise feed_error[0]
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {stderr}")
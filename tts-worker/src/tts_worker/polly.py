@@ -1,9 +1,34 @@
+import logging
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from xml.sax.saxutils import escape
+
 import boto3
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
 
+from .limiter import AdaptiveLimiter
 from .settings import PollySettings
+from .synthesizers.base import Synthesizer
+
+logger = logging.getLogger(__name__)
+
+THROTTLING_CODES = ("ThrottlingException", "Throttling", "TooManyRequestsException")
 
 
-class PollyClient:
+class PollyClient(Synthesizer):
+    name = "polly"
+    # SynthesizeSpeech 요청당 최대 과금 글자 수 (SSML 태그 제외)
+    MAX_TEXT_CHARS = 3000
+    # 줄바꿈(봇이 합친 메시지 사이 포함)은 잠깐 쉬었다 읽음
+    LINE_BREAK = re.compile(r"\s*\n+\s*")
+    LINE_BREAK_MS = 300
+    # botocore의 자체 재시도까지 실패한 스로틀링은 limiter가 줄어든 뒤 여기서 다시 시도
+    THROTTLE_RETRIES = 3
+    THROTTLE_BACKOFF = 0.5  # seconds, doubled on each retry
+
     def __init__(self, settings: PollySettings | None = None):
         self.settings = settings or PollySettings()
         self._client = boto3.client(
@@ -12,6 +37,22 @@ class PollyClient:
             aws_secret_access_key=self.settings.secret_access_key,
             region_name=self.settings.region_name,
         )
+        # 동시 호출 수는 작게 시작해서 정상 응답이 이어지면 늘림
+        self.limiter = AdaptiveLimiter(
+            rate=self.settings.max_tps,
+            max_limit=self.settings.max_concurrency,
+            initial_limit=min(4, self.settings.max_concurrency),
+            latency_threshold=self.settings.latency_threshold,
+        )
+
+    @property
+    def voice_id(self) -> str:
+        return self.settings.voice_id
+
+    @property
+    def cache_key(self) -> str:
+        # 엔진을 나누기 전에 만든 캐시 항목이 그대로 쓰이도록 voice ID만 사용
+        return self.voice_id
 
     def synthesize(
         self,
@@ -31,17 +72,71 @@ class PollyClient:
         Returns:
             Audio data as bytes
         """
+        with self._audio_stream(text, voice_id, rate, pitch) as stream:
+            return stream.read()
+
+    def synthesize_stream(
+        self,
+        text: str,
+        voice_id: str | None = None,
+        rate: int = 100,
+        pitch: int = 0,
+        chunk_size: int = 4096,
+    ) -> Iterator[bytes]:
+        """Synthesize speech, yielding audio chunks as Polly produces them.
+
+        Polly starts sending the audio stream before the whole utterance is
+        synthesized, so the first chunk arrives long before the last one
+        for long texts.
+        """
+        with self._audio_stream(text, voice_id, rate, pitch) as stream:
+            yield from stream.iter_chunks(chunk_size)
+
+    @contextmanager
+    def _audio_stream(self, text: str, voice_id: str | None, rate: int, pitch: int) -> Iterator[StreamingBody]:
+        """Call SynthesizeSpeech within the limiter and hold the slot until the audio has been read."""
+        for attempt in range(self.THROTTLE_RETRIES + 1):
+            self.limiter.acquire()
+            started = time.monotonic()
+            try:
+                response = self._synthesize_speech(text, voice_id, rate, pitch)
+            except ClientError as e:
+                throttled = e.response.get("Error", {}).get("Code") in THROTTLING_CODES
+                self.limiter.release(throttled=throttled)
+                if not throttled or attempt == self.THROTTLE_RETRIES:
+                    raise
+                logger.warning("Throttled, retrying (limit=%d)", self.limiter.limit)
+                time.sleep(self.THROTTLE_BACKOFF * 2 ** attempt)
+                continue
+            except BaseException:
+                self.limiter.release()
+                raise
+            break
+
+        latency = time.monotonic() - started
+        # botocore가 내부에서 재시도했다면 스로틀링을 받은 것
+        retried = response.get("ResponseMetadata", {}).get("RetryAttempts", 0) > 0
+        stream = response["AudioStream"]
+        try:
+            yield stream
+        finally:
+            stream.close()
+            self.limiter.release(latency, throttled=retried)
+
+    def _synthesize_speech(self, text: str, voice_id: str | None, rate: int, pitch: int) -> dict:
         # Convert int to percentage strings for AWS Polly SSML
         rate_str = f"{rate}%"
         pitch_str = f"{pitch:+d}%" if pitch != 0 else "0%"
 
+        # Escape the text for SSML and turn line breaks into pauses
+        body = self.LINE_BREAK.sub(f'<break time="{self.LINE_BREAK_MS}ms"/>', escape(text.strip()))
+
         # Create SSML with prosody tags for rate and pitch
-        ssml_text = f'<speak><prosody rate="{rate_str}" pitch="{pitch_str}">{text}</prosody></speak>'
+        ssml_text = f'<speak><prosody rate="{rate_str}" pitch="{pitch_str}">{body}</prosody></speak>'
 
-        response = self._client.synthesize_speech(
+        return self._client.synthesize_speech(
             Text=ssml_text,
             TextType="ssml",  # Use SSML instead of plain text
             OutputFormat="mp3",
             VoiceId=voice_id or self.settings.voice_id,
         )
-        return response["AudioStream"].read()
@@ -0,0 +1,178 @@
+"""Retention of synthesized audio in MinIO.
+
+Run once from the command line with:
+    uv run python -m tts_worker.retention
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from minio import MinIOClient
+from telemetry import configure_logging
+
+from .settings import WorkerSettings
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = (".mp3", ".ogg")
+SHARD_FORMAT = "%Y/%m/%d/%H"
+
+
+def shard_object_name(prefix: str, extension: str, now: datetime | None = None) -> str:
+    """Name for a one-shot audio object: prefix/yyyy/mm/dd/hh/<uuid>.extension (UTC)."""
+    now = now or datetime.now(timezone.utc)
+    return f"{prefix}/{now:{SHARD_FORMAT}}/{uuid.uuid4()}.{extension}"
+
+
+@dataclass
+class SweepStats:
+    objects: int = 0
+    bytes: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def objects_per_second(self) -> float:
+        return self.objects / self.seconds if self.seconds > 0 else 0.0
+
+
+class RetentionSweeper:
+    """Deletes audio objects that are past their retention period, in bulk.
+
+    One-shot audio lives under audio_prefix/yyyy/mm/dd/hh/, so every shard
+    that ended before the cutoff is deleted as a whole without looking at
+    each object's age, and older years/months/days are listed in one go.
+    Objects at the bucket root (the layout before sharding) and cache
+    entries are deleted by LastModified, which the synthesis cache refreshes
+    while an entry is still used. Deletes go out in DeleteObjects batches of
+    up to 1000 keys.
+
+    The bot deletes one-shot audio as soon as it has played it (see
+    delete_after_play in the completion message), so the audio sweep only
+    catches objects a bot never got to, e.g. because it was restarted.
+    """
+
+    def __init__(
+        self,
+        minio: MinIOClient,
+        audio_prefix: str = "audio",
+        audio_retention: float = 3600.0,
+        cache_prefix: str = "cache",
+        cache_retention: float = 0.0,
+    ):
+        self.minio = minio
+        self.audio_prefix = audio_prefix
+        self.audio_retention = audio_retention
+        self.cache_prefix = cache_prefix
+        self.cache_retention = cache_retention
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def sweep(self, now: datetime | None = None) -> SweepStats:
+        now = now or datetime.now(timezone.utc)
+        stats = SweepStats()
+        started = time.monotonic()
+        if self.audio_retention > 0:
+            cutoff = now - timedelta(seconds=self.audio_retention)
+            self._delete(self._expired_shards(f"{self.audio_prefix}/", [], cutoff), stats)
+            legacy = (
+                item
+                for item in self.minio.list_objects(delimiter="/")
+                if item["Key"].endswith(AUDIO_EXTENSIONS) and item["LastModified"] < cutoff
+            )
+            self._delete(legacy, stats)
+        if self.cache_retention > 0:
+            cutoff = now - timedelta(seconds=self.cache_retention)
+            expired = (
+                item for item in self.minio.list_objects(f"{self.cache_prefix}/") if item["LastModified"] < cutoff
+            )
+            self._delete(expired, stats)
+        stats.seconds = time.monotonic() - started
+
+        logger.info(
+            "Deleted %d objects (%.1f MiB) in %.1fs (%.0f objects/s, failed=%d)",
+            stats.objects,
+            stats.bytes / 1024 / 1024,
+            stats.seconds,
+            stats.objects_per_second,
+            stats.failed,
+        )
+        return stats
+
+    def _expired_shards(self, prefix: str, parts: list[int], cutoff: datetime) -> Iterator[dict[str, Any]]:
+        for child in self.minio.list_prefixes(prefix):
+            try:
+                shard = [*parts, int(child[len(prefix) :].rstrip("/"))]
+                end = self._shard_end(shard)
+            except ValueError:
+                continue  # yyyy/mm/dd/hh 형식이 아닌 경로
+            if end <= cutoff:
+                # 구간 전체가 보존 기간을 지났으면 하위 구간을 나누지 않고 한 번에 나열
+                yield from self.minio.list_objects(child)
+            elif len(shard) < 4:
+                yield from self._expired_shards(child, shard, cutoff)
+
+    @staticmethod
+    def _shard_end(shard: list[int]) -> datetime:
+        if len(shard) == 1:
+            return datetime(shard[0] + 1, 1, 1, tzinfo=timezone.utc)
+        if len(shard) == 2:
+            year, month = shard
+            return datetime(year + month // 12, month % 12 + 1, 1, tzinfo=timezone.utc)
+        start = datetime(*shard, tzinfo=timezone.utc)
+        return start + (timedelta(days=1) if len(shard) == 3 else timedelta(hours=1))
+
+    def _delete(self, items: Iterable[dict[str, Any]], stats: SweepStats) -> None:
+        sizes: dict[str, int] = {}
+
+        def keys() -> Iterator[str]:
+            for item in items:
+                sizes[item["Key"]] = item.get("Size", 0)
+                yield item["Key"]
+
+        for deleted, failed in self.minio.delete_objects(keys()):
+            stats.objects += len(deleted)
+            stats.bytes += sum(sizes.pop(key) for key in deleted)
+            stats.failed += len(failed)
+            for key in failed:
+                sizes.pop(key)
+
+    def start(self, interval: float) -> None:
+        """Sweep every interval seconds on a background thread until stop()."""
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="retention-sweeper", daemon=True)
+        self._thread.start()
+
+    def _run(self, interval: float) -> None:
+        while not self._stopped.wait(interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error("Sweep failed: %s", e)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def main() -> None:
+    configure_logging()
+    settings = WorkerSettings()
+    sweeper = RetentionSweeper(
+        MinIOClient(),
+        audio_prefix=settings.audio_prefix,
+        audio_retention=settings.audio_retention_hours * 3600,
+        cache_prefix=settings.cache_prefix,
+        cache_retention=settings.cache_retention_hours * 3600,
+    )
+    sweeper.sweep()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+# submit()에 전달된 인자로 공정성 기준 키를 계산
+JobClassifier = Callable[..., Hashable]
+
+
+@dataclass
+class _Job:
+    submitted: float
+    future: Future
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+
+
+@dataclass
+class WaitStats:
+    """Queueing delay of the jobs one key started since the last report."""
+
+    jobs: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.jobs if self.jobs else 0.0
+
+    def add(self, wait: float) -> None:
+        self.jobs += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+class FairScheduler(Executor):
+    """Thread pool that shares its workers fairly between keys (guilds).
+
+    Each submitted job is classified into a key. Keys with waiting jobs
+    take turns round-robin, so one busy key cannot make the others wait
+    behind its backlog. Within a key jobs start in the order they were
+    submitted, which keeps a guild's requests close to the order the bot
+    plays them in and never starves a long one. The time each job waited
+    before starting is recorded per key and printed by report().
+    """
+
+    def __init__(self, max_workers: int, classify: JobClassifier, thread_name_prefix: str = "fair-scheduler"):
+        self.classify = classify
+        self._queues: dict[Hashable, deque[_Job]] = {}
+        # 대기 중인 작업이 있는 키의 순서 (앞에서 꺼내 한 작업을 실행하고, 남은 작업이 있으면 뒤로 보냄)
+        self._turns: deque[Hashable] = deque()
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._stats: dict[Hashable, WaitStats] = {}
+        self._threads = [
+            threading.Thread(target=self._work, name=f"{thread_name_prefix}_{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def queued(self) -> int:
+        with self._condition:
+            return sum(len(jobs) for jobs in self._queues.values())
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        key = self.classify(*args, **kwargs)
+        future: Future = Future()
+        job = _Job(time.monotonic(), future, fn, args, kwargs)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            jobs = self._queues.get(key)
+            if jobs is None:
+                jobs = self._queues[key] = deque()
+                self._turns.append(key)
+            jobs.append(job)
+            self._condition.notify()
+        return future
+
+    def _next_job(self) -> _Job | None:
+        with self._condition:
+            while not self._turns and not self._shutdown:
+                self._condition.wait()
+            if not self._turns:
+                return None
+            key = self._turns.popleft()
+            jobs = self._queues[key]
+            job = jobs.popleft()
+            if jobs:
+                self._turns.append(key)
+            else:
+                del self._queues[key]
+            self._stats.setdefault(key, WaitStats()).add(time.monotonic() - job.submitted)
+            return job
+
+    def _work(self) -> None:
+        while (job := self._next_job()) is not None:
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = job.fn(*job.args, **job.kwargs)
+            except BaseException as e:
+                job.future.set_exception(e)
+            else:
+                job.future.set_result(result)
+
+    def take_stats(self) -> dict[Hashable, WaitStats]:
+        """Return per-key wait statistics collected since the last call and reset them."""
+        with self._condition:
+            stats, self._stats = self._stats, {}
+        return stats
+
+    def report(self) -> None:
+        stats = self.take_stats()
+        if not stats:
+            return
+        # 대기 시간이 긴 키부터 출력
+        for key, wait in sorted(stats.items(), key=lambda item: item[1].max_wait, reverse=True):
+            logger.info(
+                "key=%s jobs=%d mean_wait=%.0fms max_wait=%.0fms",
+                key,
+                wait.jobs,
+                wait.mean_wait * 1000,
+                wait.max_wait * 1000,
+            )
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for jobs in self._queues.values():
+                    for job in jobs:
+                        job.future.cancel()
+                self._queues.clear()
+                self._turns.clear()
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
@@ -0,0 +1,66 @@
+import re
+
+# 줄바꿈은 항상 경계 (합칠 때도 유지되어 Polly에서 쉼으로 읽힘)
+LINE_BOUNDARY = re.compile(r"\s*\n+\s*")
+# 문장 경계: 문장부호 뒤, 또는 한국어 종결어미(~다/~요/~죠/~까/~네) 뒤의 공백
+# 봇이 문장부호를 제거하고 보내는 경우가 많아 종결어미도 경계로 취급 (잘못 나눠도 다시 합쳐지므로 무해)
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?…。！？])\s+|(?<=[다요죠까네])\s+")
+# 절 경계: 쉼표류 뒤, 또는 연결어미(~고/~며/~서/~지만/~는데/~니까) 뒤의 공백
+CLAUSE_BOUNDARY = re.compile(r"(?<=[,;:、，])\s*|(?<=[고며서만데까])\s+")
+WHITESPACE = re.compile(r"\s+")
+
+
+def split_text(text: str, max_chars: int, target_chars: int | None = None) -> list[str]:
+    """Split text into segments of at most max_chars, preferring sentence boundaries.
+
+    Sentences longer than max_chars are split at clause boundaries, then at
+    whitespace, and only as a last resort in the middle of a word. Adjacent
+    pieces are then packed back together up to target_chars (defaults to
+    max_chars), so short sentences do not each become a request.
+    """
+    target_chars = min(target_chars or max_chars, max_chars)
+    text = text.strip()
+    if len(text) <= target_chars:
+        return [text] if text else []
+
+    pieces: list[str] = []
+    for line in _split(text, LINE_BOUNDARY):
+        for sentence in _split(line, SENTENCE_BOUNDARY):
+            pieces.extend(_split_long(sentence, max_chars))
+        pieces[-1] += "\n"
+    return [segment.strip() for segment in _pack(pieces, target_chars)]
+
+
+def _split(text: str, boundary: re.Pattern) -> list[str]:
+    return [piece.strip() for piece in boundary.split(text) if piece and piece.strip()]
+
+
+def _split_long(sentence: str, max_chars: int) -> list[str]:
+    if len(sentence) <= max_chars:
+        return [sentence]
+
+    for boundary in (CLAUSE_BOUNDARY, WHITESPACE):
+        parts = _split(sentence, boundary)
+        if len(parts) > 1:
+            pieces: list[str] = []
+            for part in _pack(parts, max_chars):
+                pieces.extend(_split_long(part, max_chars))
+            return pieces
+
+    # 나눌 곳이 없는 긴 단어
+    return [sentence[i : i + max_chars] for i in range(0, len(sentence), max_chars)]
+
+
+def _pack(pieces: list[str], limit: int) -> list[str]:
+    packed: list[str] = []
+    current = ""
+    for piece in pieces:
+        if current and len(current.rstrip("\n")) + 1 + len(piece.rstrip("\n")) > limit:
+            packed.append(current)
+            current = piece
+        else:
+            separator = "" if not current or current.endswith("\n") else " "
+            current = f"{current}{separator}{piece}"
+    if current:
+        packed.append(current)
+    return packed
@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from telemetry import MetricsSettings
 
 
 class PollySettings(BaseSettings):
@@ -12,3 +13,77 @@ class PollySettings(BaseSettings):
     secret_access_key: str
     region_name: str = "ap-northeast-2"
     voice_id: str = "Seoyeon"
+
+    # SynthesizeSpeech 호출 제한: 초당 요청 수(계정 TPS 할당량)와 최대 동시 호출 수
+    # 동시 호출 수는 스로틀링이나 응답 지연(latency_threshold 초 초과)이 생기면 줄이고 정상이면 다시 늘림
+    max_tps: float = 80.0
+    max_concurrency: int = 16
+    latency_threshold: float = 2.0
+
+
+class WorkerSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="WORKER_",
+        env_file=".env",
+        extra="ignore",
+    )
+
+    # 합성 결과 캐시 (메모리 LRU 최대 항목 수, 0이면 캐시 비활성화)
+    cache_max_entries: int = 1024
+    cache_prefix: str = "cache"
+
+    # 캐시를 쓰지 않는 음성은 audio_prefix/yyyy/mm/dd/hh/ 아래에 저장하고 audio_retention_hours 시간 뒤 삭제
+    audio_prefix: str = "audio"
+    audio_retention_hours: float = 1.0
+    # 캐시 항목은 마지막으로 쓰인 뒤 이 시간이 지나면 삭제 (0이면 보관)
+    cache_retention_hours: float = 24 * 7
+    # 보존 기간이 지난 음성을 정리하는 주기 (초, 0이면 워커에서 정리하지 않음. python -m tts_worker.retention으로 직접 실행 가능)
+    retention_interval: float = 3600.0
+
+    # 이 크기 이하의 음성은 MinIO를 거치지 않고 완료 메시지에 직접 담아 전송 (0이면 항상 MinIO 사용)
+    inline_max_bytes: int = 64 * 1024
+
+    # 출력 형식: "opus"(봇에서 FFmpeg 없이 바로 전송) 또는 "mp3". opus는 워커에 ffmpeg가 필요하며 없으면 mp3 사용
+    output_format: str = "opus"
+    opus_bitrate: str = "64k"
+
+    # 동시에 처리할 메시지 수
+    concurrency: int = 4
+    # broker에서 미리 받아 두는 메시지 수. 이 안에서 길드끼리는 번갈아, 길드 안에서는 받은 순서대로 처리
+    # (concurrency보다 작으면 concurrency를 사용)
+    prefetch_count: int = 32
+    # 처리량/캐시 통계 출력 주기 (초)
+    stats_interval: float = 60.0
+
+    # 이 글자 수 이상의 메시지는 Polly 출력을 청크 단위로 봇에 바로 전달 (0이면 스트리밍 비활성화)
+    stream_min_chars: int = 150
+    stream_chunk_bytes: int = 4096
+    # 스트리밍할 긴 메시지는 이 글자 수 정도의 문장 단위로 나눠 병렬 합성하고 순서대로 재생
+    segment_chars: int = 200
+    segment_concurrency: int = 8
+
+    # 합성 엔진: polly, local(espeak-ng, 오프라인), fake(테스트용 무음)
+    synthesizer: str = "polly"
+    # 길드별 엔진 (예: WORKER_GUILD_SYNTHESIZERS='{"123456789012345678": "local"}')
+    guild_synthesizers: dict[int, str] = {}
+    # 이 글자 수 이하의 짧은 메시지는 local 엔진으로 합성 (0이면 비활성화)
+    local_max_chars: int = 0
+    local_voice: str = "ko"
+    # 동시에 실행할 espeak-ng 프로세스 수 (0이면 CPU 코어 수)
+    local_processes: int = 0
+    # 엔진의 최근 평균 지연(초)이나 오류율이 기준을 넘으면 fallback_cooldown 초 동안 이 엔진 사용 (빈 값이면 비활성화)
+    fallback_synthesizer: str = "local"
+    fallback_latency: float = 3.0
+    fallback_error_rate: float = 0.5
+    fallback_cooldown: float = 30.0
+
+
+class WorkerMetricsSettings(MetricsSettings):
+    model_config = SettingsConfigDict(
+        env_prefix="WORKER_METRICS_",
+        env_file=".env",
+        extra="ignore",
+    )
+
+    # 같은 호스트에서 봇과 겹치지 않도록 서비스마다 다른 기본 port
+    port: int = 9101
@@ -0,0 +1,11 @@
+from .base import Synthesizer
+from .fake import FakeSynthesizer
+from .local import LocalSynthesizer
+from .router import SynthesizerRouter
+
+__all__ = [
+    "Synthesizer",
+    "FakeSynthesizer",
+    "LocalSynthesizer",
+    "SynthesizerRouter",
+]
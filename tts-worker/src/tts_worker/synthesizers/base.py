@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+
+class Synthesizer(ABC):
+    """A text-to-speech engine the worker can route requests to.
+
+    Audio is returned as MP3 (Polly's native output), so caching, Opus
+    encoding and delivery work the same whichever engine produced it.
+    """
+
+    name: str
+    # 한 번에 합성할 수 있는 최대 글자 수 (넘는 텍스트는 워커가 문장 단위로 나눔)
+    MAX_TEXT_CHARS = 3000
+
+    @property
+    @abstractmethod
+    def voice_id(self) -> str:
+        """Default voice."""
+
+    @property
+    def cache_key(self) -> str:
+        """Distinguishes this engine's output in the synthesis cache key."""
+        return f"{self.name}:{self.voice_id}"
+
+    @abstractmethod
+    def synthesize(self, text: str, voice_id: str | None = None, rate: int = 100, pitch: int = 0) -> bytes:
+        """Synthesize text with rate (percent) and pitch (percent offset) and return MP3 audio."""
+
+    def synthesize_stream(
+        self,
+        text: str,
+        voice_id: str | None = None,
+        rate: int = 100,
+        pitch: int = 0,
+        chunk_size: int = 4096,
+    ) -> Iterator[bytes]:
+        """Yield the audio in chunks. Engines that cannot stream produce it all first."""
+        audio = self.synthesize(text, voice_id=voice_id, rate=rate, pitch=pitch)
+        for offset in range(0, len(audio), chunk_size):
+            yield audio[offset : offset + chunk_size]
@@ -0,0 +1,33 @@
+import time
+
+from .base import Synthesizer
+
+# 128kbps 44.1kHz MPEG-1 Layer III 프레임 하나 (417바이트, 약 26ms). 본문이 모두 0이면 무음으로 디코딩됨
+SILENT_FRAME = b"\xff\xfb\x90\x64" + bytes(413)
+FRAME_SECONDS = 1152 / 44100
+
+
+class FakeSynthesizer(Synthesizer):
+    """Deterministic engine for tests and benchmarks, no network or binaries needed.
+
+    Returns silent MP3 whose duration follows the text length and rate, so
+    the same request always produces the same bytes. latency simulates a
+    slow engine.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency: float = 0.0, chars_per_second: float = 6.0, voice: str = "silence"):
+        self.latency = latency
+        self.chars_per_second = chars_per_second
+        self.voice = voice
+
+    @property
+    def voice_id(self) -> str:
+        return self.voice
+
+    def synthesize(self, text: str, voice_id: str | None = None, rate: int = 100, pitch: int = 0) -> bytes:
+        if self.latency:
+            time.sleep(self.latency)
+        seconds = len(text) / self.chars_per_second * 100 / max(rate, 1)
+        return SILENT_FRAME * max(1, round(seconds / FRAME_SECONDS))
@@ -0,0 +1,96 @@
+import os
+import shutil
+import subprocess
+import threading
+
+from .base import Synthesizer
+
+
+class LocalSynthesizer(Synthesizer):
+    """Offline synthesis with espeak-ng, used when Polly is slow or unreachable.
+
+    espeak-ng renders WAV, which FFmpeg encodes to MP3 in the same pipeline.
+    Each call runs in its own pair of processes, so calls use separate CPU
+    cores; at most max_processes calls run at a time.
+    """
+
+    name = "local"
+    DEFAULT_WORDS_PER_MINUTE = 175  # espeak-ng 기본 속도
+    DEFAULT_PITCH = 50  # espeak-ng 피치 범위 0-99
+
+    def __init__(
+        self,
+        voice: str = "ko",
+        max_processes: int | None = None,
+        bitrate: str = "48k",
+        executable: str = "espeak-ng",
+        ffmpeg: str = "ffmpeg",
+    ):
+        self.voice = voice
+        self.bitrate = bitrate
+        self.executable = executable
+        self.ffmpeg = ffmpeg
+        self._slots = threading.BoundedSemaphore(max_processes or os.cpu_count() or 1)
+
+    @property
+    def available(self) -> bool:
+        return shutil.which(self.executable) is not None and shutil.which(self.ffmpeg) is not None
+
+    @property
+    def voice_id(self) -> str:
+        return self.voice
+
+    def synthesize(self, text: str, voice_id: str | None = None, rate: int = 100, pitch: int = 0) -> bytes:
+        speed = round(self.DEFAULT_WORDS_PER_MINUTE * rate / 100)
+        espeak_pitch = min(99, max(0, self.DEFAULT_PITCH + pitch))
+        with self._slots:
+            espeak = subprocess.Popen(
+                [
+                    self.executable,
+                    "--stdin",
+                    "--stdout",
+                    "-v",
+                    voice_id or self.voice,
+                    "-s",
+                    str(speed),
+                    "-p",
+                    str(espeak_pitch),
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            ffmpeg = subprocess.Popen(
+                [
+                    self.ffmpeg,
+                    "-hide_banner",
+                    "-loglevel",
+                    "error",
+                    "-f",
+                    "wav",
+                    "-i",
+                    "pipe:0",
+                    "-c:a",
+                    "libmp3lame",
+                    "-b:a",
+                    self.bitrate,
+                    "-f",
+                    "mp3",
+                    "pipe:1",
+                ],
+                stdin=espeak.stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            # espeak-ng의 출력은 ffmpeg만 읽음
+            espeak.stdout.close()
+            # 텍스트는 파이프 버퍼보다 작으므로 ffmpeg를 읽기 전에 써도 막히지 않음
+            espeak.stdin.write(text.encode())
+            espeak.stdin.close()
+            audio, stderr = ffmpeg.communicate()
+            espeak_returncode = espeak.wait()
+        if espeak_returncode != 0:
+            raise RuntimeError(f"{self.executable} exited with {espeak_returncode}")
+        if ffmpeg.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {stderr.decode(errors='replace').strip()}")
+        return audio
@@ -0,0 +1,193 @@
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+
+from .base import Synthesizer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HealthStats:
+    calls: int
+    errors: int
+    mean_latency: float
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.calls if self.calls else 0.0
+
+
+class BackendHealth:
+    """Latency and errors of an engine's most recent calls."""
+
+    def __init__(self, window: int = 20):
+        self._calls: deque[float | None] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float | None) -> None:
+        """Record a call; latency is None if it failed."""
+        with self._lock:
+            self._calls.append(latency)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls.clear()
+
+    def stats(self) -> HealthStats:
+        with self._lock:
+            latencies = [latency for latency in self._calls if latency is not None]
+            calls = len(self._calls)
+        mean_latency = sum(latencies) / len(latencies) if latencies else 0.0
+        return HealthStats(calls, calls - len(latencies), mean_latency)
+
+
+class _TrackedSynthesizer(Synthesizer):
+    """Forwards to an engine and records each call's latency (time to first audio) or failure."""
+
+    def __init__(self, synthesizer: Synthesizer, health: BackendHealth):
+        self.synthesizer = synthesizer
+        self.health = health
+        self.name = synthesizer.name
+        self.MAX_TEXT_CHARS = synthesizer.MAX_TEXT_CHARS
+
+    @property
+    def voice_id(self) -> str:
+        return self.synthesizer.voice_id
+
+    @property
+    def cache_key(self) -> str:
+        return self.synthesizer.cache_key
+
+    def synthesize(self, text: str, voice_id: str | None = None, rate: int = 100, pitch: int = 0) -> bytes:
+        started = time.monotonic()
+        try:
+            audio = self.synthesizer.synthesize(text, voice_id=voice_id, rate=rate, pitch=pitch)
+        except Exception:
+            self.health.record(None)
+            raise
+        self.health.record(time.monotonic() - started)
+        return audio
+
+    def synthesize_stream(
+        self,
+        text: str,
+        voice_id: str | None = None,
+        rate: int = 100,
+        pitch: int = 0,
+        chunk_size: int = 4096,
+    ) -> Iterator[bytes]:
+        started = time.monotonic()
+        recorded = False
+        try:
+            for chunk in self.synthesizer.synthesize_stream(
+                text, voice_id=voice_id, rate=rate, pitch=pitch, chunk_size=chunk_size
+            ):
+                if not recorded:
+                    self.health.record(time.monotonic() - started)
+                    recorded = True
+                yield chunk
+        except Exception:
+            if not recorded:
+                self.health.record(None)
+            raise
+
+
+class SynthesizerRouter:
+    """Picks the engine for each request.
+
+    A guild uses its entry in guild_routes, or the default engine. Texts of
+    at most short_text_chars go to short_text_engine (a local engine answers
+    short messages faster than a network round trip). When the chosen
+    engine's recent mean latency or error rate goes over the threshold, its
+    requests go to the fallback engine for fallback_cooldown seconds, after
+    which the engine is tried again with a clean record.
+    """
+
+    MIN_CALLS = 5  # 이보다 적은 호출로는 상태를 판단하지 않음
+
+    def __init__(
+        self,
+        synthesizers: Mapping[str, Synthesizer],
+        default: str,
+        guild_routes: Mapping[int, str] | None = None,
+        short_text_engine: str | None = None,
+        short_text_chars: int = 0,
+        fallback: str | None = None,
+        fallback_latency: float = 3.0,
+        fallback_error_rate: float = 0.5,
+        fallback_cooldown: float = 30.0,
+        window: int = 20,
+    ):
+        self.default = default
+        self.guild_routes = dict(guild_routes or {})
+        self.short_text_engine = short_text_engine
+        self.short_text_chars = short_text_chars
+        self.fallback = fallback
+        self.fallback_latency = fallback_latency
+        self.fallback_error_rate = fallback_error_rate
+        self.fallback_cooldown = fallback_cooldown
+        for name in (default, *self.guild_routes.values(), short_text_engine, fallback):
+            if name is not None and name not in synthesizers:
+                raise ValueError(f"Unknown synthesizer {name!r}, expected one of {list(synthesizers)}")
+        self.health = {name: BackendHealth(window) for name in synthesizers}
+        self._synthesizers = {
+            name: _TrackedSynthesizer(synthesizer, self.health[name]) for name, synthesizer in synthesizers.items()
+        }
+        self._fallback_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def select(self, guild_id: int | str | None, text: str) -> Synthesizer:
+        name = self.guild_routes.get(int(guild_id), self.default) if guild_id is not None else self.default
+        if self.short_text_engine and len(text) <= self.short_text_chars:
+            name = self.short_text_engine
+        if self.fallback and name != self.fallback and self._degraded(name):
+            name = self.fallback
+        return self._synthesizers[name]
+
+    def _degraded(self, name: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            until = self._fallback_until.get(name)
+            if until is not None:
+                if now < until:
+                    return True
+                # 대기 시간이 지나면 이전 기록 없이 다시 시도
+                del self._fallback_until[name]
+                self.health[name].reset()
+                logger.info("Trying %s again", name)
+                return False
+
+            stats = self.health[name].stats()
+            if stats.calls < self.MIN_CALLS:
+                return False
+            if stats.mean_latency <= self.fallback_latency and stats.error_rate <= self.fallback_error_rate:
+                return False
+            self._fallback_until[name] = now + self.fallback_cooldown
+        logger.warning(
+            "%s degraded (mean_latency=%.2fs, error_rate=%.0f%%), using %s for %.0fs",
+            name,
+            stats.mean_latency,
+            stats.error_rate * 100,
+            self.fallback,
+            self.fallback_cooldown,
+        )
+        return True
+
+    def report(self) -> None:
+        for name, health in self.health.items():
+            stats = health.stats()
+            if not stats.calls:
+                continue
+            state = "fallback" if name in self._fallback_until else "ok"
+            logger.info(
+                "%s state=%s calls=%d error_rate=%.0f%% mean_latency=%.0fms",
+                name,
+                state,
+                stats.calls,
+                stats.error_rate * 100,
+                stats.mean_latency * 1000,
+            )
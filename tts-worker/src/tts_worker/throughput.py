@@ -0,0 +1,62 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ThroughputMeter:
+    """Thread-safe message counter that reports messages/sec periodically."""
+
+    def __init__(self, report_interval: float = 60.0):
+        self.report_interval = report_interval
+        self.processed = 0
+        self.failed = 0
+        self.expired = 0
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._window_started = time.monotonic()
+        self._window_count = 0
+
+    def started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self, ok: bool = True, expired: bool = False) -> bool:
+        """Record a finished message. Returns True if a report was printed."""
+        with self._lock:
+            self.in_flight -= 1
+            if expired:
+                self.expired += 1
+            elif ok:
+                self.processed += 1
+                self._window_count += 1
+            else:
+                self.failed += 1
+        return self.maybe_report()
+
+    def rate(self) -> float:
+        """Messages/sec since the last report."""
+        with self._lock:
+            elapsed = time.monotonic() - self._window_started
+            return self._window_count / elapsed if elapsed > 0 else 0.0
+
+    def maybe_report(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._window_started
+            if elapsed < self.report_interval:
+                return False
+            rate = self._window_count / elapsed
+            processed, failed, expired, in_flight = self.processed, self.failed, self.expired, self.in_flight
+            self._window_started = now
+            self._window_count = 0
+        logger.info(
+            "%.2f msg/s (processed=%d, failed=%d, expired=%d, in_flight=%d)",
+            rate,
+            processed,
+            failed,
+            expired,
+            in_flight,
+        )
+        return True
@@ -1,13 +1,30 @@
+import json
+import logging
 import time
 import uuid
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Any
 
-from minio import MinIOClient, MinIOSettings
-from rabbitmq import RabbitMQConnection, RabbitMQConsumer, RabbitMQPublisher, RabbitMQSettings
 import pika.exceptions
+from minio import MinIOClient, MinIOSettings
+from pika.spec import BasicProperties
+from rabbitmq import ConfirmPublisher, RabbitMQConnection, RabbitMQConsumer, RabbitMQSettings, Topology
+from telemetry import MetricsServer, MetricsSettings, elapsed, log_context, mark, registry
 
+from .cache import SynthesisCache
+from .metrics import MESSAGES, STAGE_SECONDS
+from .mp3 import join_mp3, strip_mp3_headers
+from .opus import OpusEncoder
 from .polly import PollyClient
-from .settings import PollySettings
+from .retention import RetentionSweeper, shard_object_name
+from .scheduler import FairScheduler
+from .segmenter import split_text
+from .settings import PollySettings, WorkerMetricsSettings, WorkerSettings
+from .synthesizers import FakeSynthesizer, LocalSynthesizer, Synthesizer, SynthesizerRouter
+from .throughput import ThroughputMeter
+
+logger = logging.getLogger(__name__)
 
 
 class TTSWorker:
@@ -16,67 +33,472 @@ class TTSWorker:
     CONSUME_ROUTING_KEY = "tts.worker"
     PUBLISH_EXCHANGE = "tts"
     PUBLISH_ROUTING_KEY = "tts.bot"
+    # 출력 형식: (확장자, content type)
+    OUTPUT_FORMATS = {
+        "mp3": ("mp3", "audio/mpeg"),
+        # 봇이 디코딩/재인코딩 없이 그대로 Discord로 보낼 수 있는 48kHz 20ms 프레임 Opus
+        "opus": ("ogg", "audio/ogg"),
+    }
+    PUBLISH_CONFIRM_TIMEOUT = 30  # seconds
 
     def __init__(
         self,
         polly_settings: PollySettings | None = None,
         minio_settings: MinIOSettings | None = None,
         rabbitmq_settings: RabbitMQSettings | None = None,
+        worker_settings: WorkerSettings | None = None,
+        polly: PollyClient | None = None,
+        minio: MinIOClient | None = None,
+        publisher: ConfirmPublisher | None = None,
+        synthesizers: Mapping[str, Synthesizer] | None = None,
+        metrics_settings: MetricsSettings | None = None,
     ):
-        self.polly = PollyClient(polly_settings)
-        self.minio = MinIOClient(minio_settings)
+        self.settings = worker_settings or WorkerSettings()
+        self.synthesizers = self._create_synthesizers(polly_settings, polly, synthesizers)
+        fallback = self.settings.fallback_synthesizer
+        self.router = SynthesizerRouter(
+            self.synthesizers,
+            default=self.settings.synthesizer,
+            guild_routes=self.settings.guild_synthesizers,
+            short_text_engine="local" if self.settings.local_max_chars else None,
+            short_text_chars=self.settings.local_max_chars,
+            fallback=fallback if fallback in self.synthesizers else None,
+            fallback_latency=self.settings.fallback_latency,
+            fallback_error_rate=self.settings.fallback_error_rate,
+            fallback_cooldown=self.settings.fallback_cooldown,
+        )
+        self.minio = minio or MinIOClient(minio_settings)
+        self.cache = SynthesisCache(
+            self.minio,
+            max_entries=self.settings.cache_max_entries,
+            prefix=self.settings.cache_prefix,
+            max_age=self.settings.cache_retention_hours * 3600,
+        )
+        self.retention = RetentionSweeper(
+            self.minio,
+            audio_prefix=self.settings.audio_prefix,
+            audio_retention=self.settings.audio_retention_hours * 3600,
+            cache_prefix=self.settings.cache_prefix,
+            cache_retention=self.settings.cache_retention_hours * 3600,
+        )
+        self.opus = OpusEncoder(bitrate=self.settings.opus_bitrate)
+        self.output_format = self._resolve_output_format(self.settings.output_format)
+        self.extension, self.content_type = self.OUTPUT_FORMATS[self.output_format]
+        self.throughput = ThroughputMeter(self.settings.stats_interval)
+        # Polly 호출과 업로드는 pika 스레드가 아닌 이 풀에서 실행 (heartbeat가 막히지 않음)
+        # 한 길드가 큐를 채워도 다른 길드가 뒤에서 기다리지 않도록 길드별로 번갈아 실행
+        self.executor = FairScheduler(
+            self.settings.concurrency, classify=self._classify_delivery, thread_name_prefix="tts-worker"
+        )
+        # 긴 메시지를 나눈 문장 단위 합성용 (메시지 처리 스레드가 기다리므로 별도 풀)
+        self.segment_executor = ThreadPoolExecutor(
+            max_workers=self.settings.segment_concurrency, thread_name_prefix="tts-segment"
+        )
 
-        self.rabbitmq_conn = RabbitMQConnection(rabbitmq_settings)
+        # consumer와 publisher가 선언한 exchange/queue/binding은 연결마다 한 번만 선언되고 재연결 시 다시 적용됨
+        self.topology = Topology()
+        self.rabbitmq_conn = RabbitMQConnection(rabbitmq_settings, self.topology)
         self.consumer = RabbitMQConsumer(self.rabbitmq_conn)
-        self.publisher = RabbitMQPublisher(self.rabbitmq_conn)
+        # 완료 메시지는 publisher confirm으로 발행 (자체 스레드/연결에서 재연결 및 재발행 처리)
+        self.publisher = publisher or ConfirmPublisher(rabbitmq_settings, topology=self.topology)
 
-    def _handle_message(self, message: dict[str, Any]) -> None:
+        self.metrics_settings = metrics_settings or WorkerMetricsSettings()
+        self.metrics_server = MetricsServer(host=self.metrics_settings.host, port=self.metrics_settings.port)
+        self._register_gauges()
+
+    def _register_gauges(self) -> None:
+        registry.gauge(
+            "tts_worker_queued_jobs",
+            "Requests received and waiting for a worker thread",
+            function=lambda: self.executor.queued,
+        )
+        registry.gauge("tts_worker_in_flight", "Requests being handled", function=lambda: self.throughput.in_flight)
+        polly = self.synthesizers.get("polly")
+        if isinstance(polly, PollyClient):
+            registry.gauge(
+                "tts_worker_polly_limit", "Polly calls allowed in flight", function=lambda: polly.limiter.limit
+            )
+            registry.gauge(
+                "tts_worker_polly_in_flight", "Polly calls in flight", function=lambda: polly.limiter.stats().in_flight
+            )
+
+    @staticmethod
+    def _classify_delivery(properties: BasicProperties, body: bytes) -> Any:
+        """Scheduling key (guild) of a delivery, before it is handled."""
+        try:
+            return json.loads(body).get("guild_id")
+        except (ValueError, AttributeError):
+            return None
+
+    def _handle_message(self, message: dict[str, Any], properties: BasicProperties | None = None) -> None:
+        headers = (properties.headers or {}) if properties is not None else {}
+        # 봇이 헤더에 담아 보낸 재생 기한 (epoch 밀리초, pika 헤더는 float을 지원하지 않음). 완료 메시지에도 그대로 전달
+        deadline_ms = headers.get("deadline")
+        deadline = None
+        if deadline_ms is not None:
+            message["deadline"] = deadline_ms
+            deadline = deadline_ms / 1000
+        # 봇이 보낸 단계별 시각에 워커가 꺼낸 시각을 더해 완료 메시지로 돌려줌
+        message["timeline"] = mark(dict(headers.get("timeline") or {}), "dequeued")
+        dequeue = elapsed(message["timeline"], "published", "dequeued")
+        if dequeue is not None:
+            STAGE_SECONDS.observe(dequeue, stage="dequeue")
+        # 봇이 붙인 trace id는 이 요청의 로그에 남기고 완료 메시지로 돌려줌
+        message["trace_id"] = headers.get("trace_id")
+
+        self.throughput.started()
+        started = time.perf_counter()
+        ok = expired = False
+        try:
+            with log_context(guild_id=message.get("guild_id"), trace_id=message["trace_id"]):
+                if deadline is not None and time.time() > deadline:
+                    # 장애나 도배로 밀린 오래된 요청은 합성하지 않고, 봇이 순서를 기다리지 않도록 건너뜀만 알림
+                    logger.info("Skipping request expired %.1fs ago", time.time() - deadline)
+                    self._publish_skipped(message)
+                    expired = True
+                else:
+                    self._process_message(message)
+            ok = True
+        finally:
+            STAGE_SECONDS.observe(time.perf_counter() - started, stage="process")
+            MESSAGES.inc(result="expired" if expired else "ok" if ok else "failed")
+            if self.throughput.finished(ok, expired):
+                self.print_stats()
+
+    def _process_message(self, message: dict[str, Any]) -> None:
         text = message.get("text", "")
-        guild_id = message.get("guild_id")
         rate = message.get("rate", 100)  # Default: 100%
         pitch = message.get("pitch", 0)  # Default: 0 (normal)
 
         if not text:
             return
 
-        audio_data = self.polly.synthesize(text, rate=rate, pitch=pitch)
+        synthesizer = self.router.select(message.get("guild_id"), text)
+        if not self.cache.enabled:
+            if self._should_stream(text):
+                self._stream_synthesis(message, synthesizer, text, rate, pitch)
+                return
+            audio_data = self._synthesize(synthesizer, text, rate, pitch)
+            if self._is_inline(audio_data):
+                self._publish_inline(message, audio_data)
+                return
+            object_name = shard_object_name(self.settings.audio_prefix, self.extension)
+            self._upload(object_name, audio_data)
+            self._publish_object(message, object_name, delete_after_play=True)
+            return
+
+        object_name = self.cache.object_name(text, rate, pitch, synthesizer.cache_key, self.extension)
+
+        if self.cache.lookup(object_name, text):
+            cached_audio = self.cache.get_audio(object_name)
+            if cached_audio is not None:
+                self._publish_inline(message, cached_audio)
+            else:
+                self._publish_object(message, object_name)
+            return
+
+        started = time.monotonic()
+        if self._should_stream(text):
+            # 긴 메시지는 합성되는 대로 봇에 전달하고, 전체 음성은 끝난 뒤 캐시에 업로드
+            audio_data = self._stream_synthesis(message, synthesizer, text, rate, pitch)
+            synth_seconds = time.monotonic() - started
+            self._upload(object_name, audio_data)
+            self.cache.store(object_name, synth_seconds=synth_seconds)
+            return
+
+        audio_data = self._synthesize(synthesizer, text, rate, pitch)
+        synth_seconds = time.monotonic() - started
+
+        if not self._is_inline(audio_data):
+            self._upload(object_name, audio_data)
+            self.cache.store(object_name, synth_seconds=synth_seconds)
+            self._publish_object(message, object_name)
+            return
+
+        # 작은 음성은 먼저 봇에 전달하고, 다른 워커와 공유할 캐시 업로드는 그 다음에
+        self._publish_inline(message, audio_data)
+        try:
+            self._upload(object_name, audio_data)
+        except Exception as e:
+            logger.warning("Failed to upload %s to the cache: %s", object_name, e)
+            return
+        self.cache.store(object_name, synth_seconds=synth_seconds, audio_data=audio_data)
+
+    def _create_synthesizers(
+        self,
+        polly_settings: PollySettings | None,
+        polly: PollyClient | None,
+        synthesizers: Mapping[str, Synthesizer] | None,
+    ) -> dict[str, Synthesizer]:
+        """Create the engines the settings refer to.
+
+        Polly is only created if it is used, so other engines run without AWS credentials.
+        """
+        created = dict(synthesizers or {})
+        if polly is not None:
+            created.setdefault("polly", polly)
+        names = {self.settings.synthesizer, *self.settings.guild_synthesizers.values()}
+        if self.settings.local_max_chars:
+            names.add("local")
+        for name in names - created.keys():
+            created[name] = self._create_synthesizer(name, polly_settings)
+
+        fallback = self.settings.fallback_synthesizer
+        if fallback and fallback not in created:
+            synthesizer = self._create_synthesizer(fallback, polly_settings)
+            if isinstance(synthesizer, LocalSynthesizer) and not synthesizer.available:
+                logger.warning("%s or %s not found, fallback disabled", synthesizer.executable, synthesizer.ffmpeg)
+            else:
+                created[fallback] = synthesizer
+        return created
+
+    def _create_synthesizer(self, name: str, polly_settings: PollySettings | None) -> Synthesizer:
+        if name == "polly":
+            return PollyClient(polly_settings)
+        if name == "local":
+            return LocalSynthesizer(
+                voice=self.settings.local_voice, max_processes=self.settings.local_processes or None
+            )
+        if name == "fake":
+            return FakeSynthesizer()
+        raise ValueError(f"Unknown synthesizer {name!r}, expected one of ['polly', 'local', 'fake']")
+
+    def _resolve_output_format(self, output_format: str) -> str:
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format {output_format!r}, expected one of {list(self.OUTPUT_FORMATS)}")
+        if output_format == "opus" and not self.opus.available:
+            logger.warning("%s not found, falling back to mp3 output", self.opus.executable)
+            return "mp3"
+        return output_format
 
-        object_name = f"{uuid.uuid4()}.mp3"
-        self.minio.upload_bytes(object_name, audio_data, content_type="audio/mpeg")
+    def _upload(self, object_name: str, audio_data: bytes) -> None:
+        with STAGE_SECONDS.time(stage="upload"):
+            self.minio.upload_bytes(object_name, audio_data, content_type=self.content_type)
 
-        self.publisher.publish(
+    def _synthesize(self, synthesizer: Synthesizer, text: str, rate: int, pitch: int) -> bytes:
+        with STAGE_SECONDS.time(stage="synthesis"):
+            return self._synthesize_text(synthesizer, text, rate, pitch)
+
+    def _synthesize_text(self, synthesizer: Synthesizer, text: str, rate: int, pitch: int) -> bytes:
+        segments = split_text(text, synthesizer.MAX_TEXT_CHARS)
+        if len(segments) <= 1:
+            return self._encode(synthesizer.synthesize(text, rate=rate, pitch=pitch))
+
+        # 요청 한도를 넘는 긴 텍스트는 나눠서 병렬로 합성한 뒤 MP3 프레임 단위로 이어 붙이고 한 번만 인코딩
+        # (세그먼트마다 인코딩해 이어 붙이면 Ogg/MP3 파일이 여러 개 이어진 형태가 됨)
+        futures = self._submit_segments(synthesizer, segments, rate, pitch)
+        return self._encode(join_mp3(future.result() for future in futures))
+
+    def _submit_segments(self, synthesizer: Synthesizer, segments: list[str], rate: int, pitch: int) -> list[Future]:
+        return [
+            self.segment_executor.submit(synthesizer.synthesize, segment, rate=rate, pitch=pitch)
+            for segment in segments
+        ]
+
+    def _encode(self, mp3_data: bytes) -> bytes:
+        if self.output_format == "opus":
+            return self.opus.encode(mp3_data)
+        return mp3_data
+
+    def _should_stream(self, text: str) -> bool:
+        return 0 < self.settings.stream_min_chars <= len(text)
+
+    def _stream_synthesis(
+        self, message: dict[str, Any], synthesizer: Synthesizer, text: str, rate: int, pitch: int
+    ) -> bytes:
+        """Relay audio to the bot chunk by chunk as it is synthesized and return the full audio.
+
+        A stream-start completion message goes out first (it takes the
+        message's place in the bot's playback order), followed by numbered
+        raw chunks and an end marker carrying the chunk count. Chunks are
+        not waited on one by one; only the end marker is confirmed.
+        """
+        stream_id = uuid.uuid4().hex
+        self.publisher.publish_nowait(
+            exchange_name=self.PUBLISH_EXCHANGE,
+            routing_key=self.PUBLISH_ROUTING_KEY,
+            message={"stream_id": stream_id, "content_type": self.content_type, **self._completion_fields(message)},
+        )
+
+        chunks: dict[int, bytes] = {}
+        confirms = []
+        try:
+            for index, chunk in self._synthesize_chunks(synthesizer, text, rate, pitch):
+                confirms.append(self._publish_chunk(stream_id, {"chunk": index}, chunk))
+                chunks[index] = chunk
+        finally:
+            # 합성이 중간에 실패해도 봇이 재생을 끝낼 수 있도록 종료 표시는 항상 보냄 (앞에서부터 연속된 청크까지만 재생)
+            complete = 0
+            while complete in chunks:
+                complete += 1
+            confirms.append(self._publish_chunk(stream_id, {"end": True, "chunks": complete}, b""))
+            for confirm in confirms:
+                self._wait_confirmed(confirm)
+        return b"".join(chunks[index] for index in range(len(chunks)))
+
+    def _synthesize_chunks(
+        self, synthesizer: Synthesizer, text: str, rate: int, pitch: int
+    ) -> Iterator[tuple[int, bytes]]:
+        """Yield (index, audio) chunks in completion order.
+
+        Text with several sentences is split into segments that are
+        synthesized in parallel, so the first sentence can play while the
+        rest are still being synthesized. MP3 segments become one chunk each
+        as soon as they are ready (headers stripped so the chunks join into
+        one stream); for Opus they are fed in order through a single encoder
+        so the bot receives one Ogg stream. A single segment is streamed from
+        the engine directly.
+        """
+        segments = split_text(text, synthesizer.MAX_TEXT_CHARS, self.settings.segment_chars)
+        if len(segments) <= 1:
+            chunk_size = self.settings.stream_chunk_bytes
+            stream = synthesizer.synthesize_stream(text, rate=rate, pitch=pitch, chunk_size=chunk_size)
+            if self.output_format == "opus":
+                stream = self.opus.encode_stream(stream, chunk_size)
+            yield from enumerate(stream)
+            return
+
+        futures = self._submit_segments(synthesizer, segments, rate, pitch)
+        try:
+            if self.output_format == "opus":
+                mp3_segments = (strip_mp3_headers(future.result()) for future in futures)
+                yield from enumerate(self.opus.encode_stream(mp3_segments, self.settings.stream_chunk_bytes))
+                return
+            indexes = {future: index for index, future in enumerate(futures)}
+            for future in as_completed(futures):
+                yield indexes[future], strip_mp3_headers(future.result())
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _publish_chunk(self, stream_id: str, headers: dict[str, Any], data: bytes) -> Future:
+        return self.publisher.publish_nowait(
             exchange_name=self.PUBLISH_EXCHANGE,
             routing_key=self.PUBLISH_ROUTING_KEY,
-            message={
-                "object_name": object_name,
-                "guild_id": guild_id,
-            },
+            message=data,
+            headers={"stream_id": stream_id, **headers},
+            content_type=self.content_type,
+            # 재생이 끝나면 의미 없는 데이터이므로 디스크에 쓰지 않음
+            persistent=False,
+        )
+
+    def _is_inline(self, audio_data: bytes) -> bool:
+        return len(audio_data) <= self.settings.inline_max_bytes
+
+    @staticmethod
+    def _completion_fields(message: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "guild_id": message.get("guild_id"),
+            # 봇이 재생 순서를 맞출 수 있도록 요청 순번을 그대로 전달
+            "seq": message.get("seq"),
+            "seq_epoch": message.get("seq_epoch"),
+            "deadline": message.get("deadline"),
+            "trace_id": message.get("trace_id"),
+            # 봇이 완료 메시지 전달 시간과 재생 시작까지의 시간을 계산하도록 발행 시각을 더함
+            "timeline": mark(dict(message.get("timeline") or {}), "completed"),
+        }
+
+    def _wait_confirmed(self, confirm: Future) -> None:
+        """Wait until the broker confirms a completion message.
+
+        The publisher republishes unconfirmed messages after a reconnect, so
+        a slow confirm does not mean the message was lost. Failing the request
+        here would requeue it and the bot would receive the completion twice;
+        only a nack or a closed publisher raises.
+        """
+        try:
+            confirm.result(self.PUBLISH_CONFIRM_TIMEOUT)
+        except TimeoutError:
+            logger.warning("Completion not confirmed after %ds, still waiting", self.PUBLISH_CONFIRM_TIMEOUT)
+            confirm.result()
+
+    def _publish_completion(self, message: dict[str, Any] | bytes, **kwargs: Any) -> None:
+        with STAGE_SECONDS.time(stage="completion_publish"):
+            confirm = self.publisher.publish_nowait(
+                exchange_name=self.PUBLISH_EXCHANGE,
+                routing_key=self.PUBLISH_ROUTING_KEY,
+                message=message,
+                **kwargs,
+            )
+            self._wait_confirmed(confirm)
+
+    def _publish_skipped(self, message: dict[str, Any]) -> None:
+        self._publish_completion({"skipped": True, **self._completion_fields(message)})
+
+    def _publish_object(self, message: dict[str, Any], object_name: str, delete_after_play: bool = False) -> None:
+        """Announce audio uploaded to MinIO; with delete_after_play the bot deletes the one-shot object when done."""
+        fields = {"object_name": object_name, "content_type": self.content_type, **self._completion_fields(message)}
+        if delete_after_play:
+            fields["delete_after_play"] = True
+        self._publish_completion(fields)
+
+    def _publish_inline(self, message: dict[str, Any], audio_data: bytes) -> None:
+        """Send the audio itself as the message body, with the completion fields as headers."""
+        self._publish_completion(audio_data, headers=self._completion_fields(message), content_type=self.content_type)
+
+    def print_stats(self) -> None:
+        self.print_cache_stats()
+        self.print_polly_stats()
+        self.router.report()
+        self.executor.report()
+
+    def print_polly_stats(self) -> None:
+        polly = self.synthesizers.get("polly")
+        if not isinstance(polly, PollyClient):
+            return
+        stats = polly.limiter.stats()
+        logger.info(
+            "Polly limit=%d in_flight=%d throttled=%d slow=%d decreases=%d",
+            stats.limit,
+            stats.in_flight,
+            stats.throttled,
+            stats.slow,
+            stats.decreases,
+        )
+
+    def print_cache_stats(self) -> None:
+        stats = self.cache.stats
+        logger.info(
+            "Cache hits=%d (memory=%d, storage=%d) misses=%d hit_ratio=%.1f%% saved_chars=%d saved_polly_time=%.1fs",
+            stats.hits,
+            stats.memory_hits,
+            stats.storage_hits,
+            stats.misses,
+            stats.hit_ratio * 100,
+            stats.saved_characters,
+            stats.saved_seconds,
         )
 
     def run(self) -> None:
         """Run worker with automatic reconnection on connection loss."""
         retry_delay = 5  # seconds
+        if self.settings.retention_interval > 0:
+            self.retention.start(self.settings.retention_interval)
+        if self.metrics_settings.port:
+            self.metrics_server.start()
 
         while True:
             try:
-                print("[INFO] Starting TTS worker...")
+                logger.info("Starting TTS worker...")
                 self.consumer.consume(
                     queue_name=self.CONSUME_QUEUE,
                     handler=self._handle_message,
                     exchange_name=self.CONSUME_EXCHANGE,
                     routing_key=self.CONSUME_ROUTING_KEY,
+                    prefetch_count=max(self.settings.prefetch_count, self.settings.concurrency),
+                    executor=self.executor,
+                    with_properties=True,
                 )
-                print("[INFO] Worker connected. Waiting for messages...")
+                logger.info("Worker connected (concurrency=%d). Waiting for messages...", self.settings.concurrency)
                 self.consumer.start_consuming()
             except (pika.exceptions.StreamLostError, pika.exceptions.AMQPConnectionError,
                     pika.exceptions.ConnectionClosedByBroker, ConnectionResetError) as e:
-                print(f"[ERROR] Connection lost: {e}")
-                print(f"[INFO] Reconnecting in {retry_delay} seconds...")
+                logger.error("Connection lost: %s", e)
+                logger.info("Reconnecting in %d seconds...", retry_delay)
 
                 # Clean up old connection
                 try:
                     self.consumer.close()
-                    self.publisher.close()
                     self.rabbitmq_conn.close()
                 except Exception:
                     pass
@@ -84,21 +506,22 @@ class TTSWorker:
                 # Wait before reconnecting
                 time.sleep(retry_delay)
 
-                # Create new connection
-                self.rabbitmq_conn = RabbitMQConnection()
+                # Reconnect on next consume, re-declaring the topology (publisher reconnects on its own)
                 self.consumer = RabbitMQConsumer(self.rabbitmq_conn)
-                self.publisher = RabbitMQPublisher(self.rabbitmq_conn)
             except KeyboardInterrupt:
-                print("[INFO] Shutting down worker...")
+                logger.info("Shutting down worker...")
                 break
-            except Exception as e:
-                print(f"[ERROR] Unexpected error: {e}")
-                import traceback
-                traceback.print_exc()
-                print(f"[INFO] Retrying in {retry_delay} seconds...")
+            except Exception:
+                logger.exception("Unexpected error")
+                logger.info("Retrying in %d seconds...", retry_delay)
                 time.sleep(retry_delay)
 
     def stop(self) -> None:
+        self.print_stats()
+        self.retention.stop()
+        self.metrics_server.stop()
         self.consumer.close()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.segment_executor.shutdown(wait=True, cancel_futures=True)
         self.publisher.close()
         self.rabbitmq_conn.close()
@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta, timezone
+
+from tts_worker import cache as cache_module
+from tts_worker.cache import SynthesisCache
+
+
+class FakeMinIO:
+    def __init__(self):
+        self.objects: dict[str, datetime] = {}
+        self.heads = 0
+        self.touched: list[str] = []
+        self.fail_touch = False
+
+    def head_object(self, object_name: str) -> dict | None:
+        self.heads += 1
+        modified = self.objects.get(object_name)
+        if modified is None:
+            return None
+        return {"LastModified": modified, "ContentType": "audio/ogg"}
+
+    def touch_object(self, object_name: str, content_type: str) -> None:
+        if self.fail_touch:
+            raise ConnectionError("unreachable")
+        self.touched.append(object_name)
+        self.objects[object_name] = datetime.now(timezone.utc)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_object_name_ignores_whitespace_but_not_parameters():
+    cache = SynthesisCache(FakeMinIO())
+
+    name = cache.object_name("안녕  하세요\n", 100, 0, "Seoyeon", "ogg")
+
+    assert name == cache.object_name(" 안녕 하세요", 100, 0, "Seoyeon", "ogg")
+    assert name.startswith("cache/") and name.endswith(".ogg")
+    assert name != cache.object_name("안녕\n하세요", 100, 0, "Seoyeon", "ogg")
+    assert name != cache.object_name("안녕 하세요", 110, 0, "Seoyeon", "ogg")
+    assert name != cache.object_name("안녕 하세요", 100, 0, "local", "ogg")
+    assert name != cache.object_name("안녕 하세요", 100, 0, "Seoyeon", "mp3")
+
+
+def test_consecutive_line_breaks_are_one_pause():
+    cache = SynthesisCache(FakeMinIO())
+
+    assert cache.normalize(" 안녕\t하세요 \r\n\n  반가워요  ") == "안녕 하세요\n반가워요"
+
+
+def test_miss_then_memory_hit_without_storage_request():
+    minio = FakeMinIO()
+    cache = SynthesisCache(minio)
+
+    assert not cache.lookup("cache/a.ogg", "hello")
+    cache.store("cache/a.ogg", synth_seconds=0.5, audio_data=b"audio")
+    heads = minio.heads
+
+    assert cache.lookup("cache/a.ogg", "hello")
+    assert cache.get_audio("cache/a.ogg") == b"audio"
+    assert minio.heads == heads
+    assert (cache.stats.memory_hits, cache.stats.storage_hits, cache.stats.misses) == (1, 0, 1)
+    assert cache.stats.saved_characters == 5
+    assert cache.stats.saved_seconds == 0.5
+
+
+def test_storage_hit_for_audio_another_worker_uploaded():
+    minio = FakeMinIO()
+    minio.objects["cache/a.ogg"] = datetime.now(timezone.utc)
+    cache = SynthesisCache(minio)
+
+    assert cache.lookup("cache/a.ogg")
+    assert cache.stats.storage_hits == 1
+    # 한 번 확인한 이름은 메모리에서 바로 찾음
+    assert cache.lookup("cache/a.ogg")
+    assert cache.stats.memory_hits == 1
+    assert cache.get_audio("cache/a.ogg") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    minio = FakeMinIO()
+    cache = SynthesisCache(minio, max_entries=2)
+    cache.store("cache/a.ogg", audio_data=b"a")
+    cache.store("cache/b.ogg", audio_data=b"b")
+    assert cache.lookup("cache/a.ogg")
+
+    cache.store("cache/c.ogg", audio_data=b"c")
+
+    assert cache.get_audio("cache/a.ogg") == b"a"
+    assert cache.get_audio("cache/b.ogg") is None
+    # 밀려난 항목은 MinIO에도 없으면 미스
+    assert not cache.lookup("cache/b.ogg")
+
+
+def test_disabled_with_zero_entries():
+    assert not SynthesisCache(FakeMinIO(), max_entries=0).enabled
+
+
+def test_remembered_name_is_checked_again_and_swept_object_is_a_miss(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    minio = FakeMinIO()
+    minio.objects["cache/a.ogg"] = datetime.now(timezone.utc)
+    cache = SynthesisCache(minio, max_age=400)
+    assert cache.lookup("cache/a.ogg")
+
+    clock.now += 99
+    heads = minio.heads
+    assert cache.lookup("cache/a.ogg")
+    assert minio.heads == heads
+
+    # max_age / 4가 지나면 MinIO에서 다시 확인하고, 정리된 object는 미스로 처리
+    clock.now += 1
+    del minio.objects["cache/a.ogg"]
+    assert not cache.lookup("cache/a.ogg")
+    assert minio.heads == heads + 1
+    assert cache.stats.misses == 1
+
+
+def test_audio_held_in_memory_is_not_rechecked(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    minio = FakeMinIO()
+    cache = SynthesisCache(minio, max_age=400)
+    cache.store("cache/a.ogg", audio_data=b"audio")
+
+    clock.now += 1000
+
+    assert cache.lookup("cache/a.ogg")
+    assert minio.heads == 0
+
+
+def test_object_in_use_is_refreshed_before_it_expires():
+    minio = FakeMinIO()
+    now = datetime.now(timezone.utc)
+    minio.objects["cache/old.ogg"] = now - timedelta(seconds=300)
+    minio.objects["cache/new.ogg"] = now - timedelta(seconds=100)
+    cache = SynthesisCache(minio, max_age=400)
+
+    assert cache.lookup("cache/old.ogg")
+    assert cache.lookup("cache/new.ogg")
+
+    assert minio.touched == ["cache/old.ogg"]
+
+
+def test_failed_refresh_still_counts_as_hit():
+    minio = FakeMinIO()
+    minio.objects["cache/old.ogg"] = datetime.now(timezone.utc) - timedelta(seconds=300)
+    minio.fail_touch = True
+    cache = SynthesisCache(minio, max_age=400)
+
+    assert cache.lookup("cache/old.ogg")
+    assert cache.stats.storage_hits == 1
@@ -0,0 +1,122 @@
+import threading
+
+import pytest
+from tts_worker import limiter as limiter_module
+from tts_worker.limiter import AdaptiveLimiter, TokenBucket
+
+# 대기 시간이 이진수로 정확히 표현되는 속도만 사용 (아니면 가짜 시계에서 토큰이 미세하게 모자라 계속 대기)
+RATE = 4
+
+
+class Clock:
+    """Replaces time.monotonic and time.sleep; sleeping advances the clock instead of blocking."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(limiter_module.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(limiter_module.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_bucket_allows_a_burst_then_paces_at_rate(clock):
+    bucket = TokenBucket(rate=RATE, capacity=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == 1 / RATE
+    assert bucket.acquire() == 1 / RATE
+
+
+def test_bucket_refills_up_to_capacity(clock):
+    bucket = TokenBucket(rate=RATE, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now += 60
+
+    assert [bucket.acquire() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.acquire() > 0
+
+
+def test_drain_drops_the_stored_burst(clock):
+    bucket = TokenBucket(rate=RATE, capacity=5)
+    bucket.drain()
+
+    assert bucket.acquire() == 1 / RATE
+
+
+def test_limit_grows_by_about_one_per_limit_successes(clock):
+    limiter = AdaptiveLimiter(rate=1024, max_limit=10, initial_limit=2)
+    # 성공마다 1 / limit씩 늘어남: 2 -> 2.5 -> 2.9 -> 3.24
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(latency=0.1)
+
+    assert limiter.limit == 3
+
+
+def test_limit_never_exceeds_max_limit(clock):
+    limiter = AdaptiveLimiter(rate=1024, max_limit=2)
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(latency=0.1)
+
+    assert limiter.limit == 2
+
+
+def test_throttle_and_slow_calls_cut_the_limit_once_per_cooldown(clock):
+    limiter = AdaptiveLimiter(rate=1024, max_limit=8, latency_threshold=1.0, cooldown=5)
+    for _ in range(3):
+        limiter.acquire()
+    limiter.release(throttled=True)
+    # 같은 쿨다운 안의 호출은 한 번만 줄임
+    limiter.release(throttled=True)
+    limiter.release(latency=2.0)
+    assert limiter.limit == 4
+
+    clock.now += 5
+    limiter.acquire()
+    limiter.release(latency=2.0)
+
+    assert limiter.stats() == limiter_module.LimiterStats(limit=2, in_flight=0, throttled=2, slow=2, decreases=2)
+
+
+def test_limit_never_drops_below_min_limit(clock):
+    limiter = AdaptiveLimiter(rate=1024, max_limit=4, min_limit=2, cooldown=0)
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release(throttled=True)
+
+    assert limiter.limit == 2
+
+
+def test_failed_call_without_latency_leaves_the_limit(clock):
+    limiter = AdaptiveLimiter(rate=1024, max_limit=4, initial_limit=2)
+    limiter.acquire()
+    limiter.release()
+
+    assert limiter.limit == 2
+    assert limiter.stats().in_flight == 0
+
+
+def test_acquire_waits_for_a_free_slot():
+    limiter = AdaptiveLimiter(rate=1024, max_limit=1)
+    limiter.acquire()
+    acquired = threading.Event()
+    waiter = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    waiter.start()
+
+    assert not acquired.wait(0.05)
+    limiter.release(latency=0.1)
+    assert acquired.wait(5)
+    waiter.join()
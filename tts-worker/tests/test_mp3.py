@@ -0,0 +1,44 @@
+from tts_worker.mp3 import join_mp3, strip_mp3_headers
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz: 144 * 128000 // 44100 = 417바이트
+FRAME_LENGTH = 417
+
+
+def frame(payload: bytes = b"") -> bytes:
+    return (b"\xff\xfb\x90\x00" + b"\x00" * 32 + payload).ljust(FRAME_LENGTH, b"\x00")
+
+
+AUDIO = frame(b"one") + frame(b"two")
+
+
+def test_bare_frames_are_unchanged():
+    assert strip_mp3_headers(AUDIO) == AUDIO
+
+
+def test_id3_tags_and_vbr_frame_are_removed():
+    id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"abcde"
+    id3v1 = b"TAG" + b"\x00" * 125
+
+    assert strip_mp3_headers(id3v2 + frame(b"Info") + AUDIO + id3v1) == AUDIO
+    assert strip_mp3_headers(frame(b"Xing") + AUDIO) == AUDIO
+
+
+def test_id3v2_footer_is_removed():
+    # 플래그 0x10: 태그 뒤에 10바이트 footer가 붙음
+    id3v2 = b"ID3\x04\x00\x10\x00\x00\x00\x02" + b"ab" + b"3DI" + b"\x00" * 7
+
+    assert strip_mp3_headers(id3v2 + AUDIO) == AUDIO
+
+
+def test_vbr_tag_inside_audio_is_kept():
+    data = AUDIO + frame(b"Info")
+
+    assert strip_mp3_headers(data) == data
+
+
+def test_join_keeps_segment_order():
+    first = b"ID3\x04\x00\x00\x00\x00\x00\x00" + frame(b"Info") + frame(b"one")
+    second = frame(b"Xing") + frame(b"two")
+
+    assert join_mp3([first, second]) == AUDIO
+    assert join_mp3([]) == b""
@@ -0,0 +1,114 @@
+import pytest
+from tts_worker.synthesizers import FakeSynthesizer, SynthesizerRouter
+from tts_worker.synthesizers import router as router_module
+
+
+class Engine(FakeSynthesizer):
+    def __init__(self, name: str):
+        super().__init__()
+        self.name = name
+        self.failing = False
+
+    def synthesize(self, text: str, voice_id: str | None = None, rate: int = 100, pitch: int = 0) -> bytes:
+        if self.failing:
+            raise ConnectionError(self.name)
+        return super().synthesize(text, voice_id=voice_id, rate=rate, pitch=pitch)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(router_module.time, "monotonic", clock)
+    return clock
+
+
+def create_router(**kwargs) -> tuple[SynthesizerRouter, dict[str, Engine]]:
+    engines = {name: Engine(name) for name in ("polly", "local")}
+    return SynthesizerRouter(engines, **{"default": "polly", **kwargs}), engines
+
+
+def fail_calls(router: SynthesizerRouter, guild_id: int | None, count: int) -> None:
+    for _ in range(count):
+        with pytest.raises(ConnectionError):
+            router.select(guild_id, "안녕하세요").synthesize("안녕하세요")
+
+
+def test_guild_route_and_short_text_engine():
+    router, _ = create_router(guild_routes={1: "local"}, short_text_engine="local", short_text_chars=3)
+
+    assert router.select(None, "긴 메시지입니다").name == "polly"
+    assert router.select("1", "긴 메시지입니다").name == "local"
+    assert router.select(2, "ㅋㅋ").name == "local"
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError, match="azure"):
+        create_router(fallback="azure")
+
+
+def test_errors_below_min_calls_do_not_fall_back(clock):
+    router, engines = create_router(fallback="local")
+    engines["polly"].failing = True
+
+    fail_calls(router, None, SynthesizerRouter.MIN_CALLS - 1)
+
+    assert router.select(None, "안녕").name == "polly"
+
+
+def test_error_rate_falls_back_until_the_cooldown_ends(clock):
+    router, engines = create_router(fallback="local", fallback_cooldown=30)
+    engines["polly"].failing = True
+    fail_calls(router, None, SynthesizerRouter.MIN_CALLS)
+
+    assert router.select(None, "안녕").name == "local"
+    clock.now += 29
+    assert router.select(None, "안녕").name == "local"
+
+    # 대기 시간이 지나면 이전 실패 기록 없이 다시 시도
+    clock.now += 1
+    assert router.select(None, "안녕").name == "polly"
+    assert router.health["polly"].stats().calls == 0
+
+
+def test_slow_engine_falls_back(clock):
+    router, _ = create_router(fallback="local", fallback_latency=1.0)
+    for _ in range(SynthesizerRouter.MIN_CALLS):
+        router.health["polly"].record(2.0)
+
+    assert router.select(None, "안녕").name == "local"
+
+
+def test_no_fallback_without_a_fallback_engine(clock):
+    router, engines = create_router()
+    engines["polly"].failing = True
+    fail_calls(router, None, SynthesizerRouter.MIN_CALLS)
+
+    assert router.select(None, "안녕").name == "polly"
+
+
+def test_fallback_engine_is_used_even_when_degraded(clock):
+    router, engines = create_router(default="local", fallback="local")
+    engines["local"].failing = True
+    fail_calls(router, None, SynthesizerRouter.MIN_CALLS)
+
+    assert router.select(None, "안녕").name == "local"
+
+
+def test_stream_records_time_to_first_chunk_or_failure(clock):
+    router, engines = create_router()
+    synthesizer = router.select(None, "안녕")
+
+    assert b"".join(synthesizer.synthesize_stream("안녕", chunk_size=100))
+    engines["polly"].failing = True
+    with pytest.raises(ConnectionError):
+        list(synthesizer.synthesize_stream("안녕"))
+
+    assert router.health["polly"].stats() == router_module.HealthStats(calls=2, errors=1, mean_latency=0.0)
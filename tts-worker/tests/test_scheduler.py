@@ -0,0 +1,104 @@
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+from tts_worker.scheduler import FairScheduler
+
+
+def by_key(key: str, value: str) -> str:
+    return key
+
+
+def blocked_scheduler() -> tuple[FairScheduler, threading.Event, list[str]]:
+    """A single worker held busy until the returned event is set, so jobs submitted meanwhile queue up."""
+    scheduler = FairScheduler(1, by_key)
+    running = threading.Event()
+    release = threading.Event()
+    started: list[str] = []
+
+    def block(key: str, value: str) -> None:
+        running.set()
+        release.wait(5)
+
+    scheduler.submit(block, "block", "")
+    running.wait(5)
+    return scheduler, release, started
+
+
+def test_keys_take_turns_and_each_key_keeps_its_order():
+    scheduler, release, started = blocked_scheduler()
+    futures = [scheduler.submit(lambda key, value: started.append(value), "busy", f"busy{i}") for i in range(3)]
+    futures += [scheduler.submit(lambda key, value: started.append(value), "quiet", f"quiet{i}") for i in range(2)]
+    assert scheduler.queued == 5
+
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+    scheduler.shutdown()
+
+    # 먼저 쌓인 busy 작업 뒤에 quiet가 밀리지 않고 번갈아 실행됨
+    assert started == ["busy0", "quiet0", "busy1", "quiet1", "busy2"]
+
+
+def test_result_and_exception_are_passed_to_the_future():
+    scheduler = FairScheduler(2, by_key)
+
+    def fail(key: str, value: str) -> None:
+        raise ValueError(value)
+
+    assert scheduler.submit(lambda key, value: value.upper(), "a", "ok").result(timeout=5) == "OK"
+    with pytest.raises(ValueError, match="boom"):
+        scheduler.submit(fail, "a", "boom").result(timeout=5)
+    scheduler.shutdown()
+
+
+def test_cancelled_job_is_skipped():
+    scheduler, release, started = blocked_scheduler()
+    cancelled = scheduler.submit(lambda key, value: started.append(value), "a", "cancelled")
+    kept = scheduler.submit(lambda key, value: started.append(value), "a", "kept")
+    assert cancelled.cancel()
+
+    release.set()
+    kept.result(timeout=5)
+    scheduler.shutdown()
+
+    assert started == ["kept"]
+
+
+def test_shutdown_runs_queued_jobs_unless_cancelled():
+    scheduler, release, started = blocked_scheduler()
+    queued = scheduler.submit(lambda key, value: started.append(value), "a", "queued")
+    release.set()
+    scheduler.shutdown()
+
+    assert queued.done() and started == ["queued"]
+    with pytest.raises(RuntimeError):
+        scheduler.submit(by_key, "a", "late")
+
+
+def test_shutdown_with_cancel_futures_drops_queued_jobs():
+    scheduler, release, started = blocked_scheduler()
+    queued = scheduler.submit(lambda key, value: started.append(value), "a", "queued")
+    scheduler.shutdown(wait=False, cancel_futures=True)
+    release.set()
+    scheduler.shutdown()
+
+    with pytest.raises(CancelledError):
+        queued.result()
+    assert started == []
+    assert scheduler.queued == 0
+
+
+def test_wait_stats_are_reported_per_key_and_reset():
+    scheduler, release, _ = blocked_scheduler()
+    futures = [scheduler.submit(by_key, "a", "") for _ in range(2)] + [scheduler.submit(by_key, "b", "")]
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+    scheduler.shutdown()
+
+    stats = scheduler.take_stats()
+
+    assert {key: wait.jobs for key, wait in stats.items()} == {"block": 1, "a": 2, "b": 1}
+    assert stats["a"].max_wait >= stats["a"].mean_wait > 0
+    assert scheduler.take_stats() == {}
@@ -0,0 +1,46 @@
+from tts_worker.segmenter import split_text
+
+
+def test_empty_and_short_text():
+    assert split_text("", 10) == []
+    assert split_text("   ", 10) == []
+    assert split_text("  짧은 문장  ", 10) == ["짧은 문장"]
+
+
+def test_splits_at_sentence_boundaries():
+    text = "첫 문장입니다. 두 번째 문장입니다. 세 번째입니다."
+
+    assert split_text(text, 12) == ["첫 문장입니다.", "두 번째 문장입니다.", "세 번째입니다."]
+    # max_chars가 커도 target_chars 단위로 나눔
+    assert split_text(text, 100, 12) == split_text(text, 12)
+
+
+def test_sentence_endings_without_punctuation_are_boundaries():
+    assert split_text("밥을 먹었다 집에 갔어요 잠을 잤다", 8) == ["밥을 먹었다", "집에 갔어요", "잠을 잤다"]
+
+
+def test_long_sentence_is_split_at_clauses():
+    assert split_text("하나, 둘, 셋, 넷, 다섯, 여섯", 8) == ["하나, 둘,", "셋, 넷,", "다섯, 여섯"]
+
+
+def test_long_word_is_split_in_the_middle():
+    assert split_text("가" * 25, 10) == ["가" * 10, "가" * 10, "가" * 5]
+
+
+def test_segments_never_exceed_max_chars():
+    text = "안녕하세요 반갑습니다 " * 10
+
+    segments = split_text(text, 30)
+
+    assert all(len(segment) <= 30 for segment in segments)
+    assert " ".join(segments) == text.strip()
+
+
+def test_short_sentences_are_packed_up_to_target_chars():
+    assert split_text("가. 나. 다. 라.", 100, 5) == ["가. 나.", "다. 라."]
+
+
+def test_newlines_are_boundaries_and_kept_when_packed():
+    assert split_text("줄 하나\n줄 둘", 5) == ["줄 하나", "줄 둘"]
+    assert split_text("줄 하나\n줄 둘", 100, 6) == ["줄 하나", "줄 둘"]
+    assert split_text("가. 나.\n다. 라.", 100) == ["가. 나.\n다. 라."]